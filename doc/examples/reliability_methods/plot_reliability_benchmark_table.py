@@ -11,6 +11,8 @@ import openturns as ot
 import numpy as np
 import otbenchmark as otb
 import pandas as pd
+import os
+import tempfile
 from tqdm import tqdm
 
 # %%
@@ -244,3 +246,35 @@ result["RP33"]
 
 # %%
 result["RP35"]
+
+# %%
+# Store the results of a campaign
+# -------------------------------
+#
+# The results of a long campaign can be stored in a SQLite database with a `CampaignStore`.
+# If the campaign is interrupted, running it again only runs the cells which are not in the store.
+
+# %%
+benchmark = otb.ReliabilityMethodBenchmark(
+    benchmarkProblemList,
+    methods=["FORM", "SORM", "MonteCarlo"],
+    nearestPointAlgorithm=nearestPointAlgorithm,
+    maximumOuterSampling=maximumOuterSampling,
+    blockSize=blockSize,
+    coefficientOfVariation=coefficientOfVariation,
+)
+# %%
+# The store is created in a temporary directory, so that the results are
+# always computed by this example.
+directory = tempfile.TemporaryDirectory()
+storeFileName = os.path.join(directory.name, "reliability_benchmark_table.sqlite")
+with otb.CampaignStore(storeFileName) as store:
+    records = benchmark.run(store)
+
+# %%
+# Running the campaign again reads the results from the store.
+with otb.CampaignStore(storeFileName) as store:
+    records = benchmark.run(store)
+directory.cleanup()
+df = pd.DataFrame(records)
+df[["problem", "method", "computedProbability", "numberOfCorrectDigits"]].head()
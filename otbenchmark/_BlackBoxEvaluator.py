@@ -0,0 +1,330 @@
+"""
+Evaluate the performance functions of the TNO black-box reliability challenge.
+
+The evaluator has the same protocol as the evaluate() function, but:
+
+* keeps a persistent session, so that the connections are reused,
+* splits large input arrays into bundled requests of at most batchSize
+  points,
+* sends at most maximumConcurrentRequests requests at the same time,
+* retries the requests which fail with a connection or server error,
+  with an exponential backoff,
+* stores the values in a cache, which can be persistent on disk.
+
+Hence, the same point is never sent twice to the server, unless two
+threads ask for it at the same time.
+The evaluator can be used from several threads: the cache, the counters
+and the persistent cache are guarded by a lock.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import numpy as np
+from ._FunctionWrapper import SharedObject
+
+
+class BlackBoxEvaluator(SharedObject):
+    def __init__(
+        self,
+        username="testuser",
+        password="testpass",
+        url="https://tno-black-box-challenge-api.herokuapp.com/",
+        batchSize=1000,
+        maximumConcurrentRequests=4,
+        numberOfRetries=3,
+        backoffFactor=0.5,
+        timeout=30.0,
+        cacheFileName=None,
+    ):
+        """
+        Create a client of the black-box evaluation server.
+
+        Parameters
+        ----------
+        username : str, optional
+            Registered username for authentication.
+            The default is 'testuser'.
+        password : str, optional
+            Registered password for authentication.
+            The default is 'testpass'.
+        url : str, optional
+            The URL of the server.
+            The default is the URL of the TNO black-box challenge.
+        batchSize : int, optional
+            The maximum number of points in one request.
+            The default is 1000.
+        maximumConcurrentRequests : int, optional
+            The maximum number of requests sent at the same time.
+            The default is 4.
+        numberOfRetries : int, optional
+            The number of retries of a failed request.
+            The default is 3.
+        backoffFactor : float, optional
+            The waiting time before the k-th retry is
+            backoffFactor * 2 ** (k - 1) seconds.
+            The default is 0.5.
+        timeout : float, optional
+            The timeout of each request, in seconds.
+            The default is 30.
+        cacheFileName : str, optional
+            The name of the SQLite file of the persistent cache.
+            The default is None, which only uses an in-memory cache.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> evaluator = otb.BlackBoxEvaluator(cacheFileName="blackbox.sqlite")
+        >>> g_val_sys, g_val_comp, msg = evaluator.evaluate(-1, 2, [[0.545, 1.23]])
+        """
+        if batchSize < 1:
+            raise ValueError("The batch size is %d but must be positive" % (batchSize))
+        if maximumConcurrentRequests < 1:
+            raise ValueError(
+                "The maximum number of concurrent requests is %d "
+                "but must be positive" % (maximumConcurrentRequests)
+            )
+        import requests
+
+        self.username = username
+        self.password = password
+        if not url.endswith("/"):
+            url += "/"
+        self.url = url
+        self.batchSize = batchSize
+        self.maximumConcurrentRequests = maximumConcurrentRequests
+        self.numberOfRetries = numberOfRetries
+        self.backoffFactor = backoffFactor
+        self.timeout = timeout
+        self.cacheFileName = cacheFileName
+        # The session keeps one connection for each concurrent request
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=maximumConcurrentRequests
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=maximumConcurrentRequests)
+        # Guards the cache, the counters and the connection
+        self.lock = threading.Lock()
+        self.numberOfRequests = 0
+        self.numberOfEvaluations = 0
+        self.numberOfCacheHits = 0
+        # cache[(set_id, problem_id)][x.tobytes()] = (g_val_sys, g_val_comp)
+        self.cache = {}
+        self.connection = None
+        if cacheFileName is not None:
+            # The connection is used by the threads which call evaluate()
+            self.connection = sqlite3.connect(cacheFileName, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "set_id INTEGER, problem_id INTEGER, x BLOB, "
+                "g_val_sys REAL, g_val_comp BLOB, "
+                "PRIMARY KEY (set_id, problem_id, x))"
+            )
+            self.connection.commit()
+
+    def _getProblemCache(self, set_id, problem_id):
+        """
+        Returns the cache of a problem.
+
+        The values of the persistent cache are loaded at the first call.
+        The lock must be held by the caller.
+
+        Parameters
+        ----------
+        set_id : int
+            Identification number of the problem set.
+        problem_id : int
+            Identification number of the problem.
+
+        Returns
+        -------
+        problemCache : dict
+            The values of each point, keyed by the bytes of the point.
+        """
+        key = (set_id, problem_id)
+        if key not in self.cache:
+            problemCache = {}
+            if self.connection is not None:
+                cursor = self.connection.execute(
+                    "SELECT x, g_val_sys, g_val_comp FROM evaluations "
+                    "WHERE set_id = ? AND problem_id = ?",
+                    (set_id, problem_id),
+                )
+                for x, g_val_sys, g_val_comp in cursor:
+                    problemCache[x] = (g_val_sys, np.frombuffer(g_val_comp))
+            self.cache[key] = problemCache
+        return self.cache[key]
+
+    def _post(self, set_id, problem_id, x):
+        """
+        Send one bundled request, with retries.
+
+        Parameters
+        ----------
+        set_id : int
+            Identification number of the problem set.
+        problem_id : int
+            Identification number of the problem.
+        x : np.array(size, dimension)
+            The points.
+
+        Returns
+        -------
+        g_val_sys : np.array(size)
+            Performance function value on system level.
+        g_val_comp : np.array(size, numberOfComponents)
+            Performance function value for each component.
+        msg : str
+            Diagnostic message.
+        """
+        import requests
+
+        body = {
+            "username": self.username,
+            "password": self.password,
+            "set_ID": set_id,
+            "problem_ID": problem_id,
+            "input_list": x.tolist(),
+        }
+        for attempt in range(self.numberOfRetries + 1):
+            if attempt > 0:
+                time.sleep(self.backoffFactor * 2 ** (attempt - 1))
+            with self.lock:
+                self.numberOfRequests += 1
+            try:
+                r = self.session.post(
+                    self.url + "evaluate", json=body, timeout=self.timeout
+                )
+                r.raise_for_status()
+                json_data = json.loads(r.text)
+                break
+            except (requests.RequestException, ValueError) as error:
+                # A client error, such as an unknown problem, is not retried
+                response = getattr(error, "response", None)
+                if response is not None and 400 <= response.status_code < 500:
+                    if response.status_code != 429:
+                        raise
+                if attempt == self.numberOfRetries:
+                    raise
+        with self.lock:
+            self.numberOfEvaluations += x.shape[0]
+        size = x.shape[0]
+        g_val_sys = np.reshape(np.array(json_data["g_val_sys"], dtype=float), size)
+        if json_data["g_val_comp"] is None:
+            g_val_comp = np.empty((size, 0))
+        else:
+            g_val_comp = np.reshape(
+                np.array(json_data["g_val_comp"], dtype=float), (size, -1)
+            )
+        return g_val_sys, g_val_comp, json_data["msg"]
+
+    def evaluate(self, set_id, problem_id, x):
+        """
+        Evaluate a performance function.
+
+        The points which are in the cache are not sent to the server.
+        The other points are sent in bundled requests of at most batchSize
+        points, with at most maximumConcurrentRequests concurrent requests.
+        If a request fails, the values of the other requests are stored in
+        the cache before the error is raised.
+
+        Parameters
+        ----------
+        set_id : int
+            Identification number of the problem set.
+        problem_id : int
+            Identification number of the problem.
+        x : list, numpy.array(size, dimension)
+            Values of independent variables/random variables
+            where the performance function is evaluated.
+            Each row is a point.
+
+        Returns
+        -------
+        g_val_sys : np.array(size)
+            Performance function value on system level.
+        g_val_comp : np.array(size, numberOfComponents)
+            Performance function value for each component.
+            If the problem has no component, the number of columns is zero.
+        msg : str
+            The diagnostic messages of the requests, if any.
+        """
+        x = np.atleast_2d(np.array(x, dtype=float))
+        size = x.shape[0]
+        keys = [row.tobytes() for row in x]
+        with self.lock:
+            problemCache = self._getProblemCache(set_id, problem_id)
+            # The rows to compute, without duplicates
+            missingRows = {}
+            for k in range(size):
+                if keys[k] not in problemCache and keys[k] not in missingRows:
+                    missingRows[keys[k]] = k
+            self.numberOfCacheHits += size - len(missingRows)
+        messages = []
+        if len(missingRows) > 0:
+            missing = x[list(missingRows.values())]
+            batches = [
+                missing[start : start + self.batchSize]
+                for start in range(0, missing.shape[0], self.batchSize)
+            ]
+            futures = [
+                self.executor.submit(self._post, set_id, problem_id, batch)
+                for batch in batches
+            ]
+            wait(futures)
+            # The batches which succeeded are stored, even if another failed
+            newValues = []
+            firstError = None
+            for batch, future in zip(batches, futures):
+                if future.exception() is not None:
+                    if firstError is None:
+                        firstError = future.exception()
+                    continue
+                g_val_sys, g_val_comp, msg = future.result()
+                if msg and msg not in messages:
+                    messages.append(msg)
+                for k in range(batch.shape[0]):
+                    newValues.append((batch[k].tobytes(), g_val_sys[k], g_val_comp[k]))
+            with self.lock:
+                for key, value_sys, value_comp in newValues:
+                    problemCache[key] = (value_sys, value_comp)
+                if self.connection is not None and len(newValues) > 0:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (set_id, problem_id, key, value_sys, value_comp.tobytes())
+                            for key, value_sys, value_comp in newValues
+                        ],
+                    )
+                    self.connection.commit()
+            if firstError is not None:
+                raise firstError
+        with self.lock:
+            g_val_sys = np.array([problemCache[key][0] for key in keys])
+            g_val_comp = np.array([problemCache[key][1] for key in keys])
+        g_val_comp = g_val_comp.reshape(size, -1)
+        msg = "\n".join(messages)
+        return g_val_sys, g_val_comp, msg
+
+    def close(self):
+        """
+        Close the session, the threads and the persistent cache.
+
+        Returns
+        -------
+        None.
+        """
+        self.executor.shutdown()
+        self.session.close()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        return None
@@ -0,0 +1,154 @@
+"""
+Create OpenTURNS functions from a black-box performance function.
+"""
+
+import openturns as ot
+import numpy as np
+from ._FunctionWrapper import SharedObject
+from ._BlackBoxEvaluator import BlackBoxEvaluator
+
+
+class BlackBoxFunction(SharedObject):
+    def __init__(
+        self, set_id, problem_id, inputDimension, numberOfComponents=0, evaluator=None
+    ):
+        """
+        Create OpenTURNS functions from a black-box performance function.
+
+        The system function and the component function are evaluated by
+        batches with the func_sample argument of ot.PythonFunction.
+        Both use the cache of the same evaluator, so that the components of
+        a point already evaluated by the system function cost no request.
+
+        Parameters
+        ----------
+        set_id : int
+            Identification number of the problem set.
+        problem_id : int
+            Identification number of the problem.
+        inputDimension : int
+            The number of random variables.
+        numberOfComponents : int, optional
+            The number of components of a system problem.
+            The default is 0, for a problem which is not a system.
+        evaluator : BlackBoxEvaluator, optional
+            The evaluator.
+            The default is None, which creates a BlackBoxEvaluator with its
+            default parameters.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> blackBox = otb.BlackBoxFunction(-1, 2, 2)
+        >>> g = blackBox.getFunction()
+        >>> y = g([0.545, 1.23])
+        """
+        if evaluator is None:
+            evaluator = BlackBoxEvaluator()
+        self.set_id = set_id
+        self.problem_id = problem_id
+        self.inputDimension = inputDimension
+        self.numberOfComponents = numberOfComponents
+        self.evaluator = evaluator
+        description = ["x%d" % (i + 1) for i in range(inputDimension)]
+        self.function = ot.PythonFunction(
+            inputDimension, 1, func_sample=self._computeSystem
+        )
+        self.function.setInputDescription(description)
+        self.function.setOutputDescription(["g"])
+        if numberOfComponents > 0:
+            self.componentsFunction = ot.PythonFunction(
+                inputDimension, numberOfComponents, func_sample=self._computeComponents
+            )
+            self.componentsFunction.setInputDescription(description)
+            self.componentsFunction.setOutputDescription(
+                ["g%d" % (i + 1) for i in range(numberOfComponents)]
+            )
+        else:
+            self.componentsFunction = None
+
+    def _computeSystem(self, inputSample):
+        """
+        Evaluate the performance function on system level.
+
+        Parameters
+        ----------
+        inputSample : ot.Sample(size, inputDimension)
+            The input sample.
+
+        Returns
+        -------
+        outputSample : np.array(size, 1)
+            The output sample.
+        """
+        g_val_sys, _, _ = self.evaluator.evaluate(
+            self.set_id, self.problem_id, np.asarray(inputSample)
+        )
+        return g_val_sys.reshape(-1, 1)
+
+    def _computeComponents(self, inputSample):
+        """
+        Evaluate the performance function of each component.
+
+        Parameters
+        ----------
+        inputSample : ot.Sample(size, inputDimension)
+            The input sample.
+
+        Returns
+        -------
+        outputSample : np.array(size, numberOfComponents)
+            The output sample.
+        """
+        _, g_val_comp, _ = self.evaluator.evaluate(
+            self.set_id, self.problem_id, np.asarray(inputSample)
+        )
+        if g_val_comp.shape[1] != self.numberOfComponents:
+            raise ValueError(
+                "The number of components is %d but the server returned %d"
+                % (self.numberOfComponents, g_val_comp.shape[1])
+            )
+        return g_val_comp
+
+    def getFunction(self):
+        """
+        Returns the performance function on system level.
+
+        Returns
+        -------
+        function : ot.Function(inputDimension, 1)
+            The performance function.
+        """
+        return self.function
+
+    def getComponentsFunction(self):
+        """
+        Returns the performance function of each component.
+
+        Returns
+        -------
+        function : ot.Function(inputDimension, numberOfComponents)
+            The performance function of the components.
+        """
+        if self.componentsFunction is None:
+            raise ValueError("The problem has no component")
+        return self.componentsFunction
+
+    def getNumberOfRemoteEvaluations(self):
+        """
+        Returns the number of points evaluated by the server.
+
+        The points found in the cache of the evaluator are not counted.
+        This number is shared by all the functions which use the same
+        evaluator.
+
+        Returns
+        -------
+        numberOfRemoteEvaluations : int
+            The number of points evaluated by the server.
+        """
+        return self.evaluator.numberOfEvaluations
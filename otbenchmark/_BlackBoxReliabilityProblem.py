@@ -0,0 +1,92 @@
+"""
+Class to define a reliability problem from a black-box performance function.
+"""
+
+from ._ReliabilityBenchmarkProblem import ReliabilityBenchmarkProblem
+from ._BlackBoxFunction import BlackBoxFunction
+import openturns as ot
+
+
+class BlackBoxReliabilityProblem(ReliabilityBenchmarkProblem):
+    def __init__(
+        self,
+        set_id,
+        problem_id,
+        distribution,
+        probability,
+        numberOfComponents=0,
+        evaluator=None,
+        name=None,
+    ):
+        r"""
+        Creates a reliability problem from a black-box performance function.
+
+        The event is :math:`\{g(\boldsymbol{X}) \leq 0\}` where g is the
+        performance function on system level, evaluated by the server.
+
+        Since the function is remote, the probability cannot be computed
+        and must be given as a reference value.
+
+        Parameters
+        ----------
+        set_id : int
+            Identification number of the problem set.
+        problem_id : int
+            Identification number of the problem.
+        distribution : ot.Distribution
+            The distribution of the random variables.
+        probability : float
+            The reference probability.
+        numberOfComponents : int, optional
+            The number of components of a system problem.
+            The default is 0, for a problem which is not a system.
+        evaluator : BlackBoxEvaluator, optional
+            The evaluator.
+            The default is None, which creates a BlackBoxEvaluator with its
+            default parameters.
+        name : str, optional
+            The name of the problem.
+            The default is None, which uses "BB" followed by set_id and
+            problem_id, e.g. "BB-1-2".
+
+        Examples
+        --------
+        >>> import openturns as ot
+        >>> import otbenchmark as otb
+        >>> distribution = ot.Normal(2)
+        >>> problem = otb.BlackBoxReliabilityProblem(-1, 2, distribution, 1.0e-3)
+        >>> benchmark = otb.ReliabilityBenchmarkMetaAlgorithm(problem)
+        """
+        inputDimension = distribution.getDimension()
+        self.blackBoxFunction = BlackBoxFunction(
+            set_id, problem_id, inputDimension, numberOfComponents, evaluator
+        )
+        limitStateFunction = self.blackBoxFunction.getFunction()
+        inputRandomVector = ot.RandomVector(distribution)
+        outputRandomVector = ot.CompositeRandomVector(
+            limitStateFunction, inputRandomVector
+        )
+        thresholdEvent = ot.ThresholdEvent(outputRandomVector, ot.LessOrEqual(), 0.0)
+        if name is None:
+            name = "BB%d-%d" % (set_id, problem_id)
+        super(BlackBoxReliabilityProblem, self).__init__(
+            name, thresholdEvent, probability
+        )
+        # The problem is not marked as expensive: the evaluator already
+        # sends the points by bundled and concurrent requests, so that an
+        # EvaluationScheduler would not save any time
+        return None
+
+    def getBlackBoxFunction(self):
+        """
+        Returns the black-box function.
+
+        It gives access to the performance function of the components and
+        to the number of points evaluated by the server.
+
+        Returns
+        -------
+        blackBoxFunction : BlackBoxFunction
+            The black-box function.
+        """
+        return self.blackBoxFunction
@@ -0,0 +1,366 @@
+"""
+A local stand-in of the black-box evaluation server.
+
+The server speaks the same JSON protocol as the TNO black-box challenge
+server used by evaluate() and BlackBoxEvaluator, but evaluates the
+reliability problems of the library.
+The latency, the throughput and the failures of a slow remote simulator
+can be simulated, without any network.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from .ReliabilityLibrary import ReliabilityBenchmarkProblemList
+from ._BlackBoxEvaluator import BlackBoxEvaluator
+from ._BlackBoxReliabilityProblem import BlackBoxReliabilityProblem
+
+
+class _BlackBoxRequestHandler(BaseHTTPRequestHandler):
+    """Handle the requests of the stand-in server."""
+
+    def do_POST(self):
+        blackBoxServer = self.server.blackBoxServer
+        if self.path.rstrip("/") != "/evaluate":
+            self._sendResponse(404, {"msg": "Unknown path %s" % (self.path)})
+            return
+        try:
+            length = int(self.headers["Content-Length"])
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            self._sendResponse(400, {"msg": "Invalid JSON body"})
+            return
+        status, response = blackBoxServer._processRequest(body)
+        self._sendResponse(status, response)
+
+    def _sendResponse(self, status, response):
+        data = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BlackBoxServer:
+    def __init__(
+        self,
+        set_id=-1,
+        problems=None,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        latencyPerPoint=0.0,
+        latencyModel="Constant",
+        maximumConcurrentRequests=None,
+        maximumBatchSize=None,
+        failureProbability=0.0,
+        seed=0,
+        componentsFunctions=None,
+    ):
+        """
+        Create a local stand-in of the black-box evaluation server.
+
+        The problem_ID of a request is the index of the problem in the list
+        of problems.
+        The server returns the value on system level in the convention of
+        the challenge, where the failure is g_val_sys <= 0: this is
+        g(x) - threshold if the operator of the event is Less or
+        LessOrEqual and threshold - g(x) otherwise.
+        The value for each component is given by the components function
+        of the problem, if any, and is None otherwise.
+
+        The time to process a request is latency + size * latencyPerPoint,
+        where size is the number of points of the request.
+        With the "Exponential" latency model, this time is the mean of an
+        exponential distribution.
+        At most maximumConcurrentRequests requests are processed at the
+        same time: the other requests wait.
+        A request fails with a 503 status with probability
+        failureProbability, and a request with more than maximumBatchSize
+        points fails with a 413 status.
+
+        Parameters
+        ----------
+        set_id : int, optional
+            Identification number of the problem set.
+            The default is -1.
+        problems : list of ReliabilityBenchmarkProblem, optional
+            The problems.
+            The default is None, which uses ReliabilityBenchmarkProblemList().
+        host : str, optional
+            The host name.
+            The default is "127.0.0.1".
+        port : int, optional
+            The port.
+            The default is 0, which selects any free port.
+        latency : float, optional
+            The latency of each request, in seconds.
+            The default is 0.
+        latencyPerPoint : float, optional
+            The additional latency for each point, in seconds.
+            The default is 0.
+        latencyModel : str, optional
+            The latency model, "Constant" or "Exponential".
+            The default is "Constant".
+        maximumConcurrentRequests : int, optional
+            The maximum number of requests processed at the same time.
+            The default is None, which sets no limit.
+        maximumBatchSize : int, optional
+            The maximum number of points in a request.
+            The default is None, which sets no limit.
+        failureProbability : float, optional
+            The probability that a request fails.
+            The default is 0.
+        seed : int, optional
+            The seed of the random latencies and failures.
+            It is independent from the random generator of OpenTURNS.
+            The default is 0.
+        componentsFunctions : list of ot.Function, optional
+            For each problem, the function which computes the value of each
+            component of a system problem, or None.
+            The default is None, which returns no component.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> server = otb.BlackBoxServer(latency=0.1)
+        >>> server.start()
+        >>> evaluator = otb.BlackBoxEvaluator(url=server.getURL())
+        >>> problem = server.buildProblem(0, evaluator)
+        >>> server.stop()
+        """
+        if latencyModel not in ["Constant", "Exponential"]:
+            raise ValueError("Unknown value of latencyModel %s" % (latencyModel))
+        if failureProbability < 0.0 or failureProbability > 1.0:
+            raise ValueError(
+                "The failure probability is %s but must be in [0, 1]"
+                % (failureProbability)
+            )
+        if problems is None:
+            problems = ReliabilityBenchmarkProblemList()
+        if componentsFunctions is None:
+            componentsFunctions = [None] * len(problems)
+        if len(componentsFunctions) != len(problems):
+            raise ValueError(
+                "The number of components functions is %d but must be %d"
+                % (len(componentsFunctions), len(problems))
+            )
+        self.set_id = set_id
+        self.problems = problems
+        self.componentsFunctions = componentsFunctions
+        self.latency = latency
+        self.latencyPerPoint = latencyPerPoint
+        self.latencyModel = latencyModel
+        self.maximumBatchSize = maximumBatchSize
+        self.failureProbability = failureProbability
+        self.randomGenerator = np.random.default_rng(seed)
+        if maximumConcurrentRequests is None:
+            self.semaphore = None
+        else:
+            self.semaphore = threading.BoundedSemaphore(maximumConcurrentRequests)
+        # OpenTURNS functions are evaluated by one thread at a time
+        self.lock = threading.Lock()
+        self.numberOfRequests = 0
+        self.numberOfEvaluations = 0
+        self.numberOfFailures = 0
+        self.httpServer = ThreadingHTTPServer((host, port), _BlackBoxRequestHandler)
+        self.httpServer.daemon_threads = True
+        self.httpServer.blackBoxServer = self
+        self.thread = None
+
+    def _evaluateProblem(self, problem_id, x):
+        """
+        Evaluate a problem, with the convention of the challenge.
+
+        Parameters
+        ----------
+        problem_id : int
+            The index of the problem.
+        x : np.array(size, dimension)
+            The points.
+
+        Returns
+        -------
+        g_val_sys : np.array(size)
+            The value on system level.
+        g_val_comp : np.array(size, numberOfComponents)
+            The value for each component, or None.
+        """
+        event = self.problems[problem_id].getEvent()
+        g = event.getFunction()
+        threshold = event.getThreshold()
+        className = event.getOperator().getImplementation().getClassName()
+        componentsFunction = self.componentsFunctions[problem_id]
+        g_val_comp = None
+        with self.lock:
+            y = np.asarray(g(x))[:, 0]
+            if componentsFunction is not None:
+                g_val_comp = np.asarray(componentsFunction(x))
+        if className in ["Less", "LessOrEqual"]:
+            g_val_sys = y - threshold
+        else:
+            g_val_sys = threshold - y
+        return g_val_sys, g_val_comp
+
+    def _processRequest(self, body):
+        """
+        Process the body of a request.
+
+        Parameters
+        ----------
+        body : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        status : int
+            The HTTP status.
+        response : dict
+            The JSON response.
+        """
+        with self.lock:
+            self.numberOfRequests += 1
+            fails = self.randomGenerator.uniform() < self.failureProbability
+            if fails:
+                self.numberOfFailures += 1
+        if fails:
+            return 503, {"msg": "Injected failure"}
+        try:
+            set_id = body["set_ID"]
+            problem_id = body["problem_ID"]
+            x = np.atleast_2d(np.array(body["input_list"], dtype=float))
+        except (KeyError, TypeError, ValueError):
+            return 400, {"msg": "Invalid request"}
+        if set_id != self.set_id or problem_id < 0 or problem_id >= len(self.problems):
+            return 404, {"msg": "Unknown problem (%s, %s)" % (set_id, problem_id)}
+        dimension = (
+            self.problems[problem_id].getEvent().getFunction().getInputDimension()
+        )
+        if x.ndim != 2 or x.shape[1] != dimension:
+            return 400, {"msg": "The dimension of the points must be %d" % (dimension)}
+        size = x.shape[0]
+        if self.maximumBatchSize is not None and size > self.maximumBatchSize:
+            return 413, {
+                "msg": "The number of points is %d but must be at most %d"
+                % (size, self.maximumBatchSize)
+            }
+        if self.semaphore is not None:
+            self.semaphore.acquire()
+        try:
+            duration = self.latency + size * self.latencyPerPoint
+            if self.latencyModel == "Exponential" and duration > 0.0:
+                with self.lock:
+                    duration = self.randomGenerator.exponential(duration)
+            time.sleep(duration)
+            g_val_sys, g_val_comp = self._evaluateProblem(problem_id, x)
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+        with self.lock:
+            self.numberOfEvaluations += size
+        if g_val_comp is not None:
+            g_val_comp = g_val_comp.tolist()
+        response = {
+            "msg": "OK",
+            "g_val_sys": g_val_sys.tolist(),
+            "g_val_comp": g_val_comp,
+        }
+        return 200, response
+
+    def start(self):
+        """
+        Start the server in a background thread.
+
+        Returns
+        -------
+        None.
+        """
+        if self.thread is not None:
+            raise ValueError("The server is already started")
+        self.thread = threading.Thread(
+            target=self.httpServer.serve_forever, daemon=True
+        )
+        self.thread.start()
+        return None
+
+    def stop(self):
+        """
+        Stop the server and close its socket.
+
+        Returns
+        -------
+        None.
+        """
+        if self.thread is not None:
+            self.httpServer.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.httpServer.server_close()
+        return None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def getURL(self):
+        """
+        Returns the URL of the server.
+
+        Returns
+        -------
+        url : str
+            The URL of the server.
+        """
+        host, port = self.httpServer.server_address[:2]
+        url = "http://%s:%d/" % (host, port)
+        return url
+
+    def buildProblem(self, problem_id, evaluator=None):
+        """
+        Create the black-box problem of a problem of the server.
+
+        The problem has the same distribution and the same probability as
+        the problem of the library, but its function is evaluated by the
+        server.
+
+        Parameters
+        ----------
+        problem_id : int
+            The index of the problem.
+        evaluator : BlackBoxEvaluator, optional
+            The evaluator.
+            The default is None, which creates a BlackBoxEvaluator of the
+            server.
+
+        Returns
+        -------
+        problem : BlackBoxReliabilityProblem
+            The black-box problem.
+        """
+        if evaluator is None:
+            evaluator = BlackBoxEvaluator(url=self.getURL())
+        problem = self.problems[problem_id]
+        distribution = problem.getEvent().getAntecedent().getDistribution()
+        componentsFunction = self.componentsFunctions[problem_id]
+        numberOfComponents = 0
+        if componentsFunction is not None:
+            numberOfComponents = componentsFunction.getOutputDimension()
+        blackBoxProblem = BlackBoxReliabilityProblem(
+            self.set_id,
+            problem_id,
+            distribution,
+            problem.getProbability(),
+            numberOfComponents=numberOfComponents,
+            evaluator=evaluator,
+            name="BB-" + problem.getName(),
+        )
+        return blackBoxProblem
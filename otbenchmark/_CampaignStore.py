@@ -0,0 +1,297 @@
+"""
+Store the results of a benchmark campaign in a SQLite database.
+"""
+
+import json
+import sqlite3
+
+
+class CampaignStore:
+    def __init__(self, fileName, batchSize=10):
+        """
+        Store the results of a benchmark campaign in a SQLite database.
+
+        The database has one row for each cell of the campaign, i.e. for
+        each (problem, method, parameters, seed).
+        The metrics of a cell, e.g. the attributes of a
+        ReliabilityBenchmarkResult or the Sobol' indices of a sensitivity
+        method, are stored as JSON, with the time of the cell.
+
+        The new rows are written by batches of batchSize rows.
+        Each batch is written in one transaction, so that a crash never
+        leaves a partial batch in the database.
+        When a campaign is run again, the completed cells can be skipped,
+        which makes the campaign restartable.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the SQLite file.
+            The file is created if it does not exist.
+        batchSize : int, optional
+            The number of rows written in one transaction.
+            The default is 10.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> store = otb.CampaignStore("campaign.sqlite")
+        >>> benchmark = otb.ReliabilityMethodBenchmark()
+        >>> records = benchmark.run(store)
+        >>> store.close()
+        """
+        if batchSize < 1:
+            raise ValueError("The batch size is %d but must be positive" % (batchSize))
+        self.fileName = fileName
+        self.batchSize = batchSize
+        self.buffer = []
+        self.connection = sqlite3.connect(fileName)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "problem TEXT, method TEXT, parameters TEXT, seed INTEGER, "
+                "metrics TEXT, time REAL, "
+                "PRIMARY KEY (problem, method, parameters, seed))"
+            )
+
+    @staticmethod
+    def _encodeParameters(parameters):
+        """
+        Encode the parameters of a method.
+
+        The keys are sorted, so that the same parameters always give the
+        same string.
+
+        Parameters
+        ----------
+        parameters : dict
+            The parameters.
+
+        Returns
+        -------
+        text : str
+            The JSON string of the parameters.
+        """
+        text = json.dumps(parameters, sort_keys=True, default=list)
+        return text
+
+    @staticmethod
+    def _decodeRow(row):
+        """
+        Decode a row of the database.
+
+        Parameters
+        ----------
+        row : tuple
+            The row.
+
+        Returns
+        -------
+        result : dict
+            The result.
+        """
+        result = {
+            "problem": row[0],
+            "method": row[1],
+            "parameters": json.loads(row[2]),
+            "seed": row[3],
+            "metrics": json.loads(row[4]),
+            "time": row[5],
+        }
+        return result
+
+    def getResult(self, problem, method, parameters, seed):
+        """
+        Returns the result of a cell of the campaign.
+
+        The pending results are taken into account.
+
+        Parameters
+        ----------
+        problem : str
+            The name of the problem.
+        method : str
+            The name of the method.
+        parameters : dict
+            The parameters of the method.
+        seed : int
+            The seed.
+
+        Returns
+        -------
+        result : dict
+            The result, with the keys "problem", "method", "parameters",
+            "seed", "metrics" and "time".
+            If the cell is not completed, the result is None.
+        """
+        key = (problem, method, CampaignStore._encodeParameters(parameters), seed)
+        for row in self.buffer:
+            if row[:4] == key:
+                return CampaignStore._decodeRow(row)
+        cursor = self.connection.execute(
+            "SELECT * FROM results "
+            "WHERE problem = ? AND method = ? AND parameters = ? AND seed = ?",
+            key,
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        result = CampaignStore._decodeRow(row)
+        return result
+
+    def isCompleted(self, problem, method, parameters, seed):
+        """
+        Check if a cell of the campaign is completed.
+
+        Parameters
+        ----------
+        problem : str
+            The name of the problem.
+        method : str
+            The name of the method.
+        parameters : dict
+            The parameters of the method.
+        seed : int
+            The seed.
+
+        Returns
+        -------
+        completed : bool
+            True if the cell is in the store.
+        """
+        completed = self.getResult(problem, method, parameters, seed) is not None
+        return completed
+
+    def add(self, problem, method, parameters, seed, metrics, time=0.0):
+        """
+        Add the result of a cell of the campaign.
+
+        The result is written when the batch is full, or by flush().
+
+        Parameters
+        ----------
+        problem : str
+            The name of the problem.
+        method : str
+            The name of the method.
+        parameters : dict
+            The parameters of the method.
+        seed : int
+            The seed.
+        metrics : dict
+            The metrics.
+            The values must be numbers, strings, or sequences such as
+            ot.Point.
+        time : float, optional
+            The time of the cell, in seconds.
+            The default is 0.
+
+        Returns
+        -------
+        None.
+        """
+        row = (
+            problem,
+            method,
+            CampaignStore._encodeParameters(parameters),
+            seed,
+            json.dumps(metrics, default=list),
+            time,
+        )
+        self.buffer.append(row)
+        if len(self.buffer) >= self.batchSize:
+            self.flush()
+        return None
+
+    def flush(self):
+        """
+        Write the pending results in one transaction.
+
+        Returns
+        -------
+        None.
+        """
+        if len(self.buffer) == 0:
+            return None
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                self.buffer,
+            )
+        self.buffer = []
+        return None
+
+    def getResults(self, problem=None, method=None):
+        """
+        Returns the results of the store.
+
+        The pending results are written first.
+
+        Parameters
+        ----------
+        problem : str, optional
+            The name of the problem.
+            The default is None, which returns the results of all problems.
+        method : str, optional
+            The name of the method.
+            The default is None, which returns the results of all methods.
+
+        Returns
+        -------
+        results : list of dict
+            The results.
+            Each result has the keys "problem", "method", "parameters",
+            "seed", "metrics" and "time".
+        """
+        self.flush()
+        query = "SELECT * FROM results WHERE 1"
+        arguments = []
+        if problem is not None:
+            query += " AND problem = ?"
+            arguments.append(problem)
+        if method is not None:
+            query += " AND method = ?"
+            arguments.append(method)
+        query += " ORDER BY rowid"
+        results = []
+        for row in self.connection.execute(query, arguments):
+            results.append(CampaignStore._decodeRow(row))
+        return results
+
+    def getNumberOfResults(self):
+        """
+        Returns the number of results of the store.
+
+        Returns
+        -------
+        numberOfResults : int
+            The number of results, including the pending results.
+        """
+        self.flush()
+        cursor = self.connection.execute("SELECT COUNT(*) FROM results")
+        numberOfResults = cursor.fetchone()[0]
+        return numberOfResults
+
+    def close(self):
+        """
+        Write the pending results and close the database.
+
+        Returns
+        -------
+        None.
+        """
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,394 @@
+"""
+Store large tables of results in a columnar binary format.
+"""
+
+import ast
+import json
+import os
+import numpy as np
+
+
+class ColumnarTable:
+    # The size of the header of the .npy files, in bytes.
+    # It is large enough for any shape, so that the header can be updated in
+    # place when rows are appended.
+    headerLength = 128
+
+    def __init__(self, directory):
+        """
+        Store a large table of results in a columnar binary format.
+
+        The table is a directory, with one NumPy .npy file for each column.
+        The rows are appended by chunks at the end of each file and the
+        columns are loaded memory-mapped, so that tables with millions of
+        rows, e.g. the repetitions of SensitivityConvergence or
+        SensitivityDistribution, can be aggregated without reading them
+        into memory.
+        These classes append their results to a table given by the table
+        argument of computeSobolSample() and compute_sample_indices().
+
+        A column is a NumPy array, an ot.Sample or a list of strings.
+        The number of rows of each column is the size of its first
+        dimension: the other dimensions must not change between two chunks.
+        The strings are stored as integer codes, with the list of the
+        distinct strings in the description of the table.
+
+        The table can be exported to a single file, in the NumPy .npz
+        format or, if pyarrow is installed, in the Parquet format.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the table.
+            The directory is created if it does not exist.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> problem = otb.IshigamiSensitivity()
+        >>> metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        >>> convergence = otb.SensitivityConvergence(problem, metaSAAlgorithm)
+        >>> table = otb.ColumnarTable("convergence")
+        >>> sizes, first, total = convergence.computeSobolSample(table=table)
+        >>> columns = table.load()
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.descriptionFileName = os.path.join(directory, "columns.json")
+        if os.path.exists(self.descriptionFileName):
+            with open(self.descriptionFileName, "r") as file:
+                self.description = json.load(file)
+        else:
+            self.description = {}
+
+    def _getColumnFileName(self, name):
+        """
+        Returns the name of the file of a column.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+
+        Returns
+        -------
+        fileName : str
+            The name of the file.
+        """
+        fileName = os.path.join(self.directory, name + ".npy")
+        return fileName
+
+    @staticmethod
+    def _writeHeader(file, dtype, shape):
+        """
+        Write the header of a .npy file, with a fixed length.
+
+        Parameters
+        ----------
+        file : file
+            The file, opened in binary mode.
+        dtype : np.dtype
+            The type of the column.
+        shape : tuple of int
+            The shape of the column.
+
+        Returns
+        -------
+        None.
+        """
+        header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+            np.lib.format.dtype_to_descr(dtype),
+            tuple(shape),
+        )
+        # The magic string, the version and the length use 10 bytes
+        dictionaryLength = ColumnarTable.headerLength - 10
+        header = header.ljust(dictionaryLength - 1) + "\n"
+        file.seek(0)
+        file.write(b"\x93NUMPY\x01\x00")
+        file.write(np.uint16(dictionaryLength).tobytes())
+        file.write(header.encode("latin1"))
+        return None
+
+    @staticmethod
+    def _readShape(fileName):
+        """
+        Read the shape of a column from the header of its file.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file.
+
+        Returns
+        -------
+        shape : tuple of int
+            The shape of the column.
+        """
+        with open(fileName, "rb") as file:
+            file.seek(10)
+            header = file.read(ColumnarTable.headerLength - 10).decode("latin1")
+        shape = ast.literal_eval(header)["shape"]
+        return shape
+
+    def _encodeColumn(self, name, values):
+        """
+        Convert the values of a column into an array.
+
+        The strings are converted into integer codes of the distinct
+        strings of the column, which are completed by the new strings.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+        values : sequence
+            The values.
+
+        Returns
+        -------
+        array : np.array
+            The array of the column.
+        categories : list of str
+            The distinct strings of the column, or None if the column is
+            numerical.
+        """
+        array = np.asarray(values)
+        if array.dtype.kind not in ["U", "S", "O"]:
+            return np.ascontiguousarray(array), None
+        if name in self.description:
+            categories = list(self.description[name]["categories"])
+        else:
+            categories = []
+        codes = {category: k for k, category in enumerate(categories)}
+        encoded = np.empty(array.shape, dtype=np.int32)
+        for index, value in np.ndenumerate(array):
+            value = str(value)
+            if value not in codes:
+                codes[value] = len(categories)
+                categories.append(value)
+            encoded[index] = codes[value]
+        return encoded, categories
+
+    def append(self, columns):
+        """
+        Append a chunk of rows.
+
+        The chunk is written at the end of the files of the columns and the
+        headers of the files are then updated.
+
+        Parameters
+        ----------
+        columns : dict
+            The values of each column.
+            Each value is a sequence, an array or an ot.Sample.
+            All the columns must have the same number of rows.
+            The columns of the next chunks must be the same.
+
+        Returns
+        -------
+        None.
+        """
+        if len(self.description) > 0 and set(columns) != set(self.description):
+            raise ValueError(
+                "The columns are %s but must be %s"
+                % (sorted(columns), sorted(self.description))
+            )
+        arrays = {}
+        categories = {}
+        numberOfRows = None
+        for name in columns:
+            arrays[name], categories[name] = self._encodeColumn(name, columns[name])
+            if numberOfRows is None:
+                numberOfRows = arrays[name].shape[0]
+            elif arrays[name].shape[0] != numberOfRows:
+                raise ValueError(
+                    "The column %s has %d rows but must have %d"
+                    % (name, arrays[name].shape[0], numberOfRows)
+                )
+            if name in self.description:
+                column = self.description[name]
+                if list(arrays[name].shape[1:]) != column["shape"]:
+                    raise ValueError(
+                        "The shape of the rows of the column %s is %s but must be %s"
+                        % (name, list(arrays[name].shape[1:]), column["shape"])
+                    )
+                arrays[name] = arrays[name].astype(np.dtype(column["dtype"]))
+        # The chunk is checked before any column is written
+        for name in arrays:
+            array = arrays[name]
+            if name not in self.description:
+                self.description[name] = {
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape[1:]),
+                    "categories": None,
+                }
+            self.description[name]["categories"] = categories[name]
+            fileName = self._getColumnFileName(name)
+            if os.path.exists(fileName):
+                shape = ColumnarTable._readShape(fileName)
+                mode = "r+b"
+            else:
+                shape = (0,) + array.shape[1:]
+                mode = "w+b"
+            with open(fileName, mode) as file:
+                if mode == "w+b":
+                    ColumnarTable._writeHeader(file, array.dtype, shape)
+                # The rows are written before the header, so that an
+                # interrupted append leaves a consistent file
+                file.seek(0, os.SEEK_END)
+                file.write(array.tobytes())
+                shape = (shape[0] + array.shape[0],) + tuple(shape[1:])
+                ColumnarTable._writeHeader(file, array.dtype, shape)
+        with open(self.descriptionFileName, "w") as file:
+            json.dump(self.description, file)
+        return None
+
+    def getColumnNames(self):
+        """
+        Returns the names of the columns.
+
+        Returns
+        -------
+        names : list of str
+            The names of the columns.
+        """
+        names = list(self.description.keys())
+        return names
+
+    def getNumberOfRows(self):
+        """
+        Returns the number of rows.
+
+        Returns
+        -------
+        numberOfRows : int
+            The number of rows.
+        """
+        if len(self.description) == 0:
+            return 0
+        name = self.getColumnNames()[0]
+        numberOfRows = ColumnarTable._readShape(self._getColumnFileName(name))[0]
+        return numberOfRows
+
+    def load(self, names=None, mmap=True):
+        """
+        Load the columns.
+
+        Parameters
+        ----------
+        names : list of str, optional
+            The names of the columns.
+            The default is None, which loads all the columns.
+        mmap : bool, optional
+            If True, the numerical columns are memory-mapped in read-only
+            mode.
+            The columns of strings are always decoded in memory.
+            The default is True.
+
+        Returns
+        -------
+        columns : dict
+            The array of each column.
+        """
+        if names is None:
+            names = self.getColumnNames()
+        mmapMode = "r" if mmap else None
+        columns = {}
+        for name in names:
+            array = np.load(self._getColumnFileName(name), mmap_mode=mmapMode)
+            categories = self.description[name]["categories"]
+            if categories is not None:
+                array = np.array(categories)[array]
+            columns[name] = array
+        return columns
+
+    def appendRecords(self, records):
+        """
+        Append records, e.g. the results of ReliabilityMethodBenchmark.
+
+        Parameters
+        ----------
+        records : list of dict
+            The records.
+            All the records must have the same keys.
+
+        Returns
+        -------
+        None.
+        """
+        if len(records) == 0:
+            return None
+        columns = {name: [record[name] for record in records] for name in records[0]}
+        self.append(columns)
+        return None
+
+    def export(self, fileName):
+        """
+        Export the table into a single file.
+
+        The format is given by the extension of the file name: ".parquet"
+        for Parquet, which requires pyarrow, and NumPy .npz otherwise.
+        In a Parquet file, a column with several values on each row is
+        split into one column for each value, e.g. "first_0", "first_1",
+        etc.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file.
+
+        Returns
+        -------
+        None.
+        """
+        columns = self.load()
+        if not fileName.endswith(".parquet"):
+            np.savez(fileName, **columns)
+            return None
+        import pyarrow
+        import pyarrow.parquet
+
+        flatColumns = {}
+        for name, array in columns.items():
+            if array.ndim == 1:
+                flatColumns[name] = array
+                continue
+            array = array.reshape(array.shape[0], -1)
+            for k in range(array.shape[1]):
+                flatColumns["%s_%d" % (name, k)] = array[:, k]
+        pyarrow.parquet.write_table(pyarrow.table(flatColumns), fileName)
+        return None
+
+    @staticmethod
+    def Import(fileName):
+        """
+        Import the columns of a file created by export().
+
+        A .npz file cannot be memory-mapped: the columns are read into
+        memory.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file.
+
+        Returns
+        -------
+        columns : dict
+            The array of each column.
+        """
+        if fileName.endswith(".parquet"):
+            import pyarrow.parquet
+
+            table = pyarrow.parquet.read_table(fileName, memory_map=True)
+            columns = {
+                name: table.column(name).to_numpy() for name in table.column_names
+            }
+            return columns
+        with np.load(fileName) as data:
+            columns = {name: data[name] for name in data.files}
+        return columns
@@ -0,0 +1,365 @@
+"""
+Run a benchmark campaign from the command line.
+"""
+
+import argparse
+import numpy as np
+import openturns as ot
+import otbenchmark as otb
+
+
+def _getProblemTags(problem):
+    """
+    Returns the tags of a reliability problem.
+
+    Parameters
+    ----------
+    problem : ReliabilityBenchmarkProblem
+        The problem.
+
+    Returns
+    -------
+    tags : list of str
+        The tags, among "all", "expensive", "lowDimension" (at most 2
+        inputs), "highDimension" (at least 10 inputs) and "rareEvent"
+        (probability lower than 1.e-4).
+    """
+    tags = ["all"]
+    if problem.isExpensive():
+        tags.append("expensive")
+    dimension = problem.getEvent().getAntecedent().getDimension()
+    if dimension <= 2:
+        tags.append("lowDimension")
+    if dimension >= 10:
+        tags.append("highDimension")
+    if problem.getProbability() < 1.0e-4:
+        tags.append("rareEvent")
+    return tags
+
+
+def _getMethodTags(method):
+    """
+    Returns the tags of a reliability method.
+
+    Parameters
+    ----------
+    method : str
+        The method, see ReliabilityMethodBenchmark.GetMethods().
+
+    Returns
+    -------
+    tags : list of str
+        The tags, among "all", "approximation" and "sampling".
+    """
+    tags = ["all"]
+    if method in ["FORM", "SORM"]:
+        tags.append("approximation")
+    else:
+        tags.append("sampling")
+    return tags
+
+
+def _select(items, getName, getTags, selectors, kind):
+    """
+    Select the items whose name or tag is in the selectors.
+
+    The names and the tags are compared without case.
+
+    Parameters
+    ----------
+    items : list
+        The items.
+    getName : callable
+        The function which returns the name of an item.
+    getTags : callable
+        The function which returns the tags of an item.
+    selectors : list of str
+        The names and the tags.
+    kind : str
+        The kind of items, for the error message.
+
+    Returns
+    -------
+    selectedItems : list
+        The selected items, in the order of items.
+    """
+    selectors = [selector.lower() for selector in selectors]
+    selectedItems = []
+    matchedSelectors = set()
+    for item in items:
+        keys = [getName(item).lower()] + [tag.lower() for tag in getTags(item)]
+        matches = [selector for selector in selectors if selector in keys]
+        if len(matches) > 0:
+            selectedItems.append(item)
+            matchedSelectors.update(matches)
+    unknownSelectors = [s for s in selectors if s not in matchedSelectors]
+    if len(unknownSelectors) > 0:
+        raise ValueError(
+            "Unknown %s name or tag: %s" % (kind, ", ".join(unknownSelectors))
+        )
+    return selectedItems
+
+
+def _createParser():
+    """
+    Create the parser of the command line arguments.
+
+    Returns
+    -------
+    parser : argparse.ArgumentParser
+        The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="otbenchmark",
+        description="Run the reliability methods on the reliability problems "
+        "and print a summary table.",
+    )
+    parser.add_argument(
+        "--version", action="version", version="%(prog)s " + otb.__version__
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="print the problems and the methods with their tags, then exit",
+    )
+    parser.add_argument(
+        "-p",
+        "--problems",
+        nargs="+",
+        default=["all"],
+        metavar="NAME_OR_TAG",
+        help="problem names or tags (default: all)",
+    )
+    parser.add_argument(
+        "-m",
+        "--methods",
+        nargs="+",
+        default=["all"],
+        metavar="NAME_OR_TAG",
+        help="method names or tags (default: all)",
+    )
+    parser.add_argument(
+        "-s",
+        "--seeds",
+        nargs="+",
+        type=int,
+        default=[0],
+        metavar="SEED",
+        help="seeds of the random generator, one run per seed (default: 0)",
+    )
+    parser.add_argument(
+        "--maximum-outer-sampling",
+        type=int,
+        default=100,
+        metavar="N",
+        help="maximum number of outer iterations of the simulation methods "
+        "(default: 100)",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=100,
+        metavar="N",
+        help="number of inner iterations of the simulation methods (default: 100)",
+    )
+    parser.add_argument(
+        "--coefficient-of-variation",
+        type=float,
+        default=0.0,
+        metavar="COV",
+        help="maximum coefficient of variation of the simulation methods "
+        "(default: 0, which uses the whole budget)",
+    )
+    parser.add_argument(
+        "--maximum-calls",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="maximum number of function calls of the design point search "
+        "(default: 1000)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of processes (default: 1)",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="FILE",
+        help="SQLite result store: the runs already in the store are skipped",
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", help="save the records into a JSON or CSV file"
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure the peak Python heap of each run, which slows the runs down",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the timing breakdown of the function evaluations of each run",
+    )
+    return parser
+
+
+def _formatList(problems, methods):
+    """
+    Returns the table of the problems and the methods with their tags.
+
+    Parameters
+    ----------
+    problems : list of ReliabilityBenchmarkProblem
+        The problems.
+    methods : list of str
+        The methods.
+
+    Returns
+    -------
+    s : str
+        The table.
+    """
+    lines = ["Problems:"]
+    for problem in problems:
+        lines.append(
+            "  %-28s %s" % (problem.getName(), " ".join(_getProblemTags(problem)))
+        )
+    lines.append("Methods:")
+    for method in methods:
+        lines.append("  %-28s %s" % (method, " ".join(_getMethodTags(method))))
+    s = "\n".join(lines)
+    return s
+
+
+def _formatSummary(records):
+    """
+    Returns the summary table of the records.
+
+    There is one row for each problem and each method: the number of
+    correct digits, the number of function evaluations and the time are
+    averaged over the seeds.
+
+    Parameters
+    ----------
+    records : list of dict
+        The records of ReliabilityMethodBenchmark.
+
+    Returns
+    -------
+    s : str
+        The table.
+    """
+    rows = {}
+    for record in records:
+        key = (record["problem"], record["method"])
+        rows.setdefault(key, []).append(record)
+    lines = [
+        "%-28s %-15s %5s %8s %12s %10s"
+        % ("Problem", "Method", "Seeds", "Digits", "Evaluations", "Time (s)")
+    ]
+    for (problem, method), rowRecords in rows.items():
+        digits = np.mean([record["numberOfCorrectDigits"] for record in rowRecords])
+        calls = np.mean(
+            [record["numberOfFunctionEvaluations"] for record in rowRecords]
+        )
+        elapsedTime = np.mean([record["time"] for record in rowRecords])
+        lines.append(
+            "%-28s %-15s %5d %8.2f %12.0f %10.3f"
+            % (problem, method, len(rowRecords), digits, calls, elapsedTime)
+        )
+    s = "\n".join(lines)
+    return s
+
+
+def main(argv=None):
+    """
+    Run a benchmark campaign from the command line.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments.
+        The default is None, which uses sys.argv.
+
+    Returns
+    -------
+    status : int
+        The exit status.
+
+    Examples
+    --------
+    In a shell:
+
+        otbenchmark --problems RP8 lowDimension --methods FORM sampling \\
+            --seeds 0 1 2 --workers 4 --store campaign.sqlite
+    """
+    parser = _createParser()
+    arguments = parser.parse_args(argv)
+    allProblems = otb.ReliabilityBenchmarkProblemList()
+    allMethods = otb.ReliabilityMethodBenchmark.GetMethods()
+    if arguments.list:
+        print(_formatList(allProblems, allMethods))
+        return 0
+    try:
+        problems = _select(
+            allProblems,
+            lambda problem: problem.getName(),
+            _getProblemTags,
+            arguments.problems,
+            "problem",
+        )
+        methods = _select(
+            allMethods,
+            lambda method: method,
+            _getMethodTags,
+            arguments.methods,
+            "method",
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    nearestPointAlgorithm = ot.AbdoRackwitz()
+    nearestPointAlgorithm.setMaximumCallsNumber(arguments.maximum_calls)
+    profiler = None
+    if arguments.profile:
+        profiler = otb.EvaluationProfiler()
+    store = None
+    if arguments.store is not None:
+        store = otb.CampaignStore(arguments.store)
+    records = []
+    try:
+        for seed in arguments.seeds:
+            benchmark = otb.ReliabilityMethodBenchmark(
+                problems,
+                methods,
+                seed=seed,
+                nearestPointAlgorithm=nearestPointAlgorithm,
+                maximumOuterSampling=arguments.maximum_outer_sampling,
+                blockSize=arguments.block_size,
+                coefficientOfVariation=arguments.coefficient_of_variation,
+                measureMemory=arguments.memory,
+                profiler=profiler,
+            )
+            records.extend(
+                benchmark.run(store=store, numberOfWorkers=arguments.workers)
+            )
+    finally:
+        if store is not None:
+            store.close()
+    if arguments.output is not None:
+        benchmark.records = records
+        benchmark.save(arguments.output)
+    print(_formatSummary(records))
+    if arguments.profile:
+        for record in records:
+            if "evaluationProfile" not in record:
+                continue
+            print(
+                "\n%s, %s, seed = %d"
+                % (record["problem"], record["method"], record["seed"])
+            )
+            print(otb.EvaluationProfiler.summary(record["evaluationProfile"]))
+    return 0
@@ -5,8 +5,8 @@ Created on Sun Jun 21 17:23:25 2020
 """
 
 import openturns as ot
-import pylab as pl
-import openturns.viewer as otv
+import numpy as np
+from ._CrossCutGrid import buildCrossCutBlocks, evaluateCrossCutBlocks
 
 
 class CrossCutDistribution:
@@ -22,8 +22,123 @@ class CrossCutDistribution:
             A distribution.
         """
         self.distribution = distribution
+        # The conditional PDFs of each reference point
+        self.conditionalPDFCache = {}
+        self.maximumBatchSize = 2**22
 
-    def drawConditionalPDF(self, referencePoint):
+    def _computeDrawingRange(self):
+        """
+        Compute the drawing range of each marginal.
+
+        The range is the same as in the drawPDF() method of a 1D
+        distribution, based on the Distribution-QMin and Distribution-QMax
+        keys of the ResourceMap.
+
+        Returns
+        -------
+        bounds : ot.Interval
+            The drawing range of each marginal.
+        """
+        qMin = ot.ResourceMap.GetAsScalar("Distribution-QMin")
+        qMax = ot.ResourceMap.GetAsScalar("Distribution-QMax")
+        inputDimension = self.distribution.getDimension()
+        lowerBound = ot.Point(inputDimension)
+        upperBound = ot.Point(inputDimension)
+        for i in range(inputDimension):
+            marginal = self.distribution.getMarginal(i)
+            xMin = marginal.computeQuantile(qMin)[0]
+            xMax = marginal.computeQuantile(qMax)[0]
+            delta = 2.0 * (xMax - xMin) * (1.0 - 0.5 * (qMax - qMin))
+            lowerBound[i] = xMin - delta
+            upperBound[i] = xMax + delta
+        bounds = ot.Interval(lowerBound, upperBound)
+        return bounds
+
+    def computeConditionalPDF(self, referencePoint, bounds=None, numberOfPoints=None):
+        """
+        Compute the conditional PDFs on the grids of all the cross-cuts.
+
+        The conditional PDF is proportional to the joint PDF where the
+        conditioning variables are set to the reference point.
+        This is why the 1D grid of each variable and the 2D grid of each
+        pair of variables are stacked into one full-dimensional sample,
+        whose joint PDF is computed in as few calls to computePDF() as
+        possible: a new call is made only when the stacked sample exceeds
+        maximumBatchSize values.
+        Each block of the result is then normalized so that it integrates
+        to 1 on its grid.
+
+        The results are cached, so that drawing again the same cross-cuts
+        costs no PDF evaluation.
+
+        Parameters
+        ----------
+        referencePoint : ot.Point
+            The conditioning point value.
+        bounds : ot.Interval, optional
+            The bounds of the grids.
+            The default is None, which uses the same range as drawPDF().
+        numberOfPoints : int, optional
+            The number of points in each axis.
+            The default is None, which uses the
+            Distribution-DefaultPointNumber key of the ResourceMap.
+
+        Returns
+        -------
+        grids : list of np.array(numberOfPoints)
+            The grid of each variable.
+        curvePDF : list of np.array(numberOfPoints)
+            The conditional PDF of the i-th variable.
+        contourPDF : dict of np.array(numberOfPoints ** 2)
+            The conditional PDF of the (i, j) pair, with i > j.
+            The j-th variable is on the X axis, increasing first.
+        """
+        if bounds is None:
+            bounds = self._computeDrawingRange()
+        if numberOfPoints is None:
+            numberOfPoints = ot.ResourceMap.GetAsUnsignedInteger(
+                "Distribution-DefaultPointNumber"
+            )
+        key = (
+            tuple(referencePoint),
+            tuple(bounds.getLowerBound()),
+            tuple(bounds.getUpperBound()),
+            numberOfPoints,
+        )
+        if key in self.conditionalPDFCache:
+            return self.conditionalPDFCache[key]
+        inputDimension = self.distribution.getDimension()
+        lowerBound = bounds.getLowerBound()
+        upperBound = bounds.getUpperBound()
+        grids = [
+            np.linspace(lowerBound[i], upperBound[i], numberOfPoints)
+            for i in range(inputDimension)
+        ]
+        blocks = buildCrossCutBlocks(grids, grids)
+        blockPDF = evaluateCrossCutBlocks(
+            self.distribution.computePDF,
+            referencePoint,
+            blocks,
+            self.maximumBatchSize,
+        )
+        curvePDF = []
+        contourPDF = {}
+        for (indices, _), values in zip(blocks, blockPDF):
+            # The volume of a cell of the grid
+            cellVolume = np.prod(
+                [grids[index][1] - grids[index][0] for index in indices]
+            )
+            integral = np.sum(values) * cellVolume
+            if integral > 0.0:
+                values = values / integral
+            if len(indices) == 1:
+                curvePDF.append(values)
+            else:
+                contourPDF[indices] = values
+        self.conditionalPDFCache[key] = (grids, curvePDF, contourPDF)
+        return self.conditionalPDFCache[key]
+
+    def drawConditionalPDF(self, referencePoint, bounds=None, numberOfPoints=None):
         """
         Draw the PDF of the conditional distribution.
 
@@ -32,71 +147,65 @@ class CrossCutDistribution:
 
         Each i-th graphics of the diagonal of the plot present the
         conditional distribution:
-        X | Xi=referencePoint[i].
+        Xi | Xj=referencePoint[j] for j different from i.
 
-        Each (i,j)-th graphics of the diagonal of the plot present the
+        Each (i,j)-th graphics of the lower triangle of the plot present the
         conditional distribution:
-        X | Xi=referencePoint[i], Xi=referencePoint[j]
-        for i different from j.
+        (Xj, Xi) | Xk=referencePoint[k]
+        for k different from i and j.
+
+        The conditional PDFs are computed with computeConditionalPDF().
 
         Parameters
         ----------
         referencePoint : ot.Point
             The conditioning point value.
+        bounds : ot.Interval, optional
+            The bounds of the grids.
+            The default is None, which uses the same range as drawPDF().
+        numberOfPoints : int, optional
+            The number of points in each axis.
+            The default is None, which uses the
+            Distribution-DefaultPointNumber key of the ResourceMap.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         description = self.distribution.getDescription()
         inputDimension = self.distribution.getDimension()
+        grids, curvePDF, contourPDF = self.computeConditionalPDF(
+            referencePoint, bounds, numberOfPoints
+        )
         fig = pl.figure(figsize=(12, 12))
         _ = fig.suptitle("Iso-values of conditional PDF")
         for i in range(inputDimension):
             # Diagonal part :
             # PDF(xi) where x(j != i) is equal to the reference
-            # Create the cross cut function
-            crossCutIndices = []
-            crossCutReferencePoint = []
-            for k in range(inputDimension):
-                if k != i:
-                    crossCutIndices.append(k)
-                    crossCutReferencePoint.append(referencePoint[k])
-            conditionalDistribution = ot.Distribution(
-                ot.PointConditionalDistribution(
-                    self.distribution, crossCutIndices, crossCutReferencePoint
-                )
+            graph = ot.Graph(
+                "%s PDF" % (description[i]), description[i], "PDF", True, ""
             )
-            # Draw
-            graph = conditionalDistribution.drawPDF()
-            graph.setXTitle(description[i])
-            graph.setLegends([""])
+            graph.add(ot.Curve(np.column_stack((grids[i], curvePDF[i]))))
             index = 1 + i * inputDimension + i
             ax = fig.add_subplot(inputDimension, inputDimension, index)
             _ = otv.View(graph, figure=fig, axes=[ax])
-            # Lower triangle : y(xi, xj) where x(k != i and k != j)
+            # Lower triangle : PDF(xj, xi) where x(k != i and k != j)
             # is equal to the reference
             for j in range(i):
-                # Draw the cross cut (Xi, Xj), where all other variables
-                # are set to the reference value
-                # Create the cross cut function
-                crossCutIndices = []
-                crossCutReferencePoint = []
-                for k in range(inputDimension):
-                    if k != i and k != j:
-                        crossCutIndices.append(k)
-                        crossCutReferencePoint.append(referencePoint[k])
-                conditionalDistribution = ot.Distribution(
-                    ot.PointConditionalDistribution(
-                        self.distribution, crossCutIndices, crossCutReferencePoint
-                    )
+                contour = ot.Contour(
+                    ot.Sample.BuildFromPoint(grids[j]),
+                    ot.Sample.BuildFromPoint(grids[i]),
+                    ot.Sample.BuildFromPoint(contourPDF[(i, j)]),
                 )
-                # Draw
-                graph = conditionalDistribution.drawPDF()
-                # Workaround for https://github.com/openturns/openturns/issues/1230
-                # The ConditionalDistribution should manage the description, but
-                # cannot because of a limitation in OT.
                 # Explanation: j is the column number in the plot grid
-                graph.setXTitle(description[j])
-                # Explanation: i is the row number in the plot grid
-                graph.setYTitle(description[i])
-                print("Descr = ", i, j)
+                # and i is the row number in the plot grid
+                graph = ot.Graph(
+                    "Iso-values of conditional PDF",
+                    description[j],
+                    description[i],
+                    True,
+                    "",
+                )
+                graph.add(contour)
                 # Remove unnecessary labels
                 # Only the last bottom i-th row has a X axis title
                 if i < inputDimension - 1:
@@ -104,7 +213,6 @@ class CrossCutDistribution:
                 # Only the first left column has a Y axis title
                 if j > 0:
                     graph.setYTitle("")
-                graph.setTitle("Iso-values of conditional PDF")
                 index = 1 + i * inputDimension + j
                 ax = fig.add_subplot(inputDimension, inputDimension, index)
                 _ = otv.View(graph, figure=fig, axes=[ax])
@@ -123,6 +231,9 @@ class CrossCutDistribution:
         Each (i,j)-th graphics of the diagonal of the plot present the
         marginal distribution (X[i], X[j]) for i different from j.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         inputDimension = self.distribution.getDimension()
         fig = pl.figure(figsize=(12, 12))
         _ = fig.suptitle("Iso-values of marginal PDF")
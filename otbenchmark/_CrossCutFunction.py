@@ -3,8 +3,8 @@ Create a drawable cross-cut function.
 """
 
 import openturns as ot
-import pylab as pl
-import openturns.viewer as otv
+import numpy as np
+from ._CrossCutGrid import buildCrossCutBlocks, evaluateCrossCutBlocks
 
 
 class CrossCutFunction:
@@ -21,6 +21,60 @@ class CrossCutFunction:
         """
         self.function = function
         self.referencePoint = referencePoint
+        self.maximumBatchSize = 2**22
+
+    def _computeCrossCutValues(self, interval, numberOfPoints):
+        """
+        Evaluate the function on the grids of all the cross-cuts.
+
+        The 1D grids of all the inputs and the 2D grids of all the pairs
+        of inputs are stacked into one full-dimensional input sample, where
+        the other inputs are set to the reference point.
+        This sample is evaluated in as few calls as possible: a new call
+        is made only when the stacked sample exceeds maximumBatchSize
+        values.
+
+        Parameters
+        ----------
+        interval : ot.Interval
+            The bounds where the function must be evaluated.
+        numberOfPoints : list of 2 ints
+            The number of points in the X and Y axes.
+
+        Returns
+        -------
+        gridsX : list of np.array(numberOfPoints[0])
+            The grid of each input, when it is on the X axis.
+        gridsY : list of np.array(numberOfPoints[1])
+            The grid of each input, when it is on the Y axis.
+        curveValues : list of np.array(numberOfPoints[0])
+            The values of the i-th 1D cross-cut.
+        contourValues : dict of np.array(numberOfPoints[0] * numberOfPoints[1])
+            The values of the (i, j) 2D cross-cut, with i > j.
+            The j-th input is on the X axis, increasing first.
+        """
+        inputDimension = self.function.getInputDimension()
+        lowerBound = np.array(interval.getLowerBound())
+        upperBound = np.array(interval.getUpperBound())
+        nX, nY = numberOfPoints
+        gridsX = [
+            np.linspace(lowerBound[i], upperBound[i], nX) for i in range(inputDimension)
+        ]
+        gridsY = [
+            np.linspace(lowerBound[i], upperBound[i], nY) for i in range(inputDimension)
+        ]
+        blocks = buildCrossCutBlocks(gridsX, gridsY)
+        blockValues = evaluateCrossCutBlocks(
+            self.function, self.referencePoint, blocks, self.maximumBatchSize
+        )
+        curveValues = []
+        contourValues = {}
+        for (indices, _), values in zip(blocks, blockValues):
+            if len(indices) == 1:
+                curveValues.append(values)
+            else:
+                contourValues[indices] = values
+        return gridsX, gridsY, curveValues, contourValues
 
     def draw(self, interval, numberOfPoints=[50] * 2):
         """
@@ -29,6 +83,10 @@ class CrossCutFunction:
         Within the grid, duplicate X and Y axes labels are removed, so that
         the minimum amount of labels are printed, reducing the risk of overlap.
 
+        The function is evaluated on the grids of all the cross-cuts in a
+        single stacked call, which is much faster than one evaluation for
+        each cross-cut when the function is vectorized.
+
         Parameters
         ----------
         interval : ot.Interval
@@ -41,55 +99,49 @@ class CrossCutFunction:
         fig : Matplotlib.figure
             The grid of cross-cuts plots.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         inputDimension = self.function.getInputDimension()
-        lowerBound = interval.getLowerBound()
-        upperBound = interval.getUpperBound()
+        inputDescription = self.function.getInputDescription()
+        outputName = self.function.getOutputDescription()[0]
+        gridsX, gridsY, curveValues, contourValues = self._computeCrossCutValues(
+            interval, numberOfPoints
+        )
         fig = pl.figure(figsize=(12, 12))
         for i in range(inputDimension):
             # Diagonal part :
             # y(xi) where x(j != i) is equal to the reference
-            # Create the cross cut function
-            crossCutIndices = []
-            crossCutReferencePoint = []
-            for k in range(inputDimension):
-                if k != i:
-                    crossCutIndices.append(k)
-                    crossCutReferencePoint.append(self.referencePoint[k])
-            crossCutFunction = ot.ParametricFunction(
-                self.function, crossCutIndices, crossCutReferencePoint
-            )
-            # Create bounds
-            crossCutLowerBound = [lowerBound[i]]
-            crossCutUpperBound = [upperBound[i]]
-            # Draw
-            graph = crossCutFunction.draw(
-                crossCutLowerBound, crossCutUpperBound, numberOfPoints
+            curveData = np.column_stack((gridsX[i], curveValues[i]))
+            graph = ot.Graph(
+                "%s as a function of %s" % (outputName, inputDescription[i]),
+                inputDescription[i],
+                outputName,
+                True,
+                "",
             )
+            graph.add(ot.Curve(curveData))
             index = 1 + i * inputDimension + i
             ax = fig.add_subplot(inputDimension, inputDimension, index)
             _ = otv.View(graph, figure=fig, axes=[ax])
-            # Lower triangle : y(xi, xj) where x(k != i and k != j)
+            # Lower triangle : y(xj, xi) where x(k != i and k != j)
             # is equal to the reference
             for j in range(i):
-                # Draw the cross cut (Xi, Xj), where all other variables
+                # Draw the cross cut (Xj, Xi), where all other variables
                 # are set to the reference value
-                # Create the cross cut function
-                crossCutIndices = []
-                crossCutReferencePoint = []
-                for k in range(inputDimension):
-                    if k != i and k != j:
-                        crossCutIndices.append(k)
-                        crossCutReferencePoint.append(self.referencePoint[k])
-                crossCutFunction = ot.ParametricFunction(
-                    self.function, crossCutIndices, crossCutReferencePoint
+                contour = ot.Contour(
+                    ot.Sample.BuildFromPoint(gridsX[j]),
+                    ot.Sample.BuildFromPoint(gridsY[i]),
+                    ot.Sample.BuildFromPoint(contourValues[(i, j)]),
                 )
-                # Create bounds
-                crossCutLowerBound = [lowerBound[i], lowerBound[j]]
-                crossCutUpperBound = [upperBound[i], upperBound[j]]
-                # Draw
-                graph = crossCutFunction.draw(
-                    crossCutLowerBound, crossCutUpperBound, numberOfPoints
+                graph = ot.Graph(
+                    "Iso-values of limit state function",
+                    inputDescription[j],
+                    inputDescription[i],
+                    True,
+                    "upper left",
                 )
+                graph.add(contour)
                 # Remove unnecessary labels
                 # Only the last bottom i-th row has a X axis title
                 if i < inputDimension - 1:
@@ -97,7 +149,6 @@ class CrossCutFunction:
                 # Only the first left column has a Y axis title
                 if j > 0:
                     graph.setYTitle("")
-                graph.setTitle("Iso-values of limit state function")
                 index = 1 + i * inputDimension + j
                 ax = fig.add_subplot(inputDimension, inputDimension, index)
                 _ = otv.View(graph, figure=fig, axes=[ax])
@@ -0,0 +1,88 @@
+"""
+Evaluate a function on stacked cross-cut grids.
+"""
+
+import numpy as np
+
+
+def buildCrossCutBlocks(gridsX, gridsY):
+    """
+    Create the blocks of the 1D and 2D cross-cuts of all the inputs.
+
+    There is one 1D block for each input i and one 2D block for each pair
+    (i, j) with i > j.
+    In a 2D block, the j-th input is on the X axis, increasing first.
+
+    Parameters
+    ----------
+    gridsX : list of np.array
+        The grid of each input, when it is on the X axis.
+    gridsY : list of np.array
+        The grid of each input, when it is on the Y axis.
+
+    Returns
+    -------
+    blocks : list of (tuple of int, list of np.array)
+        The indices of the inputs of each block and their columns.
+    """
+    blocks = []
+    for i in range(len(gridsX)):
+        blocks.append(((i,), [gridsX[i]]))
+        for j in range(i):
+            x, y = np.meshgrid(gridsX[j], gridsY[i])
+            blocks.append(((i, j), [y.ravel(), x.ravel()]))
+    return blocks
+
+
+def evaluateCrossCutBlocks(function, referencePoint, blocks, maximumBatchSize):
+    """
+    Evaluate a function on the stacked blocks of several cross-cuts.
+
+    The blocks are stacked into one full-dimensional input sample, where
+    the inputs which are not in a block are set to the reference point.
+    This sample is evaluated in as few calls as possible: a new call is
+    made only when the stacked sample exceeds maximumBatchSize values, so
+    that only one batch of the input sample is in memory at a time.
+
+    Parameters
+    ----------
+    function : callable
+        The function, which takes a np.array(size, dimension) and returns
+        a sample whose first column is used.
+    referencePoint : sequence of floats
+        The value of the inputs which are not in a block.
+    blocks : list of (tuple of int, list of np.array)
+        The indices of the inputs of each block and their columns.
+    maximumBatchSize : int
+        The maximum number of values of the input sample of a call.
+
+    Returns
+    -------
+    blockValues : list of np.array
+        The values of the function on each block.
+    """
+    referencePoint = np.array(referencePoint)
+    dimension = len(referencePoint)
+    sizes = [len(columns[0]) for _, columns in blocks]
+    offsets = np.concatenate(([0], np.cumsum(sizes))).astype(int)
+    totalSize = offsets[-1]
+    batchSize = max(1, maximumBatchSize // dimension)
+    outputValues = np.empty(totalSize)
+    for start in range(0, totalSize, batchSize):
+        stop = min(start + batchSize, totalSize)
+        inputSample = np.tile(referencePoint, (stop - start, 1))
+        for k, (indices, columns) in enumerate(blocks):
+            # The rows of the k-th block which are in the batch
+            first = max(offsets[k], start)
+            last = min(offsets[k + 1], stop)
+            if first >= last:
+                continue
+            for index, column in zip(indices, columns):
+                inputSample[first - start : last - start, index] = column[
+                    first - offsets[k] : last - offsets[k]
+                ]
+        outputValues[start:stop] = np.asarray(function(inputSample))[:, 0]
+    blockValues = [
+        outputValues[offsets[k] : offsets[k + 1]] for k in range(len(blocks))
+    ]
+    return blockValues
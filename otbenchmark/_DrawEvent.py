@@ -3,8 +3,8 @@ Static methods to plot reliability problems.
 """
 
 import openturns as ot
-import pylab as pl
-import openturns.viewer as otv
+import numpy as np
+from ._CrossCutGrid import evaluateCrossCutBlocks
 
 
 def LinearSample(xmin, xmax, npoints=100):
@@ -37,6 +37,43 @@ def LinearSample(xmin, xmax, npoints=100):
     return vertices
 
 
+def IsInsideEvent(operator, values, threshold):
+    """
+    Returns a mask of the values which are inside an event.
+
+    The comparison is vectorized for the comparison operators of OpenTURNS.
+    Any other operator is applied to each value.
+
+    Parameters
+    ----------
+    operator : ot.ComparisonOperator
+        The comparison operator of the event.
+    values : np.array(size)
+        The values of the output of the limit state function.
+    threshold : float
+        The threshold of the event.
+
+    Returns
+    -------
+    mask : np.array(size) of bool
+        True if the value is inside the event.
+    """
+    comparisons = {
+        "Less": np.less,
+        "LessOrEqual": np.less_equal,
+        "Greater": np.greater,
+        "GreaterOrEqual": np.greater_equal,
+        "Equal": np.equal,
+    }
+    values = np.asarray(values)
+    className = operator.getImplementation().getClassName()
+    if className in comparisons:
+        mask = comparisons[className](values, threshold)
+    else:
+        mask = np.array([operator(y, threshold) for y in values], dtype=bool)
+    return mask
+
+
 class DrawEvent:
     def __init__(
         self,
@@ -45,6 +82,7 @@ class DrawEvent:
         outsideEventPointColor="darkseagreen3",
         insideEventFillColor="lightsalmon1",
         outsideEventFillColor="darkseagreen1",
+        maximumCloudSize=10000,
     ):
         """
         Create an event with draw services.
@@ -65,6 +103,10 @@ class DrawEvent:
             The color of the filled domains inside the event.
         outsideEventFillColor : a string
             The color of the filled domains outside of the event.
+        maximumCloudSize : int
+            The maximum number of points drawn in each of the inside and
+            outside clouds.
+            Larger clouds are decimated with a regular stride.
         """
         #
         g = event.getFunction()
@@ -79,8 +121,178 @@ class DrawEvent:
         self.outsideEventPointColor = outsideEventPointColor
         self.insideEventFillColor = insideEventFillColor
         self.outsideEventFillColor = outsideEventFillColor
+        self.maximumCloudSize = maximumCloudSize
         self.g = event.getFunction()
         self.inputDimension = self.g.getInputDimension()
+        # The values of the function on the grid of each cross cut
+        self.crossCutGridCache = {}
+        self.maximumBatchSize = 2**22
+        return None
+
+    def _getCrossCutGridKey(self, bounds, i, j, nX, nY):
+        """
+        Returns the key of a cross cut grid in the cache.
+
+        Parameters
+        ----------
+        bounds: an ot.Interval
+            The lower and upper bounds of the cross-cut interval.
+        i : int
+            The index of the first marginal of the cross-cut.
+        j : int
+            The index of the second marginal of the cross-cut.
+        nX : an int
+            The number of interior points in the X axis.
+        nY : an int
+            The number of interior points in the Y axis.
+
+        Returns
+        -------
+        key : tuple
+            The key.
+        """
+        lowerBound = bounds.getLowerBound()
+        upperBound = bounds.getUpperBound()
+        key = (i, j, nX, nY) + tuple(lowerBound) + tuple(upperBound)
+        return key
+
+    def _getCrossCutGridVertices(self, bounds, nX, nY):
+        """
+        Returns the vertices of a cross cut grid.
+
+        The grid has the same points as ot.Box([nX, nY], bounds), that is
+        (nX + 2) * (nY + 2) points, with the X coordinate increasing first.
+
+        Parameters
+        ----------
+        bounds: an ot.Interval
+            The lower and upper bounds of the cross-cut interval.
+        nX : an int
+            The number of interior points in the X axis.
+        nY : an int
+            The number of interior points in the Y axis.
+
+        Returns
+        -------
+        vertices : ot.Sample((nX + 2) * (nY + 2), 2)
+            The vertices.
+        """
+        mesher = ot.IntervalMesher([nX + 1, nY + 1])
+        vertices = mesher.build(bounds).getVertices()
+        return vertices
+
+    def computeCrossCutGrids(self, bounds, nX=50, nY=50, pairs=None):
+        """
+        Evaluate the function on the grids of several cross cuts.
+
+        The grids of all the pairs which are not in the cache are
+        stacked into full-dimensional input samples, where the frozen
+        variables are set to the mean point.
+        These samples are evaluated in as few calls as possible: a new call
+        is made only when the stacked sample exceeds maximumBatchSize
+        values.
+        The results are stored in the cache.
+
+        Parameters
+        ----------
+        bounds: an ot.Interval
+            The lower and upper bounds, with the dimension of the input.
+        nX : an int
+            The number of interior points in the X axis.
+        nY : an int
+            The number of interior points in the Y axis.
+        pairs : list of (int, int), optional
+            The (i, j) pairs of the cross cuts, with i < j.
+            The default is None, which uses all the pairs.
+
+        Returns
+        -------
+        None.
+        """
+        if bounds.getDimension() != self.inputDimension:
+            raise ValueError(
+                "The input dimension of the bounds "
+                "is equal to %d but should be %d."
+                % (bounds.getDimension(), self.inputDimension)
+            )
+        if pairs is None:
+            pairs = [
+                (i, j)
+                for i in range(self.inputDimension)
+                for j in range(i + 1, self.inputDimension)
+            ]
+        lowerBound = bounds.getLowerBound()
+        upperBound = bounds.getUpperBound()
+        inputVector = self.event.getAntecedent()
+        mean = np.array(inputVector.getDistribution().getMean())
+        blocks = []
+        keys = []
+        for i, j in pairs:
+            crossCutBounds = ot.Interval(
+                [lowerBound[i], lowerBound[j]], [upperBound[i], upperBound[j]]
+            )
+            key = self._getCrossCutGridKey(crossCutBounds, i, j, nX, nY)
+            if key not in self.crossCutGridCache:
+                vertices = self._getCrossCutGridVertices(crossCutBounds, nX, nY)
+                array = np.array(vertices)
+                blocks.append(((i, j), [array[:, 0], array[:, 1]]))
+                keys.append((key, vertices))
+        blockValues = evaluateCrossCutBlocks(
+            self.g, mean, blocks, self.maximumBatchSize
+        )
+        for (key, vertices), values in zip(keys, blockValues):
+            self.crossCutGridCache[key] = (vertices, values)
+        return None
+
+    def computeCrossCutGrid(self, bounds, i=0, j=1, nX=50, nY=50):
+        """
+        Returns the values of the function on the grid of a cross cut.
+
+        The grid has the same points as ot.Box([nX, nY], bounds).
+        The values are computed only if they are not already in the cache.
+
+        Parameters
+        ----------
+        bounds: an ot.Interval
+            The lower and upper bounds of the cross-cut interval.
+        i : int
+            The index of the first marginal of the cross-cut.
+        j : int
+            The index of the second marginal of the cross-cut.
+        nX : an int
+            The number of interior points in the X axis.
+        nY : an int
+            The number of interior points in the Y axis.
+
+        Returns
+        -------
+        vertices : ot.Sample((nX + 2) * (nY + 2), 2)
+            The points of the grid.
+        outputValues : np.array((nX + 2) * (nY + 2))
+            The values of the function.
+        """
+        if bounds.getDimension() != 2:
+            raise ValueError(
+                "The input dimension of the bounds "
+                "is equal to %d but should be 2." % (bounds.getDimension())
+            )
+        key = self._getCrossCutGridKey(bounds, i, j, nX, nY)
+        if key not in self.crossCutGridCache:
+            vertices = self._getCrossCutGridVertices(bounds, nX, nY)
+            crosscutFunction = self.buildCrossCutFunction(i, j)
+            outputValues = np.array(crosscutFunction(vertices))[:, 0]
+            self.crossCutGridCache[key] = (vertices, outputValues)
+        return self.crossCutGridCache[key]
+
+    def clearCrossCutGridCache(self):
+        """
+        Remove all the cross cut grids from the cache.
+
+        Returns
+        -------
+        None.
+        """
+        self.crossCutGridCache = {}
         return None
 
     def drawLimitState(self, bounds, nX=50, nY=50):
@@ -103,6 +315,9 @@ class DrawEvent:
         fig : matplotlib.figure
             The plot.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         if bounds.getDimension() != self.inputDimension:
             raise ValueError(
                 "The input dimension of the bounds "
@@ -116,6 +331,8 @@ class DrawEvent:
             graph = self.drawLimitStateCrossCut(bounds, 0, 1, nX, nY)
             _ = otv.View(graph, figure=fig)
         else:
+            # Evaluate the grids of all the cross cuts at once
+            self.computeCrossCutGrids(bounds, nX, nY)
             lowerBound = bounds.getLowerBound()
             upperBound = bounds.getUpperBound()
             for i in range(self.inputDimension):
@@ -161,10 +378,8 @@ class DrawEvent:
         #
         threshold = self.event.getThreshold()
         description = self.g.getInputDescription()
-        boxExperiment = ot.Box([nX, nY], bounds)
-        reducedInputSample = boxExperiment.generate()
-        crosscutFunction = self.buildCrossCutFunction(i, j)
-        outputSample = crosscutFunction(reducedInputSample)
+        _, outputValues = self.computeCrossCutGrid(bounds, i, j, nX, nY)
+        outputSample = ot.Sample.BuildFromPoint(outputValues)
         #
         graph = ot.Graph(
             "Limit state surface", description[i], description[j], True, ""
@@ -200,6 +415,9 @@ class DrawEvent:
         fig : Matplotlib.figure
             The plot.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         fig = pl.figure(figsize=(12, 12))
         _ = fig.suptitle("Limit state")
         if self.inputDimension == 2:
@@ -249,35 +467,10 @@ class DrawEvent:
         inputSample = marginalDistribution.getSample(sampleSize)
         crosscutFunction = self.buildCrossCutFunction(i, j)
         outputSample = crosscutFunction(inputSample)
-        threshold = self.event.getThreshold()
-        operator = self.event.getOperator()
-        #
-        sampleSize = outputSample.getSize()
-        insideIndices = []
-        outsideIndices = []
-        for k in range(sampleSize):
-            y = outputSample[k, 0]
-            isInside = operator(y, threshold)
-            if isInside:
-                insideIndices.append(k)
-            else:
-                outsideIndices.append(k)
-        #
-        insideSample = ot.Sample([inputSample[k] for k in insideIndices])
-        outsideSample = ot.Sample([inputSample[k] for k in outsideIndices])
-        #
         description = self.g.getInputDescription()
-        title = "Points X s.t. g(X) %s %s" % (operator, threshold)
-        graph = ot.Graph(title, description[i], description[j], True, "")
-        if len(insideIndices) > 0:
-            cloud = ot.Cloud(insideSample, self.insideEventPointColor, "fsquare", "In")
-            graph.add(cloud)
-        if len(outsideIndices) > 0:
-            cloud = ot.Cloud(
-                outsideSample, self.outsideEventPointColor, "fsquare", "Out"
-            )
-            graph.add(cloud)
-        graph.setLegendPosition("topright")
+        graph = self._drawClassifiedSample(
+            inputSample, outputSample, description[i], description[j]
+        )
         return graph
 
     def drawInputOutputSample(self, inputSample, outputSample):
@@ -300,35 +493,61 @@ class DrawEvent:
                 "The input dimension of the input sample "
                 "is equal to %d but should be 2." % (inputSample.getDimension())
             )
-        #
+        description = self.g.getInputDescription()
+        graph = self._drawClassifiedSample(
+            inputSample, outputSample, description[0], description[1]
+        )
+        return graph
+
+    def _drawClassifiedSample(self, inputSample, outputSample, xTitle, yTitle):
+        """
+        Draw the points inside and outside the event with two clouds.
+
+        The points are classified with a mask computed on the whole output
+        sample at once.
+        If a cloud has more than maximumCloudSize points, it is decimated
+        with a regular stride, so that rare points inside the event are
+        kept while the large cloud is thinned.
+        The legend then shows the stride.
+
+        Parameters
+        ----------
+        inputSample: an ot.Sample
+            The input 2D sample.
+        outputSample: an ot.Sample
+            The output 1D sample.
+        xTitle : str
+            The title of the X axis.
+        yTitle : str
+            The title of the Y axis.
+
+        Returns
+        -------
+        graph : ot.Graph
+            The plot.
+        """
         threshold = self.event.getThreshold()
-        g = self.event.getFunction()
         operator = self.event.getOperator()
+        # Views of the samples, without copy
+        inputArray = np.asarray(inputSample)
+        outputValues = np.asarray(outputSample)[:, 0]
+        isInside = IsInsideEvent(operator, outputValues, threshold)
         #
-        sampleSize = outputSample.getSize()
-        insideIndices = []
-        outsideIndices = []
-        for i in range(sampleSize):
-            y = outputSample[i, 0]
-            isInside = operator(y, threshold)
-            if isInside:
-                insideIndices.append(i)
-            else:
-                outsideIndices.append(i)
-        #
-        insideSample = ot.Sample([inputSample[i] for i in insideIndices])
-        outsideSample = ot.Sample([inputSample[i] for i in outsideIndices])
-        #
-        description = g.getInputDescription()
         title = "Points X s.t. g(X) %s %s" % (operator, threshold)
-        graph = ot.Graph(title, description[0], description[1], True, "")
-        if len(insideIndices) > 0:
-            cloud = ot.Cloud(insideSample, self.insideEventPointColor, "fsquare", "In")
-            graph.add(cloud)
-        if len(outsideIndices) > 0:
-            cloud = ot.Cloud(
-                outsideSample, self.outsideEventPointColor, "fsquare", "Out"
-            )
+        graph = ot.Graph(title, xTitle, yTitle, True, "")
+        for mask, color, legend in [
+            (isInside, self.insideEventPointColor, "In"),
+            (~isInside, self.outsideEventPointColor, "Out"),
+        ]:
+            indices = np.flatnonzero(mask)
+            numberOfPoints = indices.size
+            if numberOfPoints == 0:
+                continue
+            stride = -(-numberOfPoints // self.maximumCloudSize)
+            if stride > 1:
+                indices = indices[::stride]
+                legend = "%s (1/%d)" % (legend, stride)
+            cloud = ot.Cloud(inputArray[indices], color, "fsquare", legend)
             graph.add(cloud)
         graph.setLegendPosition("topright")
         return graph
@@ -349,6 +568,9 @@ class DrawEvent:
         fig : Matplotlib.figure
             The plot.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         if bounds.getDimension() != self.inputDimension:
             raise ValueError(
                 "The input dimension of the bounds "
@@ -361,6 +583,8 @@ class DrawEvent:
             graph = self.fillEventCrossCut(bounds, 0, 1, nX, nY)
             _ = otv.View(graph, figure=fig)
         else:
+            # Evaluate the grids of all the cross cuts at once
+            self.computeCrossCutGrids(bounds, nX - 1, nY - 1)
             lowerBound = bounds.getLowerBound()
             upperBound = bounds.getUpperBound()
             for i in range(self.inputDimension):
@@ -404,58 +628,62 @@ class DrawEvent:
                 "is equal to %d but should be 2." % (bounds.getDimension())
             )
         #
-        threshold = self.event.getThreshold()
-        operator = self.event.getOperator()
         # Define the number of intervals in each direction of the box
         myIndices = [nX, nY]
         myMesher = ot.IntervalMesher(myIndices)
         mesh = myMesher.build(bounds)
-        #
-        simplices = mesh.getSimplices()
-        vertices = mesh.getVertices()
-        numberOfSimplices = mesh.getSimplicesNumber()
-        #
-        crosscutFunction = self.buildCrossCutFunction(i, j)
-        polyDataInside = []
-        polyDataOutside = []
-        for i in range(numberOfSimplices):
-            simplex = simplices[i]
-            corners = [
-                vertices[simplex[0]],
-                vertices[simplex[1]],
-                vertices[simplex[2]],
-                vertices[simplex[2]],
-            ]
-            sampleInput = ot.Sample(corners)
-            sampleOutput = crosscutFunction(sampleInput)
-            mean = sampleOutput.computeMean()[0]
-            if operator(mean, threshold):
-                polyDataInside.append(corners)
-            else:
-                polyDataOutside.append(corners)
-
-        # Create PolygonArray from list of polygons inside event
-        def CreatePolygonArray(polyData, color):
-            numberOfPolygons = len(polyData)
-            polygonList = [
-                ot.Polygon(polyData[i], color, color) for i in range(numberOfPolygons)
-            ]
-            polygonArray = ot.PolygonArray(polygonList)
-            return polygonArray
+        simplices = np.array(mesh.getSimplices())
+        # The vertices of the mesh are the points of the cross cut grid
+        # with nX - 1 and nY - 1 interior points
+        vertices, outputValues = self.computeCrossCutGrid(bounds, i, j, nX - 1, nY - 1)
+        graph = self._fillEventSimplices(vertices, simplices, outputValues)
+        return graph
+
+    def _fillEventSimplices(self, vertices, simplices, outputValues):
+        """
+        Fill the simplices inside and outside an event with colors.
+
+        Each simplex is closed by repeating its last vertex.
+        A simplex is inside the event if the mean of the function at
+        its four corners is inside the event.
+
+        Parameters
+        ----------
+        vertices : ot.Sample(numberOfVertices, 2)
+            The vertices of the mesh.
+        simplices : np.array(numberOfSimplices, 3)
+            The indices of the vertices of each simplex.
+        outputValues : np.array(numberOfVertices)
+            The value of the function at each vertex.
+
+        Returns
+        -------
+        graph : ot.Graph
+            The plot.
+        """
+        threshold = self.event.getThreshold()
+        operator = self.event.getOperator()
+        corners = simplices[:, [0, 1, 2, 2]]
+        means = np.mean(outputValues[corners], axis=1)
+        isInside = IsInsideEvent(operator, means, threshold)
+        coordinates = np.array(vertices)[corners]
 
-        polygonArrayInside = CreatePolygonArray(
-            polyDataInside, self.insideEventFillColor
-        )
-        polygonArrayOutside = CreatePolygonArray(
-            polyDataOutside, self.outsideEventFillColor
-        )
         #
         description = self.g.getInputDescription()
         title = "Domain where g(x) %s %s" % (operator, threshold)
         graph = ot.Graph(title, description[0], description[1], True, "topright")
-        graph.add(polygonArrayInside)
-        graph.add(polygonArrayOutside)
-        graph.setLegends(["In", "Out"])
+        # Create PolygonArray from the corners of the polygons.
+        # Empty arrays are not added, since they cannot be viewed.
+        for polyData, color, legend in [
+            (coordinates[isInside], self.insideEventFillColor, "In"),
+            (coordinates[~isInside], self.outsideEventFillColor, "Out"),
+        ]:
+            numberOfPolygons = polyData.shape[0]
+            if numberOfPolygons > 0:
+                polygonArray = ot.PolygonArray(
+                    polyData.reshape(-1, 2), 4, [color] * numberOfPolygons, legend
+                )
+                graph.add(polygonArray)
         return graph
 
     def buildCrossCutFunction(self, i, j):
@@ -508,6 +736,13 @@ class DrawEvent:
         """
         Draw the event, superimposing the graphics.
 
+        The function is evaluated once on the grids of all the cross cuts,
+        which are stored in the cache for later redraws.
+        The grid of each cross cut has nX and nY cells in the X and Y axes,
+        i.e. (nX + 1) * (nY + 1) points, whatever the flags: the filled
+        event uses these cells and the limit state is the contour of the
+        values at these points.
+
         Parameters
         ----------
         sampleSize: int
@@ -515,9 +750,9 @@ class DrawEvent:
         bounds: an ot.Interval
             The lower and upper bounds of the cross-cut interval.
         nX : int
-            The number of points in the X axis.
+            The number of cells in the X axis.
         nY : int
-            The number of points in the Y axis.
+            The number of cells in the Y axis.
         drawLimitState : bool
             If True, draw the limit state surface.
         drawSample : bool
@@ -530,6 +765,9 @@ class DrawEvent:
         fig : Matplotlib.figure
             The plot.
         """
+        import pylab as pl
+        import openturns.viewer as otv
+
         if not drawLimitState and not drawSample and not fillEvent:
             raise ValueError("At least one boolean flag must be True.")
         if bounds.getDimension() != self.inputDimension:
@@ -544,6 +782,10 @@ class DrawEvent:
             graph = self.fillEventCrossCut(bounds, 0, 1, nX, nY)
             _ = otv.View(graph, figure=fig)
         else:
+            # Evaluate the grids of all the cross cuts at once: a grid with
+            # nX - 1 and nY - 1 interior points has nX and nY cells
+            if drawLimitState or fillEvent:
+                self.computeCrossCutGrids(bounds, nX - 1, nY - 1)
             lowerBound = bounds.getLowerBound()
             upperBound = bounds.getUpperBound()
             inputDescription = self.g.getInputDescription()
@@ -559,7 +801,9 @@ class DrawEvent:
                         plot = self.fillEventCrossCut(crossCutBounds, i, j, nX, nY)
                         graph.add(plot)
                     if drawLimitState:
-                        plot = self.drawLimitStateCrossCut(crossCutBounds, i, j, nX, nY)
+                        plot = self.drawLimitStateCrossCut(
+                            crossCutBounds, i, j, nX - 1, nY - 1
+                        )
                         graph.add(plot)
                     if drawSample:
                         plot = self.drawSampleCrossCut(sampleSize, i, j)
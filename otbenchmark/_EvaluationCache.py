@@ -0,0 +1,305 @@
+"""
+Cache the evaluations of a function, with a least recently used eviction.
+"""
+
+from collections import OrderedDict
+import numpy as np
+from ._FunctionWrapper import SharedObject, wrapEvaluation
+
+
+class _CachedFunction(SharedObject):
+    """The callable of a function whose evaluations are cached."""
+
+    def __init__(self, cache, function):
+        self.cache = cache
+        self.function = function
+
+    def __call__(self, inputSample):
+        return self.cache.evaluate(self.function, inputSample)
+
+
+class EvaluationCache(SharedObject):
+    def __init__(self, maximumSize=100000):
+        """
+        Cache the evaluations of a function.
+
+        The points are compared exactly, with the bytes of their values.
+        When the cache is full, the least recently used point is removed.
+
+        A cache is shared by all the methods run on a problem, so that the
+        points evaluated by a method, e.g. the mean of the distribution or
+        the design point, are not evaluated again by the next methods.
+        A cache must be used with one function only: it is bound to the
+        function of the first call to wrapFunction(), and the other
+        functions are rejected, except the copies of this function.
+
+        The points found in the cache are not evaluated: they are not
+        counted in the number of function evaluations of a
+        ReliabilityBenchmarkResult, but in its numberOfCacheHits attribute.
+
+        Parameters
+        ----------
+        maximumSize : int, optional
+            The maximum number of points in the cache.
+            The default is 100000.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import openturns as ot
+        >>> import otbenchmark as otb
+        >>> problem = otb.ReliabilityProblem8()
+        >>> cache = otb.EvaluationCache()
+        >>> metaAlgorithm = otb.ReliabilityBenchmarkMetaAlgorithm(problem, cache=cache)
+        >>> resultFORM = metaAlgorithm.runFORM(ot.AbdoRackwitz())
+        >>> resultSORM = metaAlgorithm.runSORM(ot.AbdoRackwitz())
+        >>> cache.save("RP8.npz")
+        """
+        if maximumSize < 1:
+            raise ValueError(
+                "The maximum size is %d but must be positive" % (maximumSize)
+            )
+        self.maximumSize = maximumSize
+        # values[x.tobytes()] = y
+        self.values = OrderedDict()
+        self.numberOfHits = 0
+        self.numberOfMisses = 0
+        self.numberOfEvictions = 0
+        # The identifier of the function of the cache, set by wrapFunction()
+        # The copies of an ot.Function share its identifier
+        self.functionId = None
+        self.inputDimension = None
+        self.outputDimension = None
+
+    def _setDimensions(self, inputDimension, outputDimension):
+        """
+        Set the dimensions of the points of the cache, or check them.
+
+        Parameters
+        ----------
+        inputDimension : int
+            The input dimension.
+        outputDimension : int
+            The output dimension.
+
+        Returns
+        -------
+        None.
+        """
+        if self.inputDimension is not None and (
+            inputDimension != self.inputDimension
+            or outputDimension != self.outputDimension
+        ):
+            raise ValueError(
+                "The input and output dimensions are %d and %d but the cache "
+                "contains points with dimensions %d and %d"
+                % (
+                    inputDimension,
+                    outputDimension,
+                    self.inputDimension,
+                    self.outputDimension,
+                )
+            )
+        self.inputDimension = inputDimension
+        self.outputDimension = outputDimension
+        return None
+
+    def _addValue(self, key, value):
+        """
+        Add a value to the cache, and remove the least recently used values
+        if the cache is full.
+
+        Parameters
+        ----------
+        key : bytes
+            The bytes of the point.
+        value : np.array(outputDimension)
+            The value of the function.
+
+        Returns
+        -------
+        None.
+        """
+        self.values[key] = value
+        self.values.move_to_end(key)
+        while len(self.values) > self.maximumSize:
+            self.values.popitem(last=False)
+            self.numberOfEvictions += 1
+        return None
+
+    def evaluate(self, function, inputSample):
+        """
+        Evaluate a function on a sample, with the cache.
+
+        The points which are not in the cache are evaluated by one call of
+        the function, without duplicates.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function which evaluates the points which are not in the
+            cache.
+            It must compute the function of the cache.
+        inputSample : ot.Sample(size, inputDimension)
+            The input sample.
+
+        Returns
+        -------
+        outputArray : np.array(size, outputDimension)
+            The output sample.
+        """
+        inputArray = np.asarray(inputSample, dtype=float)
+        size = inputArray.shape[0]
+        keys = [row.tobytes() for row in inputArray]
+        outputArray = np.empty((size, function.getOutputDimension()))
+        missingRows = OrderedDict()
+        for k in range(size):
+            if keys[k] in self.values:
+                self.values.move_to_end(keys[k])
+                outputArray[k] = self.values[keys[k]]
+                self.numberOfHits += 1
+            elif keys[k] in missingRows:
+                missingRows[keys[k]].append(k)
+                self.numberOfHits += 1
+            else:
+                missingRows[keys[k]] = [k]
+        if len(missingRows) > 0:
+            firstRows = [rows[0] for rows in missingRows.values()]
+            missingOutput = np.asarray(function(inputArray[firstRows]))
+            self.numberOfMisses += len(firstRows)
+            for (key, rows), value in zip(missingRows.items(), missingOutput):
+                outputArray[rows] = value
+                self._addValue(key, value.copy())
+        return outputArray
+
+    def wrapFunction(self, function, evaluatedFunction=None):
+        """
+        Create a function whose evaluations are cached.
+
+        The first call binds the cache to the function.
+        The next calls must use the same function, or one of its copies.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function.
+        evaluatedFunction : ot.Function, optional
+            The function which evaluates the points which are not in the
+            cache, e.g. the function of an EvaluationScheduler.
+            It must compute the same values as function.
+            The default is None, which uses function.
+
+        Returns
+        -------
+        cachedFunction : ot.Function
+            The function whose evaluations are cached.
+        """
+        if self.functionId is None:
+            self._setDimensions(
+                function.getInputDimension(), function.getOutputDimension()
+            )
+            self.functionId = function.getId()
+        elif function.getId() != self.functionId:
+            raise ValueError(
+                "The cache is bound to another function: "
+                "a cache must be used with one function only"
+            )
+        if evaluatedFunction is None:
+            evaluatedFunction = function
+        cachedFunction = wrapEvaluation(
+            evaluatedFunction, _CachedFunction(self, evaluatedFunction)
+        )
+        return cachedFunction
+
+    def getSize(self):
+        """
+        Returns the number of points in the cache.
+
+        Returns
+        -------
+        size : int
+            The number of points.
+        """
+        size = len(self.values)
+        return size
+
+    def getHitRate(self):
+        """
+        Returns the fraction of the points found in the cache.
+
+        Returns
+        -------
+        hitRate : float
+            The number of hits divided by the number of requested points.
+        """
+        numberOfRequests = self.numberOfHits + self.numberOfMisses
+        if numberOfRequests == 0:
+            return 0.0
+        hitRate = self.numberOfHits / numberOfRequests
+        return hitRate
+
+    def clear(self):
+        """
+        Remove all the points, reset the statistics and unbind the function.
+
+        Returns
+        -------
+        None.
+        """
+        self.values.clear()
+        self.numberOfHits = 0
+        self.numberOfMisses = 0
+        self.numberOfEvictions = 0
+        self.functionId = None
+        self.inputDimension = None
+        self.outputDimension = None
+        return None
+
+    def save(self, fileName):
+        """
+        Save the points of the cache into a NumPy .npz file.
+
+        The points are saved from the least to the most recently used.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file.
+
+        Returns
+        -------
+        None.
+        """
+        inputArray = np.array([np.frombuffer(key) for key in self.values.keys()])
+        outputArray = np.array(list(self.values.values()))
+        np.savez(fileName, inputArray=inputArray, outputArray=outputArray)
+        return None
+
+    def load(self, fileName):
+        """
+        Add the points of a NumPy .npz file into the cache.
+
+        The input and output dimensions of the points must be the
+        dimensions of the function of the cache.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file created by save().
+
+        Returns
+        -------
+        None.
+        """
+        with np.load(fileName) as data:
+            inputArray = data["inputArray"]
+            outputArray = data["outputArray"]
+        if inputArray.shape[0] == 0:
+            return None
+        self._setDimensions(inputArray.shape[1], outputArray.shape[1])
+        for x, y in zip(inputArray, outputArray):
+            self._addValue(np.ascontiguousarray(x, dtype=float).tobytes(), y)
+        return None
@@ -0,0 +1,313 @@
+"""
+Profile the evaluations of a function during the run of an algorithm.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+import numpy as np
+from ._FunctionWrapper import SharedObject, wrapEvaluation
+
+
+class _ProfiledFunction(SharedObject):
+    """The callable of a function whose evaluations are profiled."""
+
+    def __init__(self, profiler, function):
+        self.profiler = profiler
+        self.function = function
+
+    def __call__(self, inputSample):
+        startTime = time.perf_counter()
+        outputSample = self.function(inputSample)
+        duration = time.perf_counter() - startTime
+        self.profiler._addCall(len(inputSample), duration)
+        return outputSample
+
+
+class EvaluationProfiler(SharedObject):
+    @staticmethod
+    def GetCaptureMethods():
+        """
+        Get the available methods to profile the Python code.
+
+        Returns
+        -------
+        methods_list : list of str
+            The list of available methods.
+        """
+        methods_list = ["cProfile", "pyinstrument"]
+        return methods_list
+
+    def __init__(self, captureMethod=None, numberOfStatistics=20):
+        """
+        Profile the evaluations of a function during the run of an algorithm.
+
+        The profiler records the size and the duration of each call of the
+        function, i.e. of each block of points evaluated by the algorithm.
+        The run is split into phases, e.g. the design point search, the
+        sampling and the post-processing: the time inside the function and
+        the time outside the function are computed for each phase.
+
+        The Python code of the whole run can also be profiled by cProfile
+        or pyinstrument, if it is installed.
+
+        Parameters
+        ----------
+        captureMethod : str, optional
+            The method to profile the Python code, "cProfile" or
+            "pyinstrument".
+            The default is None, which does not profile the Python code.
+        numberOfStatistics : int, optional
+            The number of functions in the report of cProfile.
+            The default is 20.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> problem = otb.ReliabilityProblem8()
+        >>> profiler = otb.EvaluationProfiler()
+        >>> metaAlgorithm = otb.ReliabilityBenchmarkMetaAlgorithm(
+        ...     problem, profiler=profiler
+        ... )
+        >>> result = metaAlgorithm.runMonteCarlo()
+        >>> print(profiler.summary(result.evaluationProfile))
+        """
+        if (
+            captureMethod is not None
+            and captureMethod not in EvaluationProfiler.GetCaptureMethods()
+        ):
+            raise ValueError("Unknown value of captureMethod %s" % (captureMethod))
+        self.captureMethod = captureMethod
+        self.numberOfStatistics = numberOfStatistics
+        self.codeProfiler = None
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the recorded calls.
+
+        Returns
+        -------
+        None.
+        """
+        # For each call: phase, size, duration
+        self.phases = []
+        self.sizes = []
+        self.durations = []
+        # For each phase: name, start time, stop time
+        self.phaseTimes = []
+        self.currentPhase = None
+        return None
+
+    def _addCall(self, size, duration):
+        """
+        Record a call of the function.
+
+        Parameters
+        ----------
+        size : int
+            The number of points.
+        duration : float
+            The duration of the call, in seconds.
+
+        Returns
+        -------
+        None.
+        """
+        self.phases.append(self.currentPhase)
+        self.sizes.append(size)
+        self.durations.append(duration)
+        return None
+
+    def wrapFunction(self, function):
+        """
+        Create a function whose evaluations are profiled.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function.
+
+        Returns
+        -------
+        profiledFunction : ot.Function
+            The function whose evaluations are profiled.
+        """
+        profiledFunction = wrapEvaluation(function, _ProfiledFunction(self, function))
+        return profiledFunction
+
+    def start(self, phase):
+        """
+        Start the profile of a run.
+
+        The recorded calls are forgotten.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the first phase.
+
+        Returns
+        -------
+        None.
+        """
+        self.reset()
+        if self.captureMethod == "cProfile":
+            self.codeProfiler = cProfile.Profile()
+            self.codeProfiler.enable()
+        elif self.captureMethod == "pyinstrument":
+            import pyinstrument
+
+            self.codeProfiler = pyinstrument.Profiler()
+            self.codeProfiler.start()
+        self.setPhase(phase)
+        return None
+
+    def setPhase(self, phase):
+        """
+        Start a new phase of the run.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the phase.
+
+        Returns
+        -------
+        None.
+        """
+        currentTime = time.perf_counter()
+        if self.currentPhase is not None:
+            self.phaseTimes[-1][2] = currentTime
+        self.phaseTimes.append([phase, currentTime, None])
+        self.currentPhase = phase
+        return None
+
+    def stop(self):
+        """
+        Stop the profile of a run and compute its statistics.
+
+        Returns
+        -------
+        profile : dict
+            The profile, with the keys:
+
+            * "numberOfCalls": the number of calls of the function,
+            * "numberOfEvaluations": the number of points,
+            * "batchSizes": the number of calls for each number of points,
+            * "timeInside", "timeOutside", "time": the time inside the
+              function, outside the function and the total time, in seconds,
+            * "latencyHistogram": the number of calls whose duration is in
+              each bin, and the edges of the bins, in seconds,
+            * "phases": the number of calls, the number of points and the
+              times of each phase,
+            * "codeProfile": the report of cProfile or pyinstrument, or None.
+        """
+        currentTime = time.perf_counter()
+        self.phaseTimes[-1][2] = currentTime
+        self.currentPhase = None
+        codeProfile = None
+        if self.captureMethod == "cProfile":
+            self.codeProfiler.disable()
+            stream = io.StringIO()
+            statistics = pstats.Stats(self.codeProfiler, stream=stream)
+            statistics.sort_stats("cumulative").print_stats(self.numberOfStatistics)
+            codeProfile = stream.getvalue()
+        elif self.captureMethod == "pyinstrument":
+            self.codeProfiler.stop()
+            codeProfile = self.codeProfiler.output_text()
+        self.codeProfiler = None
+        phases = np.array(self.phases, dtype=object)
+        sizes = np.array(self.sizes, dtype=int)
+        durations = np.array(self.durations, dtype=float)
+        profile = EvaluationProfiler._computeStatistics(sizes, durations)
+        profile["time"] = currentTime - self.phaseTimes[0][1]
+        profile["timeOutside"] = profile["time"] - profile["timeInside"]
+        profile["phases"] = {}
+        for phase, startTime, stopTime in self.phaseTimes:
+            isInPhase = phases == phase
+            statistics = EvaluationProfiler._computeStatistics(
+                sizes[isInPhase], durations[isInPhase]
+            )
+            if phase in profile["phases"]:
+                statistics["time"] = profile["phases"][phase]["time"]
+            else:
+                statistics["time"] = 0.0
+            statistics["time"] += stopTime - startTime
+            statistics["timeOutside"] = statistics["time"] - statistics["timeInside"]
+            del statistics["latencyHistogram"]
+            del statistics["batchSizes"]
+            profile["phases"][phase] = statistics
+        profile["codeProfile"] = codeProfile
+        return profile
+
+    @staticmethod
+    def _computeStatistics(sizes, durations):
+        """
+        Compute the statistics of calls.
+
+        Parameters
+        ----------
+        sizes : np.array(numberOfCalls)
+            The number of points of each call.
+        durations : np.array(numberOfCalls)
+            The duration of each call, in seconds.
+
+        Returns
+        -------
+        statistics : dict
+            The statistics.
+        """
+        values, counts = np.unique(sizes, return_counts=True)
+        # One bin for each decade, from 1 microsecond to 100 seconds
+        edges = 10.0 ** np.arange(-6.0, 3.0)
+        histogram, _ = np.histogram(np.clip(durations, edges[0], edges[-1]), edges)
+        statistics = {
+            "numberOfCalls": int(sizes.size),
+            "numberOfEvaluations": int(np.sum(sizes)),
+            "batchSizes": {int(v): int(c) for v, c in zip(values, counts)},
+            "timeInside": float(np.sum(durations)),
+            "latencyHistogram": (histogram.tolist(), edges.tolist()),
+        }
+        return statistics
+
+    @staticmethod
+    def summary(profile):
+        """
+        Returns a string which presents a profile.
+
+        Parameters
+        ----------
+        profile : dict
+            The profile, as returned by stop().
+
+        Returns
+        -------
+        s : str
+            The summary.
+        """
+        lines = [
+            "numberOfCalls = %d" % (profile["numberOfCalls"]),
+            "numberOfEvaluations = %d" % (profile["numberOfEvaluations"]),
+            "time = %.3e (s), inside = %.3e (s), outside = %.3e (s)"
+            % (profile["time"], profile["timeInside"], profile["timeOutside"]),
+        ]
+        for phase, statistics in profile["phases"].items():
+            lines.append(
+                "%s : calls = %d, evaluations = %d, "
+                "inside = %.3e (s), outside = %.3e (s)"
+                % (
+                    phase,
+                    statistics["numberOfCalls"],
+                    statistics["numberOfEvaluations"],
+                    statistics["timeInside"],
+                    statistics["timeOutside"],
+                )
+            )
+        s = "\n".join(lines)
+        return s
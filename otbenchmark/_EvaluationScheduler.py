@@ -0,0 +1,255 @@
+"""
+Evaluate expensive functions by concurrent batches.
+"""
+
+import asyncio
+import numpy as np
+import openturns as ot
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from ._FunctionWrapper import SharedObject, wrapEvaluation
+
+
+def _evaluateChunk(function, inputArray):
+    """
+    Evaluate a function on a chunk of the input sample.
+
+    This is a module function, so that it can be sent to a process pool.
+
+    Parameters
+    ----------
+    function : ot.Function
+        The function.
+    inputArray : np.array(size, inputDimension)
+        The chunk.
+
+    Returns
+    -------
+    outputArray : np.array(size, outputDimension)
+        The output of the chunk.
+    """
+    outputArray = np.array(function(inputArray))
+    return outputArray
+
+
+class _ScheduledFunction(SharedObject):
+    """The callable of a function evaluated by a scheduler."""
+
+    def __init__(self, scheduler, function):
+        self.scheduler = scheduler
+        self.function = function
+
+    def __call__(self, inputSample):
+        return self.scheduler.evaluate(self.function, inputSample)
+
+
+class EvaluationScheduler(SharedObject):
+    @staticmethod
+    def GetBackends():
+        """
+        Get the available backends.
+
+        Returns
+        -------
+        backends_list : list of str
+            The list of available backends.
+        """
+        backends_list = ["Thread", "Process", "Asyncio"]
+        return backends_list
+
+    def __init__(self, backend="Thread", maximumInFlight=4, chunkSize=None):
+        """
+        Evaluate expensive functions by concurrent batches.
+
+        Each input sample submitted to the scheduler is split into chunks,
+        which are evaluated concurrently, with at most maximumInFlight
+        chunks in flight.
+        The outputs are returned in the order of the input sample.
+
+        The backends are:
+
+        * "Thread": a thread pool, for functions which release the GIL,
+          e.g. remote functions or external simulators,
+        * "Process": a process pool, for Python functions.
+          The function must be picklable,
+        * "Asyncio": an asyncio event loop.
+          The function can be a coroutine function which takes and returns
+          arrays, e.g. a client of a remote server.
+          Other functions are evaluated in threads.
+
+        Parameters
+        ----------
+        backend : str, optional
+            The backend.
+            The default is "Thread".
+        maximumInFlight : int, optional
+            The maximum number of chunks evaluated at the same time.
+            The default is 4.
+        chunkSize : int, optional
+            The number of points of each chunk.
+            The default is None, which splits each input sample into
+            maximumInFlight chunks.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> problem = otb.ReliabilityProblem8()
+        >>> g = problem.getEvent().getFunction()
+        >>> scheduler = otb.EvaluationScheduler("Thread", maximumInFlight=8)
+        >>> scheduledFunction = scheduler.wrapFunction(g)
+        """
+        if backend not in EvaluationScheduler.GetBackends():
+            raise ValueError("Unknown value of backend %s" % (backend))
+        if maximumInFlight < 1:
+            raise ValueError(
+                "The maximum number of chunks in flight is %d but must be positive"
+                % (maximumInFlight)
+            )
+        if chunkSize is not None and chunkSize < 1:
+            raise ValueError("The chunk size is %d but must be positive" % (chunkSize))
+        self.backend = backend
+        self.maximumInFlight = maximumInFlight
+        self.chunkSize = chunkSize
+        if backend == "Thread":
+            self.executor = ThreadPoolExecutor(max_workers=maximumInFlight)
+        elif backend == "Process":
+            self.executor = ProcessPoolExecutor(max_workers=maximumInFlight)
+        else:
+            self.executor = None
+
+    def _splitChunks(self, size):
+        """
+        Compute the bounds of the chunks of a sample.
+
+        Parameters
+        ----------
+        size : int
+            The size of the sample.
+
+        Returns
+        -------
+        chunks : list of (int, int)
+            The start and stop of each chunk.
+        """
+        if self.chunkSize is None:
+            chunkSize = max(1, -(-size // self.maximumInFlight))
+        else:
+            chunkSize = self.chunkSize
+        chunks = [
+            (start, min(start + chunkSize, size)) for start in range(0, size, chunkSize)
+        ]
+        return chunks
+
+    async def _evaluateAsync(self, function, inputArray, chunks):
+        """
+        Evaluate the chunks with asyncio.
+
+        Parameters
+        ----------
+        function : ot.Function or coroutine function
+            The function.
+        inputArray : np.array(size, inputDimension)
+            The input sample.
+        chunks : list of (int, int)
+            The start and stop of each chunk.
+
+        Returns
+        -------
+        outputArrays : list of np.array
+            The output of each chunk.
+        """
+        semaphore = asyncio.Semaphore(self.maximumInFlight)
+
+        async def evaluateChunk(start, stop):
+            async with semaphore:
+                if asyncio.iscoroutinefunction(function):
+                    outputArray = await function(inputArray[start:stop])
+                    return np.array(outputArray)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, _evaluateChunk, function, inputArray[start:stop]
+                )
+
+        outputArrays = await asyncio.gather(
+            *[evaluateChunk(start, stop) for start, stop in chunks]
+        )
+        return outputArrays
+
+    def evaluate(self, function, inputSample):
+        """
+        Evaluate a function on a sample, by concurrent chunks.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function.
+            With the "Asyncio" backend, this can also be a coroutine
+            function.
+        inputSample : ot.Sample(size, inputDimension)
+            The input sample.
+
+        Returns
+        -------
+        outputSample : ot.Sample(size, outputDimension)
+            The output sample, in the order of the input sample.
+        """
+        inputArray = np.asarray(inputSample)
+        chunks = self._splitChunks(inputArray.shape[0])
+        if self.backend == "Asyncio":
+            coroutine = self._evaluateAsync(function, inputArray, chunks)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                outputArrays = asyncio.run(coroutine)
+            else:
+                # An event loop is already running, e.g. in a notebook
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    outputArrays = executor.submit(asyncio.run, coroutine).result()
+        else:
+            futures = [
+                self.executor.submit(_evaluateChunk, function, inputArray[start:stop])
+                for start, stop in chunks
+            ]
+            outputArrays = [future.result() for future in futures]
+        if len(outputArrays) == 0:
+            return ot.Sample(0, function.getOutputDimension())
+        outputSample = ot.Sample(np.vstack(outputArrays))
+        return outputSample
+
+    def wrapFunction(self, function):
+        """
+        Create a function evaluated by the scheduler.
+
+        The new function has its own evaluation counter.
+        The gradient and the hessian of the function are kept if they are
+        exact.
+        If they are computed with finite differences, their points are
+        evaluated by the scheduler too.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function.
+
+        Returns
+        -------
+        scheduledFunction : ot.Function
+            The function evaluated by the scheduler.
+        """
+        scheduledFunction = wrapEvaluation(function, _ScheduledFunction(self, function))
+        return scheduledFunction
+
+    def close(self):
+        """
+        Shut down the pool of the scheduler.
+
+        Returns
+        -------
+        None.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+        return None
@@ -0,0 +1,261 @@
+"""
+Render figures headlessly into a content-addressed cache of image files.
+"""
+
+import hashlib
+import os
+import numpy as np
+import openturns as ot
+
+
+def _formatArgument(argument):
+    """
+    Returns the text which identifies an argument in the key of a figure.
+
+    The repr() of an ot.Sample, an ot.Point or a np.ndarray is truncated
+    when it is large, so that two different samples could have the same
+    repr().
+    This is why the shape and the bytes of their values are used instead.
+
+    Parameters
+    ----------
+    argument : object
+        The argument of the drawing method.
+
+    Returns
+    -------
+    text : str
+        The text of the argument.
+    """
+    if isinstance(argument, (ot.Sample, ot.Point, np.ndarray)):
+        array = np.ascontiguousarray(argument)
+        digest = hashlib.sha256(array.tobytes()).hexdigest()
+        text = "%s%s:%s:%s" % (
+            type(argument).__name__,
+            array.shape,
+            array.dtype,
+            digest,
+        )
+    else:
+        text = repr(argument)
+    return text
+
+
+def _formatDrawFunction(drawFunction):
+    """
+    Returns the text which identifies the drawn object in the key of a figure.
+
+    The drawn object is the owner of the drawing method.
+    An OpenTURNS object is identified by its repr(), which contains its
+    whole content.
+    Another object is identified by its class and by its attributes which
+    are OpenTURNS objects, arrays, numbers, strings, lists or tuples: the
+    other attributes, such as the dictionaries of the caches, do not
+    change the figure.
+
+    Parameters
+    ----------
+    drawFunction : callable
+        The drawing method.
+
+    Returns
+    -------
+    text : str
+        The text of the drawn object.
+    """
+    text = getattr(drawFunction, "__qualname__", type(drawFunction).__name__)
+    owner = getattr(drawFunction, "__self__", None)
+    if owner is None:
+        return text
+    if isinstance(owner, ot.Object):
+        return text + ":" + _formatArgument(owner)
+    attributes = [
+        (name, _formatArgument(value))
+        for name, value in sorted(vars(owner).items())
+        if isinstance(
+            value, (ot.Object, np.ndarray, int, float, str, bool, list, tuple)
+        )
+    ]
+    text += ":%s%s" % (type(owner).__name__, repr(attributes))
+    return text
+
+
+class FigureCache:
+    def __init__(self, directory, imageFormat="png", dpi=100):
+        """
+        Render figures headlessly into a content-addressed cache.
+
+        Each figure is rendered through the Agg backend, without any
+        window, and written into an image file whose name is a hash of
+        the name of the plot, of the drawn object, of the arguments of the
+        drawing method, of the image format and of the version of
+        otbenchmark.
+        If the file already exists, the figure is not computed again.
+        This is why rebuilding a gallery or a report only renders the
+        plots whose problem, bounds, resolution or sample size changed.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the image files.
+            It is created if it does not exist.
+        imageFormat : str, optional
+            The format of the image files, e.g. "png" or "svg".
+            The default is "png".
+        dpi : int, optional
+            The resolution of the image files, in dots per inch.
+            The default is 100.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> problem = otb.ReliabilityProblem8()
+        >>> drawEvent = otb.DrawEvent(problem.getEvent())
+        >>> cache = otb.FigureCache("figures")
+        >>> filename = cache.render(
+        ...     problem.getName() + "-drawSample", drawEvent.drawSample, 500
+        ... )
+        """
+        if imageFormat not in ["png", "svg", "pdf"]:
+            raise ValueError("Unknown value of imageFormat %s" % (imageFormat))
+        self.directory = directory
+        self.imageFormat = imageFormat
+        self.dpi = dpi
+        self.numberOfHits = 0
+        self.numberOfMisses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def computeKey(self, name, drawFunction, *args, **kwargs):
+        """
+        Compute the key of a figure.
+
+        The drawn object, which owns the drawing method, is hashed with its
+        content, so that two problems drawn under the same name have
+        different keys.
+        The content of an ot.PythonFunction does not contain its Python
+        code: two of them with the same dimensions must be drawn under
+        different names.
+        The arguments are hashed with their repr(), which contains the
+        whole content of OpenTURNS objects such as ot.Interval or
+        ot.Distribution.
+        The ot.Sample, ot.Point and np.ndarray arguments are hashed with
+        their shape and the bytes of their values, since their repr() is
+        truncated when they are large.
+
+        Parameters
+        ----------
+        name : str
+            The name of the figure.
+            It must identify the problem and the drawing method.
+        drawFunction : callable
+            The drawing method.
+        args : list
+            The positional arguments of the drawing method.
+        kwargs : dict
+            The keyword arguments of the drawing method.
+
+        Returns
+        -------
+        key : str
+            The hexadecimal digest of the figure.
+        """
+        from . import __version__
+
+        content = [
+            __version__,
+            self.imageFormat,
+            str(self.dpi),
+            name,
+            _formatDrawFunction(drawFunction),
+            repr([_formatArgument(argument) for argument in args]),
+            repr(
+                [
+                    (keyword, _formatArgument(value))
+                    for keyword, value in sorted(kwargs.items())
+                ]
+            ),
+        ]
+        key = hashlib.sha256("\n".join(content).encode("utf-8")).hexdigest()
+        return key
+
+    def getFileName(self, key):
+        """
+        Returns the name of the image file of a key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the figure.
+
+        Returns
+        -------
+        filename : str
+            The name of the image file.
+        """
+        filename = os.path.join(self.directory, "%s.%s" % (key, self.imageFormat))
+        return filename
+
+    def render(self, name, drawFunction, *args, **kwargs):
+        """
+        Render a figure, unless it is already in the cache.
+
+        Parameters
+        ----------
+        name : str
+            The name of the figure.
+            It must identify the problem and the drawing method.
+        drawFunction : callable
+            The drawing method.
+            It must return a Matplotlib figure or an ot.Graph.
+        args : list
+            The positional arguments of the drawing method.
+        kwargs : dict
+            The keyword arguments of the drawing method.
+
+        Returns
+        -------
+        filename : str
+            The name of the image file.
+        """
+        import pylab as pl
+        import openturns.viewer as otv
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        key = self.computeKey(name, drawFunction, *args, **kwargs)
+        filename = self.getFileName(key)
+        if os.path.exists(filename):
+            self.numberOfHits += 1
+            return filename
+        self.numberOfMisses += 1
+        figure = drawFunction(*args, **kwargs)
+        if isinstance(figure, ot.Graph):
+            figure = otv.View(figure).getFigure()
+        # Render with Agg, whatever the current backend
+        FigureCanvasAgg(figure)
+        # Write in a temporary file first, so that an interrupted rendering
+        # does not leave a truncated image in the cache
+        temporaryFilename = "%s.%d.tmp" % (filename, os.getpid())
+        figure.savefig(temporaryFilename, format=self.imageFormat, dpi=self.dpi)
+        pl.close(figure)
+        os.replace(temporaryFilename, filename)
+        return filename
+
+    def clear(self):
+        """
+        Remove all the image files of the cache.
+
+        Only the files whose name is a key are removed.
+
+        Returns
+        -------
+        None.
+        """
+        for filename in os.listdir(self.directory):
+            stem, extension = os.path.splitext(filename)
+            if extension == "." + self.imageFormat and len(stem) == 64:
+                os.remove(os.path.join(self.directory, filename))
+        return None
@@ -0,0 +1,74 @@
+"""
+Wrap the evaluation of a function into a Python callable.
+"""
+
+import openturns as ot
+
+
+class SharedObject:
+    """
+    An object which is shared by the copies of the functions using it.
+
+    OpenTURNS copies the Python callable of an ot.PythonFunction each time
+    the function is copied, e.g. by an algorithm or a random vector.
+    The deep copy of a SharedObject is the object itself, so that all the
+    copies of the functions share its state, e.g. a cache, a pool of
+    workers or counters.
+    """
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def wrapEvaluation(function, func_sample):
+    """
+    Create a function whose evaluation is a Python callable.
+
+    The callable evaluates the original function, e.g. with some
+    instrumentation.
+    The gradient and the hessian of the original function are kept if they
+    are exact.
+    If they are computed by finite differences, they are computed with the
+    same steps on the new evaluation, so that their evaluations are counted
+    by the new function, as they were by the original function.
+
+    Parameters
+    ----------
+    function : ot.Function
+        The original function.
+    func_sample : callable
+        The evaluation of a sample.
+
+    Returns
+    -------
+    wrappedFunction : ot.Function
+        The new function.
+    """
+    pythonFunction = ot.PythonFunction(
+        function.getInputDimension(),
+        function.getOutputDimension(),
+        func_sample=func_sample,
+    )
+    # The description is set before the gradient shares the evaluation
+    pythonFunction.setInputDescription(function.getInputDescription())
+    pythonFunction.setOutputDescription(function.getOutputDescription())
+    evaluation = pythonFunction.getEvaluation()
+    gradient = function.getGradient().getImplementation()
+    className = gradient.getClassName()
+    if className in [
+        "CenteredFiniteDifferenceGradient",
+        "NonCenteredFiniteDifferenceGradient",
+    ]:
+        gradient = getattr(ot, className)(
+            gradient.getFiniteDifferenceStep(), evaluation
+        )
+    hessian = function.getHessian().getImplementation()
+    className = hessian.getClassName()
+    if className == "CenteredFiniteDifferenceHessian":
+        hessian = ot.CenteredFiniteDifferenceHessian(
+            hessian.getFiniteDifferenceStep(), evaluation
+        )
+    wrappedFunction = ot.Function(
+        ot.FunctionImplementation(evaluation, gradient, hessian)
+    )
+    return wrappedFunction
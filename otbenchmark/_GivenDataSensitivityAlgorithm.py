@@ -0,0 +1,219 @@
+"""
+Estimates first order sensitivity indices from a given input/output sample.
+
+The estimators only require one i.i.d. sample, with no pick-freeze
+structure.
+This is why they can reuse any existing Monte-Carlo sample, e.g. the outputs
+computed by a reliability algorithm.
+
+The "Rank" estimator is the rank-based (nearest-neighbour) estimator of the
+first order Sobol' indices.
+Sorting the sample with respect to the i-th input, two consecutive points
+have close values of the i-th input, so that they approximately form a
+pick-freeze pair.
+
+Fabrice Gamboa, Pierre Gremaud, Thierry Klein, Agnès Lagnoux.
+Global sensitivity analysis: a novel generation of mighty estimators based
+on rank statistics.
+Bernoulli, 2022, 28 (4), pp.2345-2374.
+⟨10.3150/21-BEJ1421⟩. ⟨hal-02474902v4⟩
+
+The "Chatterjee" estimator is the rank correlation coefficient of Chatterjee.
+It is not a Sobol' index: it estimates the Cramér-von Mises index, which is
+equal to zero if and only if the output is independent from the input and is
+equal to 1 if and only if the output is a measurable function of the input.
+
+Sourav Chatterjee.
+A new coefficient of correlation.
+Journal of the American Statistical Association, 2021, 116 (536),
+pp.2009-2022.
+⟨10.1080/01621459.2020.1758115⟩.
+
+The "Binning" estimator estimates the conditional expectation of the output
+given the i-th input by averaging the output in equal frequency bins of the
+i-th input.
+The first order Sobol' index is the variance of the bin means divided by the
+variance of the output.
+"""
+
+import openturns as ot
+import numpy as np
+
+
+class GivenDataSensitivityAlgorithm:
+    @staticmethod
+    def GetEstimators():
+        """
+        Get the available given-data estimators.
+
+        Returns
+        -------
+        estimators_list : list of str
+            The list of available given-data estimators.
+        """
+        estimators_list = ["Rank", "Chatterjee", "Binning"]
+        return estimators_list
+
+    def __init__(self, inputSample, outputSample, estimator="Rank", numberOfBins=None):
+        """
+        Estimates first order sensitivity indices from a given sample.
+
+        The sample is sorted once with respect to each input and the
+        indices of all the inputs and all the outputs are computed with
+        array operations.
+
+        Parameters
+        ----------
+        inputSample : ot.Sample(size, dimension)
+            The input sample.
+        outputSample : ot.Sample(size, outputDimension)
+            The output sample.
+        estimator : str, optional
+            The estimator.
+            Must be "Rank", "Chatterjee" or "Binning".
+            The default is "Rank".
+        numberOfBins : int, optional
+            The number of bins of the "Binning" estimator.
+            The default is None, which uses the square root of the size.
+
+        Returns
+        -------
+        None.
+
+        """
+        if estimator not in GivenDataSensitivityAlgorithm.GetEstimators():
+            raise ValueError("Unknown value of estimator %s" % (estimator))
+        size = inputSample.getSize()
+        if outputSample.getSize() != size:
+            raise ValueError(
+                "The input size is %d but the output size is %d"
+                % (size, outputSample.getSize())
+            )
+        if size < 2:
+            raise ValueError("The size is %d but must be at least 2" % (size))
+        if numberOfBins is None:
+            numberOfBins = int(np.sqrt(size))
+        if numberOfBins < 1 or numberOfBins > size:
+            raise ValueError(
+                "The number of bins is %d but must be in [1, %d]" % (numberOfBins, size)
+            )
+        self.inputSample = inputSample
+        self.outputSample = outputSample
+        self.inputDimension = inputSample.getDimension()
+        self.outputDimension = outputSample.getDimension()
+        self.size = size
+        self.estimator = estimator
+        self.numberOfBins = numberOfBins
+        x = np.asarray(inputSample)
+        y = np.asarray(outputSample)
+        # order[k, i] is the row of the k-th smallest value of the i-th input
+        order = np.argsort(x, axis=0, kind="stable")
+        if estimator == "Rank":
+            self.indicesF = self._computeRankIndices(y, order)
+        elif estimator == "Chatterjee":
+            self.indicesF = self._computeChatterjeeIndices(y, order)
+        else:
+            self.indicesF = self._computeBinningIndices(y, order)
+
+    def _computeRankIndices(self, y, order):
+        """
+        Compute the rank-based first order Sobol' indices.
+
+        Parameters
+        ----------
+        y : np.array(size, outputDimension)
+            The output sample.
+        order : np.array(size, dimension)
+            The sorting permutation of each input.
+
+        Returns
+        -------
+        indices : np.array(dimension, outputDimension)
+            The first order Sobol' indices.
+        """
+        y_centered = y - np.mean(y, axis=0)
+        variance = np.mean(y_centered**2, axis=0)
+        # sorted_y[k, i, :] is the output of the k-th point sorted by the i-th input
+        sorted_y = y_centered[order]
+        covariance = np.mean(sorted_y[:-1] * sorted_y[1:], axis=0)
+        return covariance / variance
+
+    def _computeChatterjeeIndices(self, y, order):
+        """
+        Compute the Chatterjee rank correlation coefficients.
+
+        Parameters
+        ----------
+        y : np.array(size, outputDimension)
+            The output sample.
+        order : np.array(size, dimension)
+            The sorting permutation of each input.
+
+        Returns
+        -------
+        indices : np.array(dimension, outputDimension)
+            The Chatterjee coefficients.
+        """
+        size = self.size
+        # The rank of each output, from 1 to size
+        y_rank = np.empty(y.shape)
+        y_order = np.argsort(y, axis=0, kind="stable")
+        np.put_along_axis(
+            y_rank, y_order, np.arange(1, size + 1)[:, np.newaxis], axis=0
+        )
+        sorted_rank = y_rank[order]
+        rank_increments = np.sum(np.abs(np.diff(sorted_rank, axis=0)), axis=0)
+        return 1.0 - 3.0 * rank_increments / (size**2 - 1.0)
+
+    def _computeBinningIndices(self, y, order):
+        """
+        Compute the first order Sobol' indices with equal frequency bins.
+
+        Since the points are sorted with respect to each input, each bin is a
+        contiguous block of the sorted sample.
+
+        Parameters
+        ----------
+        y : np.array(size, outputDimension)
+            The output sample.
+        order : np.array(size, dimension)
+            The sorting permutation of each input.
+
+        Returns
+        -------
+        indices : np.array(dimension, outputDimension)
+            The first order Sobol' indices.
+        """
+        size = self.size
+        y_centered = y - np.mean(y, axis=0)
+        variance = np.mean(y_centered**2, axis=0)
+        sorted_y = y_centered[order]
+        starts = (np.arange(self.numberOfBins) * size) // self.numberOfBins
+        counts = np.diff(np.append(starts, size))
+        bin_sums = np.add.reduceat(sorted_y, starts, axis=0)
+        between_variance = (
+            np.sum(bin_sums**2 / counts[:, np.newaxis, np.newaxis], axis=0) / size
+        )
+        return between_variance / variance
+
+    def getFirstOrderIndices(self, marginalIndex=0):
+        """
+        Returns first order sensitivity indices.
+
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output. The default is 0.
+
+        Returns
+        -------
+        indices : ot.Point(dimension)
+            The first order indices.
+
+        """
+        if marginalIndex < 0 or marginalIndex >= self.outputDimension:
+            raise ValueError(
+                "The marginal index %d must be in [0, %d]"
+                % (marginalIndex, self.outputDimension - 1)
+            )
+        return ot.Point(self.indicesF[:, marginalIndex])
@@ -17,31 +17,36 @@ import openturns as ot
 import numpy as np
 
 
-def computeSumDotSamples(sampleX, sampleY):
+def computeJanonTerms(yX, yE):
     """
-    Compute the product and sum of the components of two samples.
+    Compute the numerators and denominators of the Janon estimator.
 
-    This is:
-
-    .. math::
-        S = sum_{i = 1}^n x_i * y_i
+    The sample index is the next-to-last axis of the arrays and the output
+    index is the last axis.
+    All other leading axes are broadcast, which allows to compute the terms
+    of all the input variables and of all the bootstrap replicates at once.
 
     Parameters
     ----------
-    sampleX : ot.Sample(size, dimension)
-        The first sample.
-    sampleY : ot.Sample(size, dimension)
-        The first sample.
+    yX : np.array(..., size, outputDimension)
+        The output of the A or B block.
+    yE : np.array(..., size, outputDimension)
+        The outputs of the pick-freeze blocks.
 
     Returns
     -------
-    value : float
-        The result.
-
+    numerator : np.array(..., outputDimension)
+        The covariance term.
+    denominator : np.array(..., outputDimension)
+        The variance term.
     """
-    # Multiplication and sum of two Samples
-    value = np.sum(np.array(sampleX) * np.array(sampleY))
-    return value
+    mu = 0.5 * (np.mean(yE, axis=-2) + np.mean(yX, axis=-2))
+    mu_expanded = np.expand_dims(mu, axis=-2)
+    numerator = np.sum((yE - mu_expanded) * (yX - mu_expanded), axis=-2)
+    squared_mean = 0.5 * np.mean(yE**2 + yX**2, axis=-2)
+    size = yE.shape[-2]
+    denominator = size * (squared_mean - mu**2)
+    return numerator, denominator
 
 
 class JanonSensitivityAlgorithm(ot.SobolIndicesAlgorithm):
@@ -49,13 +54,21 @@ class JanonSensitivityAlgorithm(ot.SobolIndicesAlgorithm):
         """
         Estimates Sobol' indices with Janon estimator.
 
-        This estimator only implements an output dimension equal to 1.
+        The output design is viewed once as an array with shape
+        (dimension + 2, size, outputDimension), without copy, so that the
+        first and total order indices of all the outputs are computed with a
+        few array operations.
+
+        Confidence intervals are computed with bootstrap, using the
+        SobolIndicesAlgorithm-DefaultBootstrapSize and
+        SobolIndicesAlgorithm-DefaultBootstrapConfidenceLevel keys of the
+        ResourceMap as default values.
 
         Parameters
         ----------
         inputDesign : ot.Sample(size, dimension)
             The input sample.
-        outputDesign : ot.Sample(required_size, dimension)
+        outputDesign : ot.Sample(required_size, outputDimension)
             The output sample.
         size : int
             The basic size of the sample.
@@ -70,58 +83,321 @@ class JanonSensitivityAlgorithm(ot.SobolIndicesAlgorithm):
         self.outputDimension = outputDesign.getDimension()
         self.size = size
         self.outputDesign = outputDesign
-        self.indicesF = ot.Point(self.inputDimension)
-        self.indicesT = ot.Point(self.inputDimension)
-
-        # Compute muA = mean(yA)
-        yA = ot.Sample(outputDesign, 0, size)
-        muA = yA.computeMean()
-
-        # Compute muB
-        yB = ot.Sample(outputDesign, size, 2 * size)
-        muB = yB.computeMean()
-
-        for p in range(self.inputDimension):
-            # yE correspond to the block that start at index (p + 2) * size
-            yE = ot.Sample(outputDesign, (2 + p) * self.size, (3 + p) * self.size)
-            muE = yE.computeMean()
-            # For first order indices, consider yE and yB
-            muEB = (muE + muB) / 2.0
-            yE_centered = yE - muEB
-            yB_centered = yB - muEB
-            numerator = computeSumDotSamples(yE_centered, yB_centered)
-            y_squared = (np.array(yE) ** 2 + np.array(yB) ** 2) / 2.0 - muEB[0] ** 2
-            denominator = np.sum(y_squared)
-            self.indicesF[p] = numerator / denominator
-            # For total order indices, consider yE and yA
-            muEA = (muE + muA) / 2.0
-            yE_centered = yE - muEA
-            yA_centered = yA - muEA
-            numerator = computeSumDotSamples(yE_centered, yA_centered)
-            y_squared = (np.array(yE) ** 2 + np.array(yA) ** 2) / 2.0 - muEA[0] ** 2
-            denominator = np.sum(y_squared)
-            self.indicesT[p] = 1.0 - numerator / denominator
-
-    def getFirstOrderIndices(self):
+        required_size = (self.inputDimension + 2) * size
+        if outputDesign.getSize() < required_size:
+            raise ValueError(
+                "The size of the output design is %d but at least %d is required"
+                % (outputDesign.getSize(), required_size)
+            )
+        self.bootstrapSize = ot.ResourceMap.GetAsUnsignedInteger(
+            "SobolIndicesAlgorithm-DefaultBootstrapSize"
+        )
+        self.confidenceLevel = ot.ResourceMap.GetAsScalar(
+            "SobolIndicesAlgorithm-DefaultBootstrapConfidenceLevel"
+        )
+        self.maximumChunkElements = 2**24
+        self.boundsF = None
+        self.boundsT = None
+        # View the blocks A, B, E_1, ..., E_d as a single array.
+        # The blocks used by second order indices, if any, are ignored.
+        self.blocks = np.asarray(outputDesign)[:required_size].reshape(
+            self.inputDimension + 2, size, self.outputDimension
+        )
+        (
+            self.numeratorF,
+            self.denominatorF,
+            self.numeratorT,
+            self.denominatorT,
+        ) = self._computeTerms(self.blocks)
+        self.indicesF = self.numeratorF / self.denominatorF
+        self.indicesT = 1.0 - self.numeratorT / self.denominatorT
+
+    def _computeTerms(self, blocks):
+        """
+        Compute the terms of the first and total order estimators.
+
+        Parameters
+        ----------
+        blocks : np.array(dimension + 2, ..., size, outputDimension)
+            The blocks A, B, E_1, ..., E_d.
+
+        Returns
+        -------
+        numeratorF, denominatorF : np.array(dimension, ..., outputDimension)
+            The terms of the first order indices.
+        numeratorT, denominatorT : np.array(dimension, ..., outputDimension)
+            The terms of the total order indices.
+        """
+        yA = blocks[0]
+        yB = blocks[1]
+        yE = blocks[2:]
+        # For first order indices, consider yE and yB
+        numeratorF, denominatorF = computeJanonTerms(yB, yE)
+        # For total order indices, consider yE and yA
+        numeratorT, denominatorT = computeJanonTerms(yA, yE)
+        return numeratorF, denominatorF, numeratorT, denominatorT
+
+    def _computeBootstrapIntervals(self):
+        """
+        Compute the bootstrap confidence intervals of all the indices.
+
+        The bootstrap replicates are computed by indexing the blocks with
+        a (numberOfReplicates, size) array of indices.
+        The replicates are processed by chunks, so that the resampled
+        blocks use at most maximumChunkElements floats.
+
+        Returns
+        -------
+        None.
+        """
+        bootstrapF = np.empty(
+            (self.inputDimension, self.bootstrapSize, self.outputDimension + 1)
+        )
+        bootstrapT = np.empty(
+            (self.inputDimension, self.bootstrapSize, self.outputDimension + 1)
+        )
+        indices = np.array(
+            ot.RandomGenerator.IntegerGenerate(
+                self.bootstrapSize * self.size, self.size
+            )
+        ).reshape(self.bootstrapSize, self.size)
+        replicate_elements = self.blocks.size
+        chunk_size = max(1, self.maximumChunkElements // replicate_elements)
+        for start in range(0, self.bootstrapSize, chunk_size):
+            stop = min(start + chunk_size, self.bootstrapSize)
+            resampled = self.blocks[:, indices[start:stop], :]
+            numeratorF, denominatorF, numeratorT, denominatorT = self._computeTerms(
+                resampled
+            )
+            bootstrapF[:, start:stop, :-1] = numeratorF / denominatorF
+            bootstrapF[:, start:stop, -1] = np.sum(numeratorF, axis=-1) / np.sum(
+                denominatorF, axis=-1
+            )
+            bootstrapT[:, start:stop, :-1] = 1.0 - numeratorT / denominatorT
+            bootstrapT[:, start:stop, -1] = 1.0 - np.sum(numeratorT, axis=-1) / np.sum(
+                denominatorT, axis=-1
+            )
+        alpha = 1.0 - self.confidenceLevel
+        levels = [0.5 * alpha, 1.0 - 0.5 * alpha]
+        # The last column contains the aggregated indices
+        self.boundsF = np.quantile(bootstrapF, levels, axis=1)
+        self.boundsT = np.quantile(bootstrapT, levels, axis=1)
+
+    def _checkMarginalIndex(self, marginalIndex):
+        """
+        Check that the marginal index is consistent with the output dimension.
+
+        Parameters
+        ----------
+        marginalIndex : int
+            The index of the output.
+
+        Returns
+        -------
+        None.
+        """
+        if marginalIndex < 0 or marginalIndex >= self.outputDimension:
+            raise ValueError(
+                "The marginal index %d must be in [0, %d]"
+                % (marginalIndex, self.outputDimension - 1)
+            )
+
+    def _getInterval(self, firstOrder, marginalIndex):
+        """
+        Create the confidence interval from the bootstrap quantiles.
+
+        Parameters
+        ----------
+        firstOrder : bool
+            If True, returns the interval of the first order indices.
+            Otherwise, returns the interval of the total order indices.
+        marginalIndex : int or None
+            The index of the output.
+            If None, returns the interval of the aggregated indices.
+
+        Returns
+        -------
+        interval : ot.Interval(dimension)
+            The confidence interval.
+        """
+        if marginalIndex is None:
+            column = -1
+        else:
+            self._checkMarginalIndex(marginalIndex)
+            column = marginalIndex
+        if self.boundsF is None:
+            self._computeBootstrapIntervals()
+        if firstOrder:
+            bounds = self.boundsF
+        else:
+            bounds = self.boundsT
+        interval = ot.Interval(bounds[0, :, column], bounds[1, :, column])
+        return interval
+
+    def setBootstrapSize(self, bootstrapSize):
+        """
+        Set the number of bootstrap replicates.
+
+        Parameters
+        ----------
+        bootstrapSize : int
+            The number of bootstrap replicates.
+
+        Returns
+        -------
+        None.
+        """
+        if bootstrapSize < 1:
+            raise ValueError(
+                "The bootstrap size is %d but must be positive" % (bootstrapSize)
+            )
+        self.bootstrapSize = bootstrapSize
+        self.boundsF = None
+        self.boundsT = None
+
+    def getBootstrapSize(self):
+        """
+        Returns the number of bootstrap replicates.
+
+        Returns
+        -------
+        bootstrapSize : int
+            The number of bootstrap replicates.
+        """
+        return self.bootstrapSize
+
+    def setConfidenceLevel(self, confidenceLevel):
+        """
+        Set the confidence level of the bootstrap intervals.
+
+        Parameters
+        ----------
+        confidenceLevel : float
+            The confidence level, in (0, 1).
+
+        Returns
+        -------
+        None.
+        """
+        if confidenceLevel <= 0.0 or confidenceLevel >= 1.0:
+            raise ValueError(
+                "The confidence level is %s but must be in (0, 1)" % (confidenceLevel)
+            )
+        self.confidenceLevel = confidenceLevel
+        self.boundsF = None
+        self.boundsT = None
+
+    def getConfidenceLevel(self):
+        """
+        Returns the confidence level of the bootstrap intervals.
+
+        Returns
+        -------
+        confidenceLevel : float
+            The confidence level.
+        """
+        return self.confidenceLevel
+
+    def getFirstOrderIndicesInterval(self, marginalIndex=None):
+        """
+        Returns the bootstrap confidence interval of first order indices.
+
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output.
+            The default is None, which returns the interval of the aggregated
+            indices.
+
+        Returns
+        -------
+        interval : ot.Interval(dimension)
+            The confidence interval of the first order Sobol' indices.
+        """
+        return self._getInterval(True, marginalIndex)
+
+    def getTotalOrderIndicesInterval(self, marginalIndex=None):
+        """
+        Returns the bootstrap confidence interval of total order indices.
+
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output.
+            The default is None, which returns the interval of the aggregated
+            indices.
+
+        Returns
+        -------
+        interval : ot.Interval(dimension)
+            The confidence interval of the total order Sobol' indices.
+        """
+        return self._getInterval(False, marginalIndex)
+
+    def getFirstOrderIndices(self, marginalIndex=0):
         """
         Returns first order Sobol' indices.
 
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output. The default is 0.
+
         Returns
         -------
         indices : ot.Point(dimension)
             The first order Sobol' indices.
 
         """
-        return self.indicesF
+        self._checkMarginalIndex(marginalIndex)
+        return ot.Point(self.indicesF[:, marginalIndex])
 
-    def getTotalOrderIndices(self):
+    def getTotalOrderIndices(self, marginalIndex=0):
         """
         Returns total order Sobol' indices.
 
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output. The default is 0.
+
         Returns
         -------
         indices : ot.Point(dimension)
             The total order Sobol' indices.
 
         """
-        return self.indicesT
+        self._checkMarginalIndex(marginalIndex)
+        return ot.Point(self.indicesT[:, marginalIndex])
+
+    def getAggregatedFirstOrderIndices(self):
+        """
+        Returns aggregated first order Sobol' indices.
+
+        The indices of the outputs are weighted by the variance of each output.
+
+        Returns
+        -------
+        indices : ot.Point(dimension)
+            The aggregated first order Sobol' indices.
+
+        """
+        numerator = np.sum(self.numeratorF, axis=-1)
+        denominator = np.sum(self.denominatorF, axis=-1)
+        return ot.Point(numerator / denominator)
+
+    def getAggregatedTotalOrderIndices(self):
+        """
+        Returns aggregated total order Sobol' indices.
+
+        The indices of the outputs are weighted by the variance of each output.
+
+        Returns
+        -------
+        indices : ot.Point(dimension)
+            The aggregated total order Sobol' indices.
+
+        """
+        numerator = np.sum(self.numeratorT, axis=-1)
+        denominator = np.sum(self.denominatorT, axis=-1)
+        return ot.Point(1.0 - numerator / denominator)
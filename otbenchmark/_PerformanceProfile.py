@@ -0,0 +1,445 @@
+"""
+Compare methods with performance and data profiles.
+"""
+
+import numpy as np
+import openturns as ot
+
+
+class PerformanceProfile:
+    def __init__(
+        self, costs, digits, targetDigits=1.0, methodNames=None, problemNames=None
+    ):
+        """
+        Compare methods with performance and data profiles.
+
+        A method solves a problem in a repetition if its number of correct
+        digits is at least targetDigits.
+        The cost of a method on a problem is, e.g., its number of function
+        evaluations or its time: it is infinite if the method does not
+        solve the problem.
+
+        The performance profile of Dolan and Moré is, for each method, the
+        fraction of the (problem, repetition) pairs where the ratio of the
+        cost of the method to the lowest cost of all methods is at most tau.
+
+        The data profile of Moré and Wild is, for each method, the fraction
+        of the (problem, repetition) pairs solved with a cost at most alpha
+        times the normalization of the problem, e.g. the dimension of the
+        problem plus one for a number of function evaluations.
+
+        The uncertainty of a profile is estimated by bootstrap over the
+        problems.
+
+        Parameters
+        ----------
+        costs : array(numberOfProblems, numberOfMethods, numberOfRepetitions)
+            The cost of each method on each problem for each repetition.
+        digits : array(numberOfProblems, numberOfMethods, numberOfRepetitions)
+            The number of correct digits.
+        targetDigits : float, optional
+            The number of correct digits required to solve a problem.
+            The default is 1.
+        methodNames : list of str, optional
+            The names of the methods.
+            The default is None, which uses "Method 0", "Method 1", etc.
+        problemNames : list of str, optional
+            The names of the problems.
+            The default is None, which uses "Problem 0", "Problem 1", etc.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> benchmark = otb.ReliabilityMethodBenchmark(methods=["FORM", "SORM"])
+        >>> records = benchmark.run()
+        >>> profile = otb.PerformanceProfile.FromRecords(records)
+        >>> graph = profile.drawPerformanceProfile([1.0, 2.0, 4.0, 8.0])
+        """
+        costs = np.asarray(costs, dtype=float)
+        digits = np.asarray(digits, dtype=float)
+        if costs.ndim != 3:
+            raise ValueError(
+                "The costs must have 3 dimensions but have %d" % (costs.ndim)
+            )
+        if digits.shape != costs.shape:
+            raise ValueError(
+                "The shape of the digits is %s but must be %s"
+                % (digits.shape, costs.shape)
+            )
+        numberOfMethods = costs.shape[1]
+        if methodNames is None:
+            methodNames = ["Method %d" % (i) for i in range(numberOfMethods)]
+        if len(methodNames) != numberOfMethods:
+            raise ValueError(
+                "The number of method names is %d but must be %d"
+                % (len(methodNames), numberOfMethods)
+            )
+        numberOfProblems = costs.shape[0]
+        if problemNames is None:
+            problemNames = ["Problem %d" % (i) for i in range(numberOfProblems)]
+        if len(problemNames) != numberOfProblems:
+            raise ValueError(
+                "The number of problem names is %d but must be %d"
+                % (len(problemNames), numberOfProblems)
+            )
+        self.costs = costs
+        self.digits = digits
+        self.targetDigits = targetDigits
+        self.methodNames = methodNames
+        self.problemNames = problemNames
+        # The NaN digits, e.g. for a failed method, do not solve the problem
+        solved = np.nan_to_num(digits, nan=-np.inf) >= targetDigits
+        self.solvedCosts = np.where(solved, costs, np.inf)
+
+    @staticmethod
+    def FromRecords(
+        records,
+        cost="numberOfFunctionEvaluations",
+        accuracy="numberOfCorrectDigits",
+        targetDigits=1.0,
+    ):
+        """
+        Create the profiles from the records of a campaign.
+
+        The records can be the results of ReliabilityMethodBenchmark, or the
+        rows of a ColumnarTable.
+        The repetitions of a (problem, method) are the records with
+        different seeds.
+        A missing repetition has an infinite cost.
+
+        Parameters
+        ----------
+        records : list of dict
+            The records, with the keys "problem", "method" and "seed".
+        cost : str, optional
+            The key of the cost, e.g. "numberOfFunctionEvaluations" or
+            "time".
+            The default is "numberOfFunctionEvaluations".
+        accuracy : str, optional
+            The key of the number of correct digits.
+            The default is "numberOfCorrectDigits".
+        targetDigits : float, optional
+            The number of correct digits required to solve a problem.
+            The default is 1.
+
+        Returns
+        -------
+        profile : PerformanceProfile
+            The profiles.
+        """
+        problemNames = []
+        methodNames = []
+        seeds = []
+        for record in records:
+            if record["problem"] not in problemNames:
+                problemNames.append(record["problem"])
+            if record["method"] not in methodNames:
+                methodNames.append(record["method"])
+            if record["seed"] not in seeds:
+                seeds.append(record["seed"])
+        shape = (len(problemNames), len(methodNames), len(seeds))
+        costs = np.full(shape, np.inf)
+        digits = np.full(shape, np.nan)
+        for record in records:
+            index = (
+                problemNames.index(record["problem"]),
+                methodNames.index(record["method"]),
+                seeds.index(record["seed"]),
+            )
+            costs[index] = record[cost]
+            digits[index] = record[accuracy]
+        profile = PerformanceProfile(
+            costs, digits, targetDigits, methodNames, problemNames
+        )
+        return profile
+
+    @staticmethod
+    def _computePerformanceProfile(solvedCosts, taus):
+        """
+        Compute the performance profile of costs.
+
+        Parameters
+        ----------
+        solvedCosts : array(numberOfProblems, numberOfMethods, numberOfRepetitions)
+            The costs, infinite if the problem is not solved.
+        taus : array(numberOfTaus)
+            The ratios of performance.
+
+        Returns
+        -------
+        profile : array(numberOfMethods, numberOfTaus)
+            The fraction of the problems solved within each ratio.
+        """
+        bestCosts = np.min(solvedCosts, axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(solvedCosts == bestCosts, 1.0, solvedCosts / bestCosts)
+        # A problem that no method solves gives an infinite ratio
+        ratios[np.isinf(solvedCosts)] = np.inf
+        ratios = np.moveaxis(ratios, 1, -1).reshape(-1, solvedCosts.shape[1])
+        profile = np.mean(ratios[:, :, np.newaxis] <= taus, axis=0)
+        return profile
+
+    @staticmethod
+    def _computeDataProfile(solvedCosts, normalization, alphas):
+        """
+        Compute the data profile of costs.
+
+        Parameters
+        ----------
+        solvedCosts : array(numberOfProblems, numberOfMethods, numberOfRepetitions)
+            The costs, infinite if the problem is not solved.
+        normalization : array(numberOfProblems)
+            The normalization of the cost of each problem.
+        alphas : array(numberOfAlphas)
+            The normalized budgets.
+
+        Returns
+        -------
+        profile : array(numberOfMethods, numberOfAlphas)
+            The fraction of the problems solved within each budget.
+        """
+        normalizedCosts = solvedCosts / normalization[:, np.newaxis, np.newaxis]
+        normalizedCosts = np.moveaxis(normalizedCosts, 1, -1).reshape(
+            -1, solvedCosts.shape[1]
+        )
+        profile = np.mean(normalizedCosts[:, :, np.newaxis] <= alphas, axis=0)
+        return profile
+
+    def computePerformanceProfile(self, taus):
+        """
+        Compute the performance profile of Dolan and Moré.
+
+        Parameters
+        ----------
+        taus : sequence of float
+            The ratios of performance, larger or equal to 1.
+
+        Returns
+        -------
+        profile : np.array(numberOfMethods, numberOfTaus)
+            For each method, the fraction of the (problem, repetition)
+            pairs solved with a ratio of performance at most tau.
+        """
+        taus = np.asarray(taus, dtype=float)
+        profile = PerformanceProfile._computePerformanceProfile(self.solvedCosts, taus)
+        return profile
+
+    def computeDataProfile(self, alphas, normalization=None):
+        """
+        Compute the data profile of Moré and Wild.
+
+        Parameters
+        ----------
+        alphas : sequence of float
+            The normalized budgets.
+        normalization : sequence of float, optional
+            The normalization of the cost of each problem, e.g. the
+            dimension of the problem plus one.
+            The default is None, which uses 1 for every problem.
+
+        Returns
+        -------
+        profile : np.array(numberOfMethods, numberOfAlphas)
+            For each method, the fraction of the (problem, repetition)
+            pairs solved with a normalized cost at most alpha.
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        if normalization is None:
+            normalization = np.ones(self.costs.shape[0])
+        normalization = np.asarray(normalization, dtype=float)
+        profile = PerformanceProfile._computeDataProfile(
+            self.solvedCosts, normalization, alphas
+        )
+        return profile
+
+    def computeBootstrapBands(
+        self,
+        grid,
+        profileType="Performance",
+        normalization=None,
+        numberOfBootstraps=100,
+        confidenceLevel=0.95,
+    ):
+        """
+        Compute bootstrap confidence bands of a profile.
+
+        The problems are sampled with replacement, with the random
+        generator of OpenTURNS.
+        All the bootstrap profiles are computed at once.
+
+        Parameters
+        ----------
+        grid : sequence of float
+            The ratios of performance or the normalized budgets.
+        profileType : str, optional
+            The profile, "Performance" or "Data".
+            The default is "Performance".
+        normalization : sequence of float, optional
+            The normalization of the cost of each problem, for the data
+            profile.
+            The default is None, which uses 1 for every problem.
+        numberOfBootstraps : int, optional
+            The number of bootstrap samples.
+            The default is 100.
+        confidenceLevel : float, optional
+            The confidence level of the bands.
+            The default is 0.95.
+
+        Returns
+        -------
+        lowerBand : np.array(numberOfMethods, numberOfPoints)
+            The lower bound of the profile.
+        upperBand : np.array(numberOfMethods, numberOfPoints)
+            The upper bound of the profile.
+        """
+        if profileType not in ["Performance", "Data"]:
+            raise ValueError("Unknown value of profileType %s" % (profileType))
+        grid = np.asarray(grid, dtype=float)
+        numberOfProblems, numberOfMethods, numberOfRepetitions = self.costs.shape
+        if normalization is None:
+            normalization = np.ones(numberOfProblems)
+        normalization = np.asarray(normalization, dtype=float)
+        indices = np.array(
+            ot.RandomGenerator.IntegerGenerate(
+                numberOfBootstraps * numberOfProblems, numberOfProblems
+            )
+        ).reshape(numberOfBootstraps, numberOfProblems)
+        # Stack the bootstrap samples along the repetitions: the profiles are
+        # means over the problems and the repetitions
+        costs = self.solvedCosts[indices]
+        costs = np.moveaxis(costs, 0, -1)
+        if profileType == "Performance":
+            bestCosts = np.min(costs, axis=1, keepdims=True)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.where(costs == bestCosts, 1.0, costs / bestCosts)
+            values[np.isinf(costs)] = np.inf
+        else:
+            values = costs / normalization[indices].T[:, np.newaxis, np.newaxis, :]
+        # values[problem, method, repetition, bootstrap]
+        values = np.moveaxis(values, 1, -1).reshape(
+            numberOfProblems * numberOfRepetitions, numberOfBootstraps, numberOfMethods
+        )
+        profiles = np.mean(values[:, :, :, np.newaxis] <= grid, axis=0)
+        alpha = 1.0 - confidenceLevel
+        lowerBand = np.quantile(profiles, alpha / 2.0, axis=0)
+        upperBand = np.quantile(profiles, 1.0 - alpha / 2.0, axis=0)
+        return lowerBand, upperBand
+
+    def _drawProfile(self, grid, profile, bands, title, xTitle):
+        """
+        Draw a profile.
+
+        Parameters
+        ----------
+        grid : np.array(numberOfPoints)
+            The abscissas.
+        profile : np.array(numberOfMethods, numberOfPoints)
+            The profile.
+        bands : tuple of np.array(numberOfMethods, numberOfPoints)
+            The lower and upper bands, or None.
+        title : str
+            The title.
+        xTitle : str
+            The title of the X axis.
+
+        Returns
+        -------
+        graph : ot.Graph
+            The profile of each method.
+        """
+        graph = ot.Graph(title, xTitle, "Fraction of problems", True, "bottomright")
+        numberOfMethods = len(self.methodNames)
+        palette = ot.Drawable.BuildDefaultPalette(numberOfMethods)
+        x = grid.reshape(-1, 1)
+        for i in range(numberOfMethods):
+            curve = ot.Curve(x, profile[i].reshape(-1, 1))
+            curve.setLegend(self.methodNames[i])
+            curve.setColor(palette[i])
+            graph.add(curve)
+            if bands is None:
+                continue
+            for band in bands:
+                curve = ot.Curve(x, band[i].reshape(-1, 1))
+                curve.setColor(palette[i])
+                curve.setLineStyle("dashed")
+                graph.add(curve)
+        graph.setLogScale(ot.GraphImplementation.LOGX)
+        return graph
+
+    def drawPerformanceProfile(self, taus, numberOfBootstraps=0, confidenceLevel=0.95):
+        """
+        Draw the performance profile of Dolan and Moré.
+
+        Parameters
+        ----------
+        taus : sequence of float
+            The ratios of performance, larger or equal to 1.
+        numberOfBootstraps : int, optional
+            The number of bootstrap samples of the confidence bands.
+            The default is 0, which draws no band.
+        confidenceLevel : float, optional
+            The confidence level of the bands.
+            The default is 0.95.
+
+        Returns
+        -------
+        graph : ot.Graph
+            The profile of each method.
+        """
+        taus = np.asarray(taus, dtype=float)
+        profile = self.computePerformanceProfile(taus)
+        bands = None
+        if numberOfBootstraps > 0:
+            bands = self.computeBootstrapBands(
+                taus,
+                "Performance",
+                numberOfBootstraps=numberOfBootstraps,
+                confidenceLevel=confidenceLevel,
+            )
+        title = "Performance profile, %s digits" % (self.targetDigits)
+        graph = self._drawProfile(taus, profile, bands, title, r"$\tau$")
+        return graph
+
+    def drawDataProfile(
+        self, alphas, normalization=None, numberOfBootstraps=0, confidenceLevel=0.95
+    ):
+        """
+        Draw the data profile of Moré and Wild.
+
+        Parameters
+        ----------
+        alphas : sequence of float
+            The normalized budgets.
+        normalization : sequence of float, optional
+            The normalization of the cost of each problem.
+            The default is None, which uses 1 for every problem.
+        numberOfBootstraps : int, optional
+            The number of bootstrap samples of the confidence bands.
+            The default is 0, which draws no band.
+        confidenceLevel : float, optional
+            The confidence level of the bands.
+            The default is 0.95.
+
+        Returns
+        -------
+        graph : ot.Graph
+            The profile of each method.
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        profile = self.computeDataProfile(alphas, normalization)
+        bands = None
+        if numberOfBootstraps > 0:
+            bands = self.computeBootstrapBands(
+                alphas,
+                "Data",
+                normalization,
+                numberOfBootstraps=numberOfBootstraps,
+                confidenceLevel=confidenceLevel,
+            )
+        title = "Data profile, %s digits" % (self.targetDigits)
+        graph = self._drawProfile(alphas, profile, bands, title, r"$\alpha$")
+        return graph
@@ -2,22 +2,183 @@
 Manage reliability problems.
 """
 
+import math
+import time
+import openturns as ot
 import otbenchmark as otb
 
 
 class ReliabilityBenchmarkMetaAlgorithm:
-    def __init__(self, problem):
+    def __init__(self, problem, scheduler=None, profiler=None, cache=None):
         """
         Create a meta-algorithm to solve a reliability problem.
 
+        If the problem is expensive or if a scheduler is given, its
+        function is evaluated by the scheduler: each block of points
+        requested by an algorithm is split into chunks which are evaluated
+        concurrently.
+        If a cache is given, the points already evaluated are not evaluated
+        again: they are not counted in the number of function evaluations
+        of the result, but in its numberOfCacheHits attribute.
+        If a profiler is given, the evaluations of the function are
+        profiled: the profile of each run is the evaluationProfile
+        attribute of its result.
+        If the problem is a BlackBoxReliabilityProblem, the number of
+        function evaluations of a result is the number of points evaluated
+        by the server: the points found in the cache of the evaluator are
+        not counted.
+        In all cases, the algorithms are run on a copy of the problem,
+        whose event uses the function of the scheduler, the cache or the
+        profiler.
 
         Parameters
         ----------
         problem : ot.ReliabilityBenchmarkProblem
             The problem.
+        scheduler : EvaluationScheduler, optional
+            The scheduler of the function.
+            A given scheduler is used even if the problem is not expensive.
+            The default is None, which creates an EvaluationScheduler with
+            its default parameters if the problem is expensive.
+        profiler : EvaluationProfiler, optional
+            The profiler.
+            The default is None, which does not profile the runs.
+        cache : EvaluationCache, optional
+            The cache of the function of the problem, which can be shared
+            by several meta-algorithms on the same problem.
+            The default is None, which does not cache the evaluations.
         """
         #
         self.problem = problem
+        self.scheduler = None
+        self.profiler = profiler
+        self.cache = cache
+        self.initialNumberOfCacheHits = 0
+        # The remote function is lost when the problem is replaced
+        self.blackBoxFunction = None
+        if isinstance(problem, otb.BlackBoxReliabilityProblem):
+            self.blackBoxFunction = problem.getBlackBoxFunction()
+        g = problem.getEvent().getFunction()
+        # The cache is checked before the scheduler is used, and the
+        # profiler sees all the points requested by the algorithms
+        evaluatedFunction = g
+        if scheduler is None and problem.isExpensive():
+            scheduler = otb.EvaluationScheduler()
+        if scheduler is not None:
+            self.scheduler = scheduler
+            evaluatedFunction = scheduler.wrapFunction(g)
+        if cache is not None:
+            # The cache is bound to the function of the problem
+            g = cache.wrapFunction(g, evaluatedFunction)
+        else:
+            g = evaluatedFunction
+        if profiler is not None:
+            g = profiler.wrapFunction(g)
+        if self.scheduler is not None or cache is not None or profiler is not None:
+            self._replaceFunction(g)
+        return None
+
+    def _replaceFunction(self, g):
+        """
+        Replace the problem by a copy which uses another function.
+
+        Parameters
+        ----------
+        g : ot.Function
+            The new function of the event.
+
+        Returns
+        -------
+        None.
+        """
+        event = self.problem.getEvent()
+        inputVector = event.getAntecedent()
+        outputVector = ot.CompositeRandomVector(g, inputVector)
+        newEvent = ot.ThresholdEvent(
+            outputVector, event.getOperator(), event.getThreshold()
+        )
+        self.problem = otb.ReliabilityBenchmarkProblem(
+            self.problem.getName(), newEvent, self.problem.getProbability()
+        )
+        return None
+
+    def _getEvaluationCallsNumber(self):
+        """
+        Returns the number of evaluations of the function of the problem.
+
+        If the problem is a black-box problem, this is the number of points
+        evaluated by the server.
+        Otherwise, if the evaluations are cached, this is the number of
+        points which were not in the cache.
+
+        Returns
+        -------
+        numberOfCalls : int
+            The number of evaluations.
+        """
+        if self.blackBoxFunction is not None:
+            return self.blackBoxFunction.getNumberOfRemoteEvaluations()
+        if self.cache is not None:
+            return self.cache.numberOfMisses
+        g = self.problem.getEvent().getFunction()
+        numberOfCalls = g.getEvaluationCallsNumber()
+        return numberOfCalls
+
+    def _startRun(self, phase):
+        """
+        Start the profile of a run, if any, and count the cache hits.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the first phase.
+
+        Returns
+        -------
+        None.
+        """
+        if self.cache is not None:
+            self.initialNumberOfCacheHits = self.cache.numberOfHits
+        if self.profiler is not None:
+            self.profiler.start(phase)
+        return None
+
+    def _setPhase(self, phase):
+        """
+        Start a new phase of the profile of a run, if any.
+
+        Parameters
+        ----------
+        phase : str
+            The name of the phase.
+
+        Returns
+        -------
+        None.
+        """
+        if self.profiler is not None:
+            self.profiler.setPhase(phase)
+        return None
+
+    def _finishRun(self, result):
+        """
+        Attach the profile and the number of cache hits of a run to its
+        result.
+
+        Parameters
+        ----------
+        result : ReliabilityBenchmarkResult
+            The result of the run.
+
+        Returns
+        -------
+        None.
+        """
+        if self.cache is not None:
+            numberOfCacheHits = self.cache.numberOfHits - self.initialNumberOfCacheHits
+            result.numberOfCacheHits = numberOfCacheHits
+        if self.profiler is not None:
+            result.evaluationProfile = self.profiler.stop()
         return None
 
     def runFORM(self, nearestPointAlgorithm):
@@ -35,20 +196,23 @@ class ReliabilityBenchmarkMetaAlgorithm:
             The problem result.
         """
         algo = otb.FORM(self.problem, nearestPointAlgorithm)
-        event = self.problem.getEvent()
-        g = event.getFunction()
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
+        self._startRun("DesignPointSearch")
         try:
             algo.run()
+            self._setPhase("PostProcessing")
             resultFORM = algo.getResult()
             computedProbability = resultFORM.getEventProbability()
         except RuntimeError:
             computedProbability = 0.0
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         pfReference = self.problem.getProbability()
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
         return result
 
     def runSORM(self, nearestPointAlgorithm):
@@ -65,21 +229,24 @@ class ReliabilityBenchmarkMetaAlgorithm:
         result : ReliabilityBenchmarkResult
             The problem result.
         """
-        event = self.problem.getEvent()
-        g = event.getFunction()
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
         algo = otb.SORM(self.problem, nearestPointAlgorithm)
+        self._startRun("DesignPointSearch")
         try:
             algo.run()
+            self._setPhase("PostProcessing")
             resultSORM = algo.getResult()
             computedProbability = resultSORM.getEventProbabilityBreitung()
         except RuntimeError:
             computedProbability = 0.0
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         pfReference = self.problem.getProbability()
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
         return result
 
     def runMonteCarlo(
@@ -103,22 +270,25 @@ class ReliabilityBenchmarkMetaAlgorithm:
         result : ReliabilityBenchmarkResult
             The problem result.
         """
-        event = self.problem.getEvent()
-        g = event.getFunction()
         factory = otb.ProbabilitySimulationAlgorithmFactory()
         algo = factory.buildMonteCarlo(self.problem)
         algo.setMaximumOuterSampling(maximumOuterSampling)
         algo.setBlockSize(blockSize)
         algo.setMaximumCoefficientOfVariation(coefficientOfVariation)
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
+        self._startRun("Sampling")
         algo.run()
+        self._setPhase("PostProcessing")
         resultMC = algo.getResult()
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         computedProbability = resultMC.getProbabilityEstimate()
         pfReference = self.problem.getProbability()
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
         return result
 
     def runFORMImportanceSampling(
@@ -149,24 +319,28 @@ class ReliabilityBenchmarkMetaAlgorithm:
             The problem result.
         """
         factory = otb.ProbabilitySimulationAlgorithmFactory()
-        event = self.problem.getEvent()
-        g = event.getFunction()
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
+        self._startRun("DesignPointSearch")
         try:
             algo = factory.buildFORMIS(self.problem, nearestPointAlgorithm)
             algo.setMaximumCoefficientOfVariation(coefficientOfVariation)
             algo.setMaximumOuterSampling(maximumOuterSampling)
             algo.setBlockSize(blockSize)
+            self._setPhase("Sampling")
             algo.run()
+            self._setPhase("PostProcessing")
             result = algo.getResult()
             computedProbability = result.getProbabilityEstimate()
         except RuntimeError:
             computedProbability = 0.0
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         pfReference = self.problem.getProbability()
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
         return result
 
     def runSubsetSampling(
@@ -189,21 +363,24 @@ class ReliabilityBenchmarkMetaAlgorithm:
         result : ReliabilityBenchmarkResult
             The problem result.
         """
-        event = self.problem.getEvent()
-        g = event.getFunction()
         algo = otb.SubsetSampling(self.problem)
         algo.setMaximumOuterSampling(maximumOuterSampling)
         algo.setMaximumCoefficientOfVariation(coefficientOfVariation)
         algo.setBlockSize(blockSize)
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
+        self._startRun("Sampling")
         algo.run()
+        self._setPhase("PostProcessing")
         resultSS = algo.getResult()
         computedProbability = resultSS.getProbabilityEstimate()
         pfReference = self.problem.getProbability()
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
         return result
 
     def runLHS(
@@ -226,18 +403,148 @@ class ReliabilityBenchmarkMetaAlgorithm:
         result : ReliabilityBenchmarkResult
             The problem result.
         """
-        event = self.problem.getEvent()
-        g = event.getFunction()
         algo = otb.LHS(self.problem)
-        initialNumberOfCall = g.getEvaluationCallsNumber()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
         algo.setMaximumCoefficientOfVariation(coefficientOfVariation)
         algo.setMaximumOuterSampling(maximumOuterSampling)
+        self._startRun("Sampling")
         algo.run()
-        numberOfFunctionEvaluations = g.getEvaluationCallsNumber() - initialNumberOfCall
+        self._setPhase("PostProcessing")
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
         result = algo.getResult()
         computedProbability = result.getProbabilityEstimate()
         pfReference = self.problem.getProbability()
         result = otb.ReliabilityBenchmarkResult(
             pfReference, computedProbability, numberOfFunctionEvaluations
         )
+        self._finishRun(result)
+        return result
+
+    @staticmethod
+    def GetTargetAccuracyMethods():
+        """
+        Get the sampling methods which can be run until a target accuracy.
+
+        Returns
+        -------
+        methods_list : list of str
+            The list of methods.
+        """
+        methods_list = ["MonteCarlo", "FORMIS", "LHS"]
+        return methods_list
+
+    def runTargetAccuracy(
+        self,
+        method,
+        numberOfDigits,
+        confidenceLevel=0.95,
+        maximumOuterSampling=100000,
+        blockSize=100,
+        nearestPointAlgorithm=None,
+    ):
+        """
+        Runs a sampling method until it gets a number of correct digits.
+
+        After each block, the confidence interval of the running estimate of
+        the probability is computed with the Gaussian distribution.
+        The run stops when all the probabilities in the confidence interval
+        have the target number of correct digits with respect to the exact
+        probability of the problem, i.e. when:
+
+            |estimate - exact| + halfWidth <= 10^(-numberOfDigits) * exact
+
+        or when the maximum number of outer iterations is reached.
+        The cost to reach the target is the number of function evaluations
+        and the elapsedTime attribute of the result.
+
+        Parameters
+        ----------
+        method : str
+            The sampling method, see GetTargetAccuracyMethods().
+        numberOfDigits : float
+            The target number of correct digits.
+        confidenceLevel : float, optional
+            The confidence level.
+            The default is 0.95.
+        maximumOuterSampling : int, optional
+            The maximum number of outer iterations.
+            The default is 100000.
+        blockSize : int, optional
+            The number of inner iterations.
+            The default is 100.
+        nearestPointAlgorithm : ot.OptimizationAlgorithm, optional
+            Optimization algorithm used to search the design point of FORMIS.
+            The default is None, which uses ot.AbdoRackwitz().
+
+        Returns
+        -------
+        result : ReliabilityBenchmarkResult
+            The problem result.
+            Its elapsedTime attribute is the wall time of the run and its
+            isTargetReached attribute is True if the target was reached.
+        """
+        if method not in ReliabilityBenchmarkMetaAlgorithm.GetTargetAccuracyMethods():
+            raise ValueError("Unknown value of method %s" % (method))
+        pfReference = self.problem.getProbability()
+        quantile = ot.Normal().computeQuantile((1.0 + confidenceLevel) / 2.0)[0]
+        tolerance = 10.0 ** (-numberOfDigits) * pfReference
+        factory = otb.ProbabilitySimulationAlgorithmFactory()
+        initialNumberOfCall = self._getEvaluationCallsNumber()
+        startTime = time.perf_counter()
+        if method == "FORMIS":
+            self._startRun("DesignPointSearch")
+            if nearestPointAlgorithm is None:
+                nearestPointAlgorithm = ot.AbdoRackwitz()
+            try:
+                algo = factory.buildFORMIS(self.problem, nearestPointAlgorithm)
+            except RuntimeError:
+                algo = None
+            self._setPhase("Sampling")
+        else:
+            self._startRun("Sampling")
+            if method == "MonteCarlo":
+                algo = factory.buildMonteCarlo(self.problem)
+            else:
+                # Each block must be a new LHS design
+                experiment = ot.LHSExperiment()
+                experiment.setAlwaysShuffle(True)
+                algo = ot.ProbabilitySimulationAlgorithm(
+                    self.problem.getEvent(), experiment
+                )
+        isTargetReached = False
+        computedProbability = 0.0
+        if algo is not None:
+            algo.setMaximumOuterSampling(maximumOuterSampling)
+            algo.setBlockSize(blockSize)
+            algo.setMaximumCoefficientOfVariation(0.0)
+            # The result of the algorithm is only set at the end of the run:
+            # the running estimate is the last point of the convergence
+            algo.setConvergenceStrategy(ot.Full())
+
+            def stop():
+                nonlocal isTargetReached
+                estimate, variance, _ = algo.getConvergenceStrategy().getSample()[-1]
+                if variance < 0.0:
+                    # No failure yet
+                    return False
+                halfWidth = quantile * math.sqrt(variance)
+                isTargetReached = abs(estimate - pfReference) + halfWidth <= tolerance
+                return isTargetReached
+
+            algo.setStopCallback(stop)
+            algo.run()
+            self._setPhase("PostProcessing")
+            computedProbability = algo.getResult().getProbabilityEstimate()
+        elapsedTime = time.perf_counter() - startTime
+        numberOfFunctionEvaluations = (
+            self._getEvaluationCallsNumber() - initialNumberOfCall
+        )
+        result = otb.ReliabilityBenchmarkResult(
+            pfReference, computedProbability, numberOfFunctionEvaluations
+        )
+        result.elapsedTime = elapsedTime
+        result.isTargetReached = isTargetReached
+        self._finishRun(result)
         return result
@@ -55,8 +55,43 @@ class ReliabilityBenchmarkProblem:
             )
         self.probability = probability
 
+        self.expensive = False
         return None
 
+    def setExpensive(self, expensive):
+        """
+        Set the expensive flag of the problem.
+
+        The function of an expensive problem is evaluated by an
+        EvaluationScheduler in the meta-algorithms.
+
+        Parameters
+        ----------
+        expensive : bool
+            If True, the function is expensive.
+
+        Returns
+        -------
+        None.
+        """
+        self.expensive = expensive
+        return None
+
+    def isExpensive(self):
+        """
+        Return the expensive flag of the problem.
+
+        Parameters
+        ----------
+        None.
+
+        Returns
+        -------
+        expensive : bool
+            If True, the function is expensive.
+        """
+        return self.expensive
+
     def getEvent(self):
         """
         Return the event.
@@ -2,6 +2,7 @@
 Manage reliability problems.
 """
 
+import math
 import otbenchmark as otb
 
 
@@ -29,6 +30,20 @@ class ReliabilityBenchmarkResult:
             The log-relative error in base 10.
         numberOfDigitsPerEvaluation: float
             The number of correct digits per function evaluation.
+            It is NaN if there is no function evaluation, e.g. when all
+            the points are found in an EvaluationCache.
+        numberOfCacheHits: int
+            The number of points found in an EvaluationCache, which are
+            not counted in numberOfFunctionEvaluations.
+        evaluationProfile: dict
+            The profile of the evaluations, computed by an
+            EvaluationProfiler, or None.
+        elapsedTime: float
+            The wall time of the run in seconds, set by
+            ReliabilityBenchmarkMetaAlgorithm.runTargetAccuracy(), or None.
+        isTargetReached: bool
+            True if the target number of correct digits was reached, set by
+            ReliabilityBenchmarkMetaAlgorithm.runTargetAccuracy(), or None.
         """
         self.computedProbability = computedProbability
         self.exactProbability = exactProbability
@@ -39,9 +54,16 @@ class ReliabilityBenchmarkResult:
         )
         self.numberOfCorrectDigits = numberOfCorrectDigits
         self.numberOfFunctionEvaluations = numberOfFunctionEvaluations
-        self.numberOfDigitsPerEvaluation = (
-            self.numberOfCorrectDigits / self.numberOfFunctionEvaluations
-        )
+        if numberOfFunctionEvaluations == 0:
+            self.numberOfDigitsPerEvaluation = math.nan
+        else:
+            self.numberOfDigitsPerEvaluation = (
+                self.numberOfCorrectDigits / self.numberOfFunctionEvaluations
+            )
+        self.numberOfCacheHits = 0
+        self.evaluationProfile = None
+        self.elapsedTime = None
+        self.isTargetReached = None
         return None
 
     def summary(self):
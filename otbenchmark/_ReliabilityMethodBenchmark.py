@@ -0,0 +1,554 @@
+"""
+Benchmark the reliability methods on the reliability problems.
+"""
+
+import csv
+import json
+import math
+import multiprocessing
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import openturns as ot
+import otbenchmark as otb
+
+# The benchmark of a worker process
+_workerBenchmark = None
+
+
+def _initializeWorker(benchmark):
+    """
+    Set the benchmark of a worker process.
+
+    Parameters
+    ----------
+    benchmark : ReliabilityMethodBenchmark
+        The benchmark.
+
+    Returns
+    -------
+    None.
+    """
+    global _workerBenchmark
+    _workerBenchmark = benchmark
+    return None
+
+
+def _runWorkerProblem(problemIndex, method):
+    """
+    Run one method on one problem in a worker process.
+
+    Parameters
+    ----------
+    problemIndex : int
+        The index of the problem.
+    method : str
+        The method.
+
+    Returns
+    -------
+    record : dict
+        The measure.
+    """
+    problem = _workerBenchmark.problems[problemIndex]
+    record = _workerBenchmark.runProblem(problem, method)
+    return record
+
+
+class ReliabilityMethodBenchmark:
+    @staticmethod
+    def GetMethods():
+        """
+        Get the available methods.
+
+        Returns
+        -------
+        methods_list : list of str
+            The list of available methods.
+        """
+        methods_list = ["FORM", "SORM", "MonteCarlo", "FORMIS", "SubsetSampling", "LHS"]
+        return methods_list
+
+    def __init__(
+        self,
+        problems=None,
+        methods=None,
+        seed=0,
+        nearestPointAlgorithm=None,
+        maximumOuterSampling=100,
+        blockSize=100,
+        coefficientOfVariation=0.0,
+        measureMemory=True,
+        profiler=None,
+    ):
+        """
+        Benchmark the reliability methods on the reliability problems.
+
+        Each method of ReliabilityBenchmarkMetaAlgorithm is run on each
+        problem, with the same seed and the same budget, so that two runs
+        of the benchmark, e.g. with two versions of OpenTURNS, can be
+        compared.
+
+        Each record contains the attributes of the ReliabilityBenchmarkResult,
+        the wall time, the number of correct digits per second and the peak
+        of the Python heap, in the "pythonMemory" item.
+        The Python heap is the peak of the Python and NumPy allocations
+        measured by tracemalloc.
+        It does not contain the C++ objects allocated by OpenTURNS, such as
+        the samples of the simulation methods.
+        Since tracemalloc slows the Python functions down, the Python heap
+        can be ignored in order to get more accurate times.
+
+        Parameters
+        ----------
+        problems : list of ReliabilityBenchmarkProblem, optional
+            The problems.
+            The default is None, which uses ReliabilityBenchmarkProblemList().
+        methods : list of str, optional
+            The methods.
+            The default is None, which uses all the methods of GetMethods().
+        seed : int, optional
+            The seed of the random generator, set before each method.
+            The default is 0.
+        nearestPointAlgorithm : ot.OptimizationAlgorithm, optional
+            Optimization algorithm used to search the design point.
+            The default is None, which uses ot.AbdoRackwitz() with at most
+            1000 function calls.
+        maximumOuterSampling : int, optional
+            The maximum number of outer iterations of the simulation methods.
+            The default is 100.
+        blockSize : int, optional
+            The number of inner iterations of the simulation methods.
+            The default is 100.
+        coefficientOfVariation : float, optional
+            The maximum coefficient of variation of the simulation methods.
+            The default is 0, which uses the whole budget.
+        measureMemory : bool, optional
+            If True, measure the peak of the Python heap of each method.
+            The default is True.
+        profiler : EvaluationProfiler, optional
+            The profiler of the function evaluations.
+            If given, the profile of each run is the "evaluationProfile"
+            item of its record, which is not saved in CSV files.
+            The default is None, which does not profile the runs.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> benchmark = otb.ReliabilityMethodBenchmark(methods=["FORM", "SORM"])
+        >>> records = benchmark.run()
+        >>> benchmark.save("methods.csv")
+        """
+        if problems is None:
+            problems = otb.ReliabilityBenchmarkProblemList()
+        if methods is None:
+            methods = ReliabilityMethodBenchmark.GetMethods()
+        for method in methods:
+            if method not in ReliabilityMethodBenchmark.GetMethods():
+                raise ValueError("Unknown value of method %s" % (method))
+        if nearestPointAlgorithm is None:
+            nearestPointAlgorithm = ot.AbdoRackwitz()
+            nearestPointAlgorithm.setMaximumCallsNumber(1000)
+        self.problems = problems
+        self.methods = methods
+        self.seed = seed
+        self.nearestPointAlgorithm = nearestPointAlgorithm
+        self.maximumOuterSampling = maximumOuterSampling
+        self.blockSize = blockSize
+        self.coefficientOfVariation = coefficientOfVariation
+        self.measureMemory = measureMemory
+        self.profiler = profiler
+        self.records = []
+
+    def _runMethod(self, metaAlgorithm, method):
+        """
+        Run one method.
+
+        Parameters
+        ----------
+        metaAlgorithm : ReliabilityBenchmarkMetaAlgorithm
+            The meta-algorithm of the problem.
+        method : str
+            The method.
+
+        Returns
+        -------
+        result : ReliabilityBenchmarkResult
+            The problem result.
+        """
+        if method == "FORM":
+            result = metaAlgorithm.runFORM(self.nearestPointAlgorithm)
+        elif method == "SORM":
+            result = metaAlgorithm.runSORM(self.nearestPointAlgorithm)
+        elif method == "FORMIS":
+            result = metaAlgorithm.runFORMImportanceSampling(
+                self.nearestPointAlgorithm,
+                maximumOuterSampling=self.maximumOuterSampling,
+                coefficientOfVariation=self.coefficientOfVariation,
+                blockSize=self.blockSize,
+            )
+        else:
+            if method == "MonteCarlo":
+                runSimulation = metaAlgorithm.runMonteCarlo
+            elif method == "SubsetSampling":
+                runSimulation = metaAlgorithm.runSubsetSampling
+            else:
+                runSimulation = metaAlgorithm.runLHS
+            result = runSimulation(
+                maximumOuterSampling=self.maximumOuterSampling,
+                coefficientOfVariation=self.coefficientOfVariation,
+                blockSize=self.blockSize,
+            )
+        return result
+
+    def runProblem(self, problem, method):
+        """
+        Run one method on one problem.
+
+        Parameters
+        ----------
+        problem : ReliabilityBenchmarkProblem
+            The problem.
+        method : str
+            The method.
+
+        Returns
+        -------
+        record : dict
+            The measure.
+        """
+        metaAlgorithm = otb.ReliabilityBenchmarkMetaAlgorithm(
+            problem, profiler=self.profiler
+        )
+        ot.RandomGenerator.SetSeed(self.seed)
+        if self.measureMemory:
+            tracemalloc.start()
+        startTime = time.perf_counter()
+        result = self._runMethod(metaAlgorithm, method)
+        elapsedTime = time.perf_counter() - startTime
+        if self.measureMemory:
+            _, peakMemory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            peakMemory = math.nan
+        record = {
+            "problem": problem.getName(),
+            "method": method,
+            "seed": self.seed,
+            "exactProbability": result.exactProbability,
+            "computedProbability": result.computedProbability,
+            "absoluteError": result.absoluteError,
+            "numberOfCorrectDigits": result.numberOfCorrectDigits,
+            "numberOfFunctionEvaluations": result.numberOfFunctionEvaluations,
+            "numberOfDigitsPerEvaluation": result.numberOfDigitsPerEvaluation,
+            "time": elapsedTime,
+            "numberOfDigitsPerSecond": result.numberOfCorrectDigits / elapsedTime,
+            "pythonMemory": peakMemory,
+            "openturnsVersion": ot.__version__,
+            "otbenchmarkVersion": otb.__version__,
+        }
+        if self.profiler is not None:
+            record["evaluationProfile"] = result.evaluationProfile
+        return record
+
+    def getParameters(self, method):
+        """
+        Returns the parameters of a method.
+
+        Parameters
+        ----------
+        method : str
+            The method.
+
+        Returns
+        -------
+        parameters : dict
+            The parameters which change the result of the method.
+        """
+        parameters = {}
+        if method in ["FORM", "SORM", "FORMIS"]:
+            algorithm = self.nearestPointAlgorithm
+            parameters["nearestPointAlgorithm"] = algorithm.getClassName()
+            parameters["maximumCallsNumber"] = algorithm.getMaximumCallsNumber()
+        if method not in ["FORM", "SORM"]:
+            parameters["maximumOuterSampling"] = self.maximumOuterSampling
+            parameters["blockSize"] = self.blockSize
+            parameters["coefficientOfVariation"] = self.coefficientOfVariation
+        return parameters
+
+    def _addRecord(self, store, record):
+        """
+        Add a record to a store.
+
+        Parameters
+        ----------
+        store : CampaignStore
+            The store of the results, or None.
+        record : dict
+            The measure.
+
+        Returns
+        -------
+        None.
+        """
+        if store is None:
+            return None
+        metrics = dict(record)
+        for key in ["problem", "method", "seed"]:
+            del metrics[key]
+        method = record["method"]
+        store.add(
+            record["problem"],
+            method,
+            self.getParameters(method),
+            self.seed,
+            metrics,
+            record["time"],
+        )
+        return None
+
+    def run(self, store=None, numberOfWorkers=1):
+        """
+        Run each method on each problem.
+
+        If a store is given, the cells of the campaign which are in the
+        store are not run again: their records are read from the store.
+        The records of the other cells are added to the store.
+
+        If several workers are used, the cells are run concurrently in
+        separate processes.
+        The processes are forked if possible, so that the problems are not
+        pickled: some functions, e.g. some symbolic functions, cannot be
+        pickled.
+        Since the workers share the processors, the times are less accurate.
+
+        Parameters
+        ----------
+        store : CampaignStore, optional
+            The store of the results.
+            The default is None, which does not store the results.
+        numberOfWorkers : int, optional
+            The number of processes.
+            The default is 1, which runs the cells in the current process.
+
+        Returns
+        -------
+        records : list of dict
+            The measures, one for each problem and each method.
+        """
+        self.records = []
+        # The cells to run
+        cells = []
+        for problemIndex, problem in enumerate(self.problems):
+            for method in self.methods:
+                record = None
+                if store is not None:
+                    name = problem.getName()
+                    parameters = self.getParameters(method)
+                    result = store.getResult(name, method, parameters, self.seed)
+                    if result is not None:
+                        record = {"problem": name, "method": method, "seed": self.seed}
+                        record.update(result["metrics"])
+                if record is None:
+                    cells.append((len(self.records), problemIndex, method))
+                self.records.append(record)
+        if numberOfWorkers == 1:
+            for index, problemIndex, method in cells:
+                problem = self.problems[problemIndex]
+                self.records[index] = self.runProblem(problem, method)
+                self._addRecord(store, self.records[index])
+        else:
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+            else:
+                context = None
+            with ProcessPoolExecutor(
+                max_workers=numberOfWorkers,
+                mp_context=context,
+                initializer=_initializeWorker,
+                initargs=(self,),
+            ) as executor:
+                futures = {
+                    executor.submit(_runWorkerProblem, problemIndex, method): index
+                    for index, problemIndex, method in cells
+                }
+                # The records are stored as soon as they are computed
+                for future in as_completed(futures):
+                    self.records[futures[future]] = future.result()
+                    self._addRecord(store, self.records[futures[future]])
+        if store is not None:
+            store.flush()
+        return self.records
+
+    def save(self, filename):
+        """
+        Save the measures into a JSON or a CSV file.
+
+        The format is given by the extension of the file name: ".csv" for
+        CSV, JSON otherwise.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        None.
+        """
+        with open(filename, "w", newline="") as file:
+            if filename.endswith(".csv"):
+                fieldnames = [
+                    key for key in self.records[0].keys() if key != "evaluationProfile"
+                ]
+                writer = csv.DictWriter(
+                    file, fieldnames=fieldnames, extrasaction="ignore"
+                )
+                writer.writeheader()
+                writer.writerows(self.records)
+            else:
+                json.dump(self.records, file, indent=1)
+        return None
+
+    @staticmethod
+    def Load(filename):
+        """
+        Load the measures from a JSON or a CSV file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        records : list of dict
+            The measures.
+        """
+        with open(filename, "r", newline="") as file:
+            if not filename.endswith(".csv"):
+                records = json.load(file)
+                return records
+            records = []
+            for row in csv.DictReader(file):
+                record = {}
+                for key, value in row.items():
+                    if key in ["problem", "method"] or key.endswith("Version"):
+                        record[key] = value
+                    elif key in ["seed", "numberOfFunctionEvaluations"]:
+                        record[key] = int(value)
+                    else:
+                        record[key] = float(value)
+                records.append(record)
+        return records
+
+    @staticmethod
+    def Compare(
+        records,
+        baselineRecords,
+        digitsThreshold=0.5,
+        callsThreshold=0.1,
+        timeThreshold=0.5,
+    ):
+        """
+        Compare measures to a baseline.
+
+        A measure is a regression if:
+
+        * its number of correct digits is lower than the baseline minus
+          digitsThreshold,
+        * its number of function evaluations is larger than
+          (1 + callsThreshold) times the baseline,
+        * its time is larger than (1 + timeThreshold) times the baseline.
+
+        The measures which are not in the baseline are ignored.
+
+        Parameters
+        ----------
+        records : list of dict
+            The measures.
+        baselineRecords : list of dict
+            The baseline measures.
+        digitsThreshold : float, optional
+            The absolute threshold of the number of correct digits.
+            The default is 0.5.
+        callsThreshold : float, optional
+            The relative threshold of the number of function evaluations.
+            The default is 0.1.
+        timeThreshold : float, optional
+            The relative threshold of the time.
+            The default is 0.5.
+
+        Returns
+        -------
+        regressions : list of dict
+            The regressions.
+            Each regression has the keys "problem", "method", "seed",
+            "metric", "value" and "baseline".
+        """
+        baseline = {}
+        for record in baselineRecords:
+            key = (record["problem"], record["method"], record["seed"])
+            baseline[key] = record
+        regressions = []
+        for record in records:
+            key = (record["problem"], record["method"], record["seed"])
+            if key not in baseline:
+                continue
+            reference = baseline[key]
+            isRegression = {
+                "numberOfCorrectDigits": record["numberOfCorrectDigits"]
+                < reference["numberOfCorrectDigits"] - digitsThreshold,
+                "numberOfFunctionEvaluations": record["numberOfFunctionEvaluations"]
+                > (1.0 + callsThreshold) * reference["numberOfFunctionEvaluations"],
+                "time": record["time"] > (1.0 + timeThreshold) * reference["time"],
+            }
+            for metric in isRegression:
+                if isRegression[metric]:
+                    regression = {
+                        "problem": record["problem"],
+                        "method": record["method"],
+                        "seed": record["seed"],
+                        "metric": metric,
+                        "value": record[metric],
+                        "baseline": reference[metric],
+                    }
+                    regressions.append(regression)
+        return regressions
+
+    @staticmethod
+    def FormatReport(regressions):
+        """
+        Returns a string which presents the regressions.
+
+        Parameters
+        ----------
+        regressions : list of dict
+            The regressions, as returned by Compare().
+
+        Returns
+        -------
+        s : str
+            The report.
+        """
+        if len(regressions) == 0:
+            return "No regression"
+        lines = ["%d regression(s)" % (len(regressions))]
+        for regression in regressions:
+            lines.append(
+                "%s, %s, seed = %d : %s = %s (baseline = %s)"
+                % (
+                    regression["problem"],
+                    regression["method"],
+                    regression["seed"],
+                    regression["metric"],
+                    regression["value"],
+                    regression["baseline"],
+                )
+            )
+        s = "\n".join(lines)
+        return s
@@ -0,0 +1,146 @@
+"""
+Estimates first order Sobol' indices with replicated Latin Hypercube Samplings.
+
+Jean-Yves Tissot, Clémentine Prieur.
+A randomized orthogonal array-based procedure for the estimation of first- and
+second-order Sobol' indices.
+Journal of Statistical Computation and Simulation, 2015, 85 (7), pp.1358-1381.
+⟨10.1080/00949655.2014.971799⟩. ⟨hal-00743964v6⟩
+
+Thierry A. Mara, Onimihamina Rakoto Joseph.
+Comparison of some efficient methods to evaluate the main effect of computer
+model factors.
+Journal of Statistical Computation and Simulation, 2008, 78 (2), pp.167-178.
+
+The design is made of two Latin Hypercube Samplings (LHS) A and B of
+the same size.
+Each column of B is an independent random permutation of the corresponding
+column of A.
+Hence, for any input variable, reordering B so that its column matches the
+column of A produces pick-freeze pairs for this variable.
+This is why all the first order indices are estimated with 2 * size function
+evaluations, independently of the dimension.
+Total order indices cannot be estimated with this design.
+"""
+
+import openturns as ot
+import numpy as np
+from ._JanonSensitivityAlgorithm import computeJanonTerms
+
+
+class ReplicatedLHSSensitivityAlgorithm:
+    @staticmethod
+    def Generate(distribution, size):
+        """
+        Generate a replicated LHS design.
+
+        Parameters
+        ----------
+        distribution : ot.Distribution(dimension)
+            The input distribution.
+            Its copula must be independent.
+        size : int
+            The size of each LHS.
+
+        Returns
+        -------
+        inputDesign : ot.Sample(2 * size, dimension)
+            The input design, made of the blocks A and B.
+        """
+        if not distribution.hasIndependentCopula():
+            raise ValueError("The copula of the distribution must be independent")
+        dimension = distribution.getDimension()
+        experiment = ot.LHSExperiment(distribution, size)
+        sampleA = np.array(experiment.generate())
+        # Permute each column independently
+        uniform = np.array(ot.RandomGenerator.Generate(size * dimension)).reshape(
+            size, dimension
+        )
+        permutations = np.argsort(uniform, axis=0)
+        sampleB = np.take_along_axis(sampleA, permutations, axis=0)
+        inputDesign = ot.Sample(np.vstack((sampleA, sampleB)))
+        inputDesign.setDescription(distribution.getDescription())
+        return inputDesign
+
+    def __init__(self, inputDesign, outputDesign, size):
+        """
+        Estimates first order Sobol' indices with replicated LHS.
+
+        The pick-freeze pairs of all the input variables are retrieved at once
+        by sorting the columns of A and B.
+
+        Parameters
+        ----------
+        inputDesign : ot.Sample(2 * size, dimension)
+            The input sample, generated by Generate().
+        outputDesign : ot.Sample(2 * size, outputDimension)
+            The output sample.
+        size : int
+            The size of each LHS.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.inputDesign = inputDesign
+        self.inputDimension = inputDesign.getDimension()
+        self.outputDimension = outputDesign.getDimension()
+        self.size = size
+        self.outputDesign = outputDesign
+        if inputDesign.getSize() != 2 * size or outputDesign.getSize() != 2 * size:
+            raise ValueError(
+                "The size of the designs must be %d, but input size is %d "
+                "and output size is %d"
+                % (2 * size, inputDesign.getSize(), outputDesign.getSize())
+            )
+        inputBlocks = np.asarray(inputDesign).reshape(2, size, self.inputDimension)
+        outputBlocks = np.asarray(outputDesign).reshape(2, size, self.outputDimension)
+        # orderA[k, j] and orderB[k, j] are the rows of A and B which share
+        # the k-th smallest value of the j-th input
+        orderA = np.argsort(inputBlocks[0], axis=0)
+        orderB = np.argsort(inputBlocks[1], axis=0)
+        # yA[j, k, :] and yB[j, k, :] are the outputs of the k-th pair
+        # for the j-th input
+        yA = outputBlocks[0][orderA.T]
+        yB = outputBlocks[1][orderB.T]
+        self.numerator, self.denominator = computeJanonTerms(yA, yB)
+        self.indicesF = self.numerator / self.denominator
+
+    def getFirstOrderIndices(self, marginalIndex=0):
+        """
+        Returns first order Sobol' indices.
+
+        Parameters
+        ----------
+        marginalIndex : int, optional
+            The index of the output. The default is 0.
+
+        Returns
+        -------
+        indices : ot.Point(dimension)
+            The first order Sobol' indices.
+
+        """
+        if marginalIndex < 0 or marginalIndex >= self.outputDimension:
+            raise ValueError(
+                "The marginal index %d must be in [0, %d]"
+                % (marginalIndex, self.outputDimension - 1)
+            )
+        return ot.Point(self.indicesF[:, marginalIndex])
+
+    def getAggregatedFirstOrderIndices(self):
+        """
+        Returns aggregated first order Sobol' indices.
+
+        The indices of the outputs are weighted by the variance of each output.
+
+        Returns
+        -------
+        indices : ot.Point(dimension)
+            The aggregated first order Sobol' indices.
+
+        """
+        numerator = np.sum(self.numerator, axis=-1)
+        denominator = np.sum(self.denominator, axis=-1)
+        return ot.Point(numerator / denominator)
@@ -37,18 +37,41 @@ class SensitivityBenchmarkMetaAlgorithm:
         ]
         return estimators_list
 
-    def __init__(self, problem):
+    def __init__(self, problem, scheduler=None):
         """
         Create a meta-algorithm to solve a sensitivity problem.
 
+        If the problem is expensive or if a scheduler is given, its
+        function is evaluated by the scheduler: each design of experiments
+        is split into chunks which are evaluated concurrently.
+        The estimators are then run on a copy of the problem, which uses
+        the function of the scheduler.
 
         Parameters
         ----------
         problem : ot.SensitivityBenchmarkProblem
             The problem.
+        scheduler : EvaluationScheduler, optional
+            The scheduler of the function.
+            A given scheduler is used even if the problem is not expensive.
+            The default is None, which creates an EvaluationScheduler with
+            its default parameters if the problem is expensive.
         """
         #
         self.problem = problem
+        self.scheduler = None
+        if scheduler is None and problem.isExpensive():
+            scheduler = otb.EvaluationScheduler()
+        if scheduler is not None:
+            self.scheduler = scheduler
+            function = scheduler.wrapFunction(problem.getFunction())
+            self.problem = otb.SensitivityBenchmarkProblem(
+                problem.getName(),
+                problem.getInputDistribution(),
+                function,
+                problem.getFirstOrderIndices(),
+                problem.getTotalOrderIndices(),
+            )
         return None
 
     def runSamplingEstimator(
@@ -63,13 +86,20 @@ class SensitivityBenchmarkMetaAlgorithm:
         https://github.com/openturns/openturns/issues/1884
         This is why the estimator input argument is currently a string.
 
+        The "ReplicatedLHS" estimator only estimates first order indices,
+        using 2 * sample_size function evaluations regardless of the dimension.
+        Its design is always a replicated LHS, so that the sampling method
+        is ignored.
+        Its total order indices are set to NaN.
+
         Parameters
         ----------
         sample_size: int
             The sample size.
         estimator : str
             The estimator.
-            Must be "Saltelli", "Jansen", "Martinez", "MauntzKucherenko", "Janon".
+            Must be "Saltelli", "Jansen", "Martinez", "MauntzKucherenko", "Janon",
+            "ReplicatedLHS".
         sampling_method : str
             The sampling method.
             Must be "MonteCarlo" or "LHS" or "QMC".
@@ -95,6 +125,17 @@ class SensitivityBenchmarkMetaAlgorithm:
             )
         distribution = self.problem.getInputDistribution()
         model = self.problem.getFunction()
+        if estimator == "ReplicatedLHS":
+            inputDesign = otb.ReplicatedLHSSensitivityAlgorithm.Generate(
+                distribution, sample_size
+            )
+            outputDesign = model(inputDesign)
+            sobolAlgorithm = otb.ReplicatedLHSSensitivityAlgorithm(
+                inputDesign, outputDesign, sample_size
+            )
+            first_order = sobolAlgorithm.getFirstOrderIndices()
+            total_order = ot.Point(distribution.getDimension(), float("nan"))
+            return first_order, total_order
         experiment = ot.SobolIndicesExperiment(distribution, sample_size)
         inputDesign = experiment.generate()
         outputDesign = model(inputDesign)
@@ -118,12 +159,65 @@ class SensitivityBenchmarkMetaAlgorithm:
         total_order = sobolAlgorithm.getTotalOrderIndices()
         return first_order, total_order
 
+    def runGivenDataEstimator(
+        self,
+        sample_size=None,
+        estimator="Rank",
+        inputSample=None,
+        outputSample=None,
+        numberOfBins=None,
+    ):
+        """
+        Estimate first order sensitivity indices from one i.i.d. sample.
+
+        If the input and output samples are given, then they are used
+        and the function is not evaluated.
+        This allows to reuse an existing Monte-Carlo sample, e.g. the
+        outputs computed by a reliability algorithm.
+        Otherwise, a Monte-Carlo sample of the input distribution is
+        generated, which costs sample_size function evaluations.
+
+        Parameters
+        ----------
+        sample_size : int, optional
+            The sample size.
+            The default is None, which is only valid if the samples are given.
+        estimator : str, optional
+            The estimator.
+            Must be "Rank", "Chatterjee" or "Binning". The default is "Rank".
+        inputSample : ot.Sample(size, dimension), optional
+            The input sample. The default is None.
+        outputSample : ot.Sample(size, 1), optional
+            The output sample. The default is None.
+        numberOfBins : int, optional
+            The number of bins of the "Binning" estimator.
+            The default is None, which uses the square root of the size.
+
+        Returns
+        -------
+        first_order: ot.Point(dimension)
+            The first order indices.
+        """
+        if inputSample is None or outputSample is None:
+            if sample_size is None:
+                raise ValueError("The sample size or the samples must be given")
+            distribution = self.problem.getInputDistribution()
+            model = self.problem.getFunction()
+            inputSample = distribution.getSample(sample_size)
+            outputSample = model(inputSample)
+        sobolAlgorithm = otb.GivenDataSensitivityAlgorithm(
+            inputSample, outputSample, estimator, numberOfBins
+        )
+        first_order = sobolAlgorithm.getFirstOrderIndices()
+        return first_order
+
     def runPolynomialChaosEstimator(
         self,
         sample_size_train=100,
         sample_size_test=100,
         total_degree=2,
         hyperbolic_quasinorm=0.5,
+        context=None,
     ):
         """
         Estimate Sobol' sensitivity indices from sparse polynomial chaos.
@@ -144,6 +238,10 @@ class SensitivityBenchmarkMetaAlgorithm:
             The total polynomial degree. The default is 2.
         hyperbolic_quasinorm : float, optional
             The hyperbolic quasi-norm. The default is 0.5.
+        context : SparsePolynomialChaosContext, optional
+            The polynomial chaos basis and its cache of training outputs, which
+            can be shared by the runs of a convergence study.
+            The default is None, which creates a new context.
 
         Returns
         -------
@@ -158,6 +256,7 @@ class SensitivityBenchmarkMetaAlgorithm:
             sample_size_test=sample_size_test,
             total_degree=total_degree,
             hyperbolic_quasinorm=hyperbolic_quasinorm,
+            context=context,
         )
         result = sparse_sa.run()
         return result.first_order_indices, result.total_order_indices
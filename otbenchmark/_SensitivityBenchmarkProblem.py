@@ -87,8 +87,43 @@ class SensitivityBenchmarkProblem:
 
         self.firstOrderIndices = firstOrderIndices
         self.totalOrderIndices = totalOrderIndices
+        self.expensive = False
         return None
 
+    def setExpensive(self, expensive):
+        """
+        Set the expensive flag of the problem.
+
+        The function of an expensive problem is evaluated by an
+        EvaluationScheduler in the meta-algorithms.
+
+        Parameters
+        ----------
+        expensive : bool
+            If True, the function is expensive.
+
+        Returns
+        -------
+        None.
+        """
+        self.expensive = expensive
+        return None
+
+    def isExpensive(self):
+        """
+        Return the expensive flag of the problem.
+
+        Parameters
+        ----------
+        None.
+
+        Returns
+        -------
+        expensive : bool
+            If True, the function is expensive.
+        """
+        return self.expensive
+
     def getInputDistribution(self):
         """
         Returns the input distribution.
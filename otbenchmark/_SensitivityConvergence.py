@@ -5,6 +5,7 @@ Perform a convergence study of a sensitivity analysis estimator.
 import openturns as ot
 import numpy as np
 import time
+import otbenchmark as otb
 
 
 class SensitivityConvergence:
@@ -47,7 +48,11 @@ class SensitivityConvergence:
             The initial sample size.
         estimator : str
             The estimator.
-            Must be "Saltelli", "Jansen", "Martinez", "MauntzKucherenko", "Janon".
+            Must be "Saltelli", "Jansen", "Martinez", "MauntzKucherenko", "Janon",
+            "ReplicatedLHS".
+            The "ReplicatedLHS" estimator only estimates first order indices:
+            the absolute errors of total order indices are set to NaN and
+            are not plotted.
         sampling_method : str
             The sampling method.
             Must be "MonteCarlo" or "LHS" or "QMC".
@@ -85,13 +90,21 @@ class SensitivityConvergence:
             and estimator != "Martinez"
             and estimator != "MauntzKucherenko"
             and estimator != "Janon"
+            and estimator != "ReplicatedLHS"
         ):
             raise ValueError("Unknown value of estimator %s" % (estimator))
         self.estimator = estimator
         self.use_sampling = use_sampling
+        self.has_total_order = not (use_sampling and estimator == "ReplicatedLHS")
         self.total_degree = total_degree
         self.hyperbolic_quasinorm = hyperbolic_quasinorm
         self.graphical_epsilon = graphical_epsilon
+        # The polynomial chaos basis and training outputs shared by the runs
+        self.chaos_context = None
+        if not use_sampling:
+            self.chaos_context = otb.SparsePolynomialChaosContext(
+                problem.getInputDistribution(), total_degree, hyperbolic_quasinorm
+            )
         return None
 
     def computeError(self, sample_size):
@@ -140,6 +153,7 @@ class SensitivityConvergence:
                 sample_size_test=2,  # Bare minimum
                 total_degree=self.total_degree,
                 hyperbolic_quasinorm=self.hyperbolic_quasinorm,
+                context=self.chaos_context,
             )
         exact_first_order = self.problem.getFirstOrderIndices()
         exact_total_order = self.problem.getTotalOrderIndices()
@@ -158,6 +172,7 @@ class SensitivityConvergence:
     def computeSobolSample(
         self,
         verbose=False,
+        table=None,
     ):
         """
         Repeat increasingly large Monte-Carlo Sobol' experiments.
@@ -174,6 +189,10 @@ class SensitivityConvergence:
         ----------
         verbose : bool
             Set to True to print intermediate messages.
+        table : ColumnarTable, optional
+            A table where the rows of each sample size are appended, in
+            the columns "sampleSize", "first" and "total".
+            The default is None, which does not store the rows.
 
         Returns
         -------
@@ -206,6 +225,14 @@ class SensitivityConvergence:
                 sample_size_data.append([sample_size])
                 first_order_data.append(first_order_AE)
                 total_order_data.append(total_order_AE)
+            if table is not None:
+                table.append(
+                    {
+                        "sampleSize": sample_size_data[-self.numberOfRepetitions :],
+                        "first": first_order_data[-self.numberOfRepetitions :],
+                        "total": total_order_data[-self.numberOfRepetitions :],
+                    }
+                )
 
         elapsedTime = time.time() - startTime
         if verbose:
@@ -261,9 +288,13 @@ class SensitivityConvergence:
         # Create plot
         distribution = self.problem.getInputDistribution()
         dimension = distribution.getDimension()
-        grid = ot.GridLayout(2, dimension)
+        if self.has_total_order:
+            orders = [True, False]
+        else:
+            orders = [True]
+        grid = ot.GridLayout(len(orders), dimension)
         for marginal_index in range(dimension):
-            for first_order_sobol_estimator in [True, False]:
+            for first_order_sobol_estimator in orders:
                 # If first_order_sobol_estimator, then plot asolute error of first order
                 # Sobol' index,
                 # otherwise, plot asolute error of total order Sobol' index.
@@ -362,9 +393,13 @@ class SensitivityConvergence:
         graph = ot.Graph(title, "Sample size", "Absolute error", True, "topright")
         distribution = self.problem.getInputDistribution()
         dimension = distribution.getDimension()
+        if self.has_total_order:
+            orders = [True, False]
+        else:
+            orders = [True]
         # Plot absolute error
         for marginal_index in range(dimension):
-            for first_order_sobol_estimator in [True, False]:
+            for first_order_sobol_estimator in orders:
                 # If first_order_sobol_estimator, then plot LRE of first order
                 # Sobol' index,
                 # otherwise, plot LRE of total order Sobol' index
@@ -398,5 +433,5 @@ class SensitivityConvergence:
             graph.add(curve)
         graph.setLogScale(ot.GraphImplementation.LOGXY)
         graph.setLegendPosition("topright")
-        graph.setColors(ot.Drawable.BuildDefaultPalette(2 + 2 * dimension))
+        graph.setColors(ot.Drawable.BuildDefaultPalette(2 + len(orders) * dimension))
         return graph
@@ -3,6 +3,7 @@ Analyses the distribution of Sobol' indices.
 """
 
 import openturns as ot
+import numpy as np
 
 
 class SensitivityDistribution:
@@ -26,6 +27,16 @@ class SensitivityDistribution:
     Then we compare the "Sample" distribution (from repetition) and the
     "Computed" distribution from the library.
     These two distributions should be close.
+
+    By default, each repetition evaluates the model on a new design.
+    For expensive models, the repetitions can instead be drawn by resampling
+    the outputs of one single design, which reduces the number of function
+    evaluations by a factor equal to the number of repetitions.
+    The "Bootstrap" method draws the indices of each repetition with
+    replacement in a design of size sampleSize.
+    The "Subsample" method draws the indices of each repetition without
+    replacement in a design of size subsample_factor * sampleSize: its
+    spread is rescaled to the spread of the estimator of size sampleSize.
     """
 
     def __init__(
@@ -36,6 +47,8 @@ class SensitivityDistribution:
         numberOfRepetitions=10,
         estimator="Saltelli",
         sampling_method="MonteCarlo",
+        resampling_method="Repeat",
+        subsample_factor=2,
     ):
         """
         Checks the distribution of the Sobol' estimator.
@@ -56,6 +69,14 @@ class SensitivityDistribution:
         sampling_method : str
             The sampling method.
             Must be "MonteCarlo" or "LHS" or "QMC".
+        resampling_method : str, optional
+            The method used to generate the repetitions.
+            Must be "Repeat", "Bootstrap" or "Subsample".
+            The default is "Repeat", which evaluates the model on a new design
+            at each repetition.
+        subsample_factor : int, optional
+            The ratio of the size of the design to the sample size,
+            used by the "Subsample" method. The default is 2.
 
         Returns
         -------
@@ -84,11 +105,54 @@ class SensitivityDistribution:
                 "Unknown value of sampling method : %s" % (sampling_method)
             )
         self.sampling_method = sampling_method
+        if (
+            resampling_method != "Repeat"
+            and resampling_method != "Bootstrap"
+            and resampling_method != "Subsample"
+        ):
+            raise ValueError(
+                "Unknown value of resampling method : %s" % (resampling_method)
+            )
+        self.resampling_method = resampling_method
+        if subsample_factor < 2:
+            raise ValueError(
+                "The subsample factor is %d but must be at least 2" % (subsample_factor)
+            )
+        self.subsample_factor = subsample_factor
+        self.maximumChunkElements = 2**24
+
+    def _createSobolAlgorithm(self):
+        """
+        Create the Sobol' indices estimator.
 
-    def compute_sample_indices(self):
+        Returns
+        -------
+        sobolAlgorithm : ot.SobolIndicesAlgorithm
+            The estimator.
+        """
+        if self.estimator == "Saltelli":
+            sobolAlgorithm = ot.SaltelliSensitivityAlgorithm()
+        elif self.estimator == "Jansen":
+            sobolAlgorithm = ot.JansenSensitivityAlgorithm()
+        elif self.estimator == "Martinez":
+            sobolAlgorithm = ot.MartinezSensitivityAlgorithm()
+        elif self.estimator == "MauntzKucherenko":
+            sobolAlgorithm = ot.MauntzKucherenkoSensitivityAlgorithm()
+        else:
+            raise ValueError("Unknown value of estimator %s" % (self.estimator))
+        return sobolAlgorithm
+
+    def compute_sample_indices(self, table=None):
         """
         Generate a sample of first order and total order Sobol' indices.
 
+        Parameters
+        ----------
+        table : ColumnarTable, optional
+            A table where the indices of the repetitions are appended, in
+            the columns "first" and "total".
+            The default is None, which does not store the indices.
+
         Returns
         -------
         sampleFirst : ot.Sample(numberOfRepetitions, dimension)
@@ -100,6 +164,11 @@ class SensitivityDistribution:
         distributionTotal : TYPE
             The distribution of the total order Sobol' indices..
         """
+        if self.resampling_method != "Repeat":
+            result = self._compute_resampled_sample_indices()
+            if table is not None:
+                table.append({"first": result[0], "total": result[1]})
+            return result
 
         distribution = self.problem.getInputDistribution()
         dimension = distribution.getDimension()
@@ -127,16 +196,7 @@ class SensitivityDistribution:
                 )
             inputDesign = experiment.generate()
             outputDesign = model(inputDesign)
-            if self.estimator == "Saltelli":
-                sobolAlgorithm = ot.SaltelliSensitivityAlgorithm()
-            elif self.estimator == "Jansen":
-                sobolAlgorithm = ot.JansenSensitivityAlgorithm()
-            elif self.estimator == "Martinez":
-                sobolAlgorithm = ot.MartinezSensitivityAlgorithm()
-            elif self.estimator == "MauntzKucherenko":
-                sobolAlgorithm = ot.MauntzKucherenkoSensitivityAlgorithm()
-            else:
-                raise ValueError("Unknown value of estimator %s" % (self.estimator))
+            sobolAlgorithm = self._createSobolAlgorithm()
             sobolAlgorithm.setDesign(inputDesign, outputDesign, self.sampleSize)
             first_order = sobolAlgorithm.getFirstOrderIndices()
             total_order = sobolAlgorithm.getTotalOrderIndices()
@@ -149,6 +209,8 @@ class SensitivityDistribution:
                 distributionTotal = sobolAlgorithm.getTotalOrderIndicesDistribution()
                 is_first_simulation = False
 
+        if table is not None:
+            table.append({"first": sampleFirst, "total": sampleTotal})
         return (
             sampleFirst,
             sampleTotal,
@@ -156,6 +218,123 @@ class SensitivityDistribution:
             distributionTotal,
         )
 
+    def _compute_resampled_sample_indices(self):
+        """
+        Generate a sample of Sobol' indices by resampling one single design.
+
+        The model is evaluated once on a pick-freeze design.
+        The design is viewed as (dimension + 2) blocks and the index sets of
+        all the repetitions are drawn at once.
+        Each repetition applies its index set to all the blocks, so that the
+        pick-freeze structure of the design is preserved.
+        The blocks of the repetitions are resampled by chunks, so that the
+        resampled blocks use at most maximumChunkElements floats.
+
+        The "Subsample" method draws m = sampleSize indices without
+        replacement among N = subsample_factor * sampleSize.
+        The subsamples overlap, so that the spread of their estimates is
+        lower than the spread of independent estimates of size m, by the
+        finite population factor sqrt(1 - m / N).
+        Hence the deviation of each estimate from the estimate on the full
+        design is divided by this factor: the sample has the distribution
+        of the estimator of size m, as with the "Bootstrap" and "Repeat"
+        methods.
+
+        The distribution computed by the library is not computed on a
+        resampled design, which contains duplicate points, but on the first
+        m points of each block of the design, which are not resampled.
+
+        Returns
+        -------
+        sampleFirst : ot.Sample(numberOfRepetitions, dimension)
+            A sample of first order Sobol' indices.
+        sampleTotal : ot.Sample(numberOfRepetitions, dimension)
+            A sample of total order Sobol' indices.
+        distributionFirst : ot.Distribution
+            The distribution of the first order Sobol' indices.
+        distributionTotal : ot.Distribution
+            The distribution of the total order Sobol' indices.
+        """
+        distribution = self.problem.getInputDistribution()
+        dimension = distribution.getDimension()
+        model = self.problem.getFunction()
+        if self.resampling_method == "Bootstrap":
+            design_size = self.sampleSize
+        else:
+            design_size = self.subsample_factor * self.sampleSize
+        ot.ResourceMap.SetAsString(
+            "SobolIndicesExperiment-SamplingMethod", self.sampling_method
+        )
+        experiment = ot.SobolIndicesExperiment(distribution, design_size)
+        inputDesign = experiment.generate()
+        outputDesign = model(inputDesign)
+        outputDimension = outputDesign.getDimension()
+        inputBlocks = np.asarray(inputDesign).reshape(
+            dimension + 2, design_size, dimension
+        )
+        outputBlocks = np.asarray(outputDesign).reshape(
+            dimension + 2, design_size, outputDimension
+        )
+        # The distribution computed by the library is computed once, before
+        # the resampling, on the first sampleSize points of each block of
+        # the design: this is the whole design of the "Bootstrap" method
+        sobolAlgorithm = self._createSobolAlgorithm()
+        sobolAlgorithm.setDesign(
+            ot.Sample(inputBlocks[:, : self.sampleSize].reshape(-1, dimension)),
+            ot.Sample(outputBlocks[:, : self.sampleSize].reshape(-1, outputDimension)),
+            self.sampleSize,
+        )
+        distributionFirst = sobolAlgorithm.getFirstOrderIndicesDistribution()
+        distributionTotal = sobolAlgorithm.getTotalOrderIndicesDistribution()
+        # Draw the index sets of all the repetitions
+        if self.resampling_method == "Bootstrap":
+            indices = np.array(
+                ot.RandomGenerator.IntegerGenerate(
+                    self.numberOfRepetitions * self.sampleSize, design_size
+                )
+            ).reshape(self.numberOfRepetitions, self.sampleSize)
+        else:
+            uniform = np.array(
+                ot.RandomGenerator.Generate(self.numberOfRepetitions * design_size)
+            ).reshape(self.numberOfRepetitions, design_size)
+            indices = np.argsort(uniform, axis=1)[:, : self.sampleSize]
+        sampleFirst = np.empty((self.numberOfRepetitions, dimension))
+        sampleTotal = np.empty((self.numberOfRepetitions, dimension))
+        repetition_elements = (
+            (dimension + 2) * self.sampleSize * (dimension + outputDimension)
+        )
+        chunk_size = max(1, self.maximumChunkElements // repetition_elements)
+        for start in range(0, self.numberOfRepetitions, chunk_size):
+            stop = min(start + chunk_size, self.numberOfRepetitions)
+            inputResampled = inputBlocks[:, indices[start:stop], :]
+            outputResampled = outputBlocks[:, indices[start:stop], :]
+            for i in range(start, stop):
+                sobolAlgorithm = self._createSobolAlgorithm()
+                sobolAlgorithm.setDesign(
+                    ot.Sample(inputResampled[:, i - start].reshape(-1, dimension)),
+                    ot.Sample(
+                        outputResampled[:, i - start].reshape(-1, outputDimension)
+                    ),
+                    self.sampleSize,
+                )
+                sampleFirst[i] = sobolAlgorithm.getFirstOrderIndices()
+                sampleTotal[i] = sobolAlgorithm.getTotalOrderIndices()
+        if self.resampling_method == "Subsample":
+            sobolAlgorithm = self._createSobolAlgorithm()
+            sobolAlgorithm.setDesign(inputDesign, outputDesign, design_size)
+            fullFirst = np.array(sobolAlgorithm.getFirstOrderIndices())
+            fullTotal = np.array(sobolAlgorithm.getTotalOrderIndices())
+            factor = np.sqrt(1.0 - self.sampleSize / design_size)
+            sampleFirst = fullFirst + (sampleFirst - fullFirst) / factor
+            sampleTotal = fullTotal + (sampleTotal - fullTotal) / factor
+
+        return (
+            ot.Sample(sampleFirst),
+            ot.Sample(sampleTotal),
+            distributionFirst,
+            distributionTotal,
+        )
+
     def draw(
         self,
         mean_distribution=False,
@@ -0,0 +1,439 @@
+"""
+Repeat benchmark runs until the mean metric is accurate enough.
+"""
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import openturns as ot
+import otbenchmark as otb
+
+# The runs of a worker process
+_workerRunRepetitions = None
+
+
+def _initializeWorker(runRepetitions):
+    """
+    Set the runs of a worker process.
+
+    Parameters
+    ----------
+    runRepetitions : dict
+        For each method name, the function which takes a seed and returns
+        the metric of one run.
+
+    Returns
+    -------
+    None.
+    """
+    global _workerRunRepetitions
+    _workerRunRepetitions = runRepetitions
+    return None
+
+
+def _runWorkerRepetition(name, seed):
+    """
+    Run one repetition of a method in a worker process.
+
+    Parameters
+    ----------
+    name : str
+        The method name.
+    seed : int
+        The seed.
+
+    Returns
+    -------
+    value : float
+        The metric of the repetition.
+    """
+    value = _workerRunRepetitions[name](seed)
+    return value
+
+
+class _ReliabilityRepetition:
+    """A run of a reliability method, which returns one metric."""
+
+    def __init__(self, problem, method, metric, parameters):
+        self.problem = problem
+        self.method = method
+        self.metric = metric
+        self.parameters = parameters
+
+    def __call__(self, seed):
+        benchmark = otb.ReliabilityMethodBenchmark(
+            [self.problem],
+            [self.method],
+            seed=seed,
+            measureMemory=False,
+            **self.parameters,
+        )
+        record = benchmark.runProblem(self.problem, self.method)
+        return record[self.metric]
+
+
+class _SensitivityRepetition:
+    """A run of a sensitivity estimator, which returns one metric."""
+
+    def __init__(self, problem, sampleSize, estimator, samplingMethod, metric):
+        self.problem = problem
+        self.sampleSize = sampleSize
+        self.estimator = estimator
+        self.samplingMethod = samplingMethod
+        self.metric = metric
+
+    def __call__(self, seed):
+        ot.RandomGenerator.SetSeed(seed)
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(self.problem)
+        convergence = otb.SensitivityConvergence(
+            self.problem,
+            metaSAAlgorithm,
+            estimator=self.estimator,
+            sampling_method=self.samplingMethod,
+        )
+        first_order_AE, total_order_AE = convergence.computeError(self.sampleSize)
+        errors = np.array(first_order_AE)
+        if convergence.has_total_order:
+            errors = np.concatenate([errors, np.array(total_order_AE)])
+        absoluteError = np.mean(errors)
+        if self.metric == "absoluteError":
+            return absoluteError
+        return -math.log10(absoluteError)
+
+
+class SequentialRepetition:
+    def __init__(
+        self,
+        runRepetitions,
+        targetHalfWidth=0.1,
+        confidenceLevel=0.95,
+        batchSize=4,
+        maximumNumberOfRepetitions=100,
+        numberOfWorkers=1,
+        initialSeed=0,
+    ):
+        """
+        Repeat benchmark runs until the mean metric is accurate enough.
+
+        Each method is run by batches of repetitions.
+        After each batch, the confidence interval of the mean metric of
+        each method is computed with the Student distribution.
+        The repetitions of a method stop when:
+
+        * the half-width of its confidence interval is lower than
+          targetHalfWidth,
+        * or, if several methods are compared, its confidence interval is
+          disjoint from the confidence intervals of all other methods,
+          i.e. its rank is known,
+        * or the number of repetitions reaches maximumNumberOfRepetitions.
+
+        Hence, easy problems need few repetitions, and the repetitions
+        are spent where the ranking of the methods is uncertain.
+
+        The k-th repetition of every method uses the seed initialSeed + k,
+        so that the methods are compared with common random numbers.
+        The repetitions of a batch can be run in parallel processes.
+        The processes are forked, if the platform allows it, so that the
+        runs need not be picklable: only the method name and the seed of
+        each repetition are sent to the processes.
+
+        Parameters
+        ----------
+        runRepetitions : dict
+            For each method name, a function which takes a seed and returns
+            the metric of one run, e.g. the number of correct digits.
+            See ReliabilityRepetition() and SensitivityRepetition().
+        targetHalfWidth : float, optional
+            The target half-width of the confidence interval of the mean.
+            The default is 0.1.
+        confidenceLevel : float, optional
+            The confidence level.
+            The default is 0.95.
+        batchSize : int, optional
+            The number of repetitions of each batch, at least 2.
+            The default is 4.
+        maximumNumberOfRepetitions : int, optional
+            The maximum number of repetitions of each method.
+            The default is 100.
+        numberOfWorkers : int, optional
+            The number of processes.
+            The default is 1, which runs the repetitions in the current
+            process.
+        initialSeed : int, optional
+            The seed of the first repetition.
+            The default is 0.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> problem = otb.ReliabilityProblem8()
+        >>> runRepetitions = {
+        ...     method: otb.SequentialRepetition.ReliabilityRepetition(
+        ...         problem, method, maximumOuterSampling=100, blockSize=100
+        ...     )
+        ...     for method in ["MonteCarlo", "LHS", "SubsetSampling"]
+        ... }
+        >>> driver = otb.SequentialRepetition(runRepetitions, targetHalfWidth=0.05)
+        >>> results = driver.run()
+        """
+        if batchSize < 2:
+            raise ValueError(
+                "The batch size is %d but must be at least 2" % (batchSize)
+            )
+        if maximumNumberOfRepetitions < batchSize:
+            raise ValueError(
+                "The maximum number of repetitions is %d but must be at least %d"
+                % (maximumNumberOfRepetitions, batchSize)
+            )
+        self.runRepetitions = runRepetitions
+        self.targetHalfWidth = targetHalfWidth
+        self.confidenceLevel = confidenceLevel
+        self.batchSize = batchSize
+        self.maximumNumberOfRepetitions = maximumNumberOfRepetitions
+        self.numberOfWorkers = numberOfWorkers
+        self.initialSeed = initialSeed
+
+    @staticmethod
+    def ReliabilityRepetition(
+        problem, method, metric="numberOfCorrectDigits", **parameters
+    ):
+        """
+        Create the run of a reliability method.
+
+        Parameters
+        ----------
+        problem : ReliabilityBenchmarkProblem
+            The problem.
+        method : str
+            The method, see ReliabilityMethodBenchmark.GetMethods().
+        metric : str, optional
+            The key of the metric in the record of ReliabilityMethodBenchmark,
+            e.g. "numberOfCorrectDigits" or "absoluteError".
+            The default is "numberOfCorrectDigits".
+        parameters : dict
+            The budget of the method, given to ReliabilityMethodBenchmark,
+            e.g. maximumOuterSampling or blockSize.
+
+        Returns
+        -------
+        runRepetition : callable
+            The function which takes a seed and returns the metric.
+        """
+        runRepetition = _ReliabilityRepetition(problem, method, metric, parameters)
+        return runRepetition
+
+    @staticmethod
+    def SensitivityRepetition(
+        problem,
+        sampleSize,
+        estimator="Saltelli",
+        samplingMethod="MonteCarlo",
+        metric="absoluteError",
+    ):
+        """
+        Create the run of a sensitivity estimator.
+
+        The absolute error is the mean of the absolute errors of the first
+        and total order Sobol' indices.
+        The number of correct digits is minus the base 10 logarithm of the
+        absolute error.
+
+        Parameters
+        ----------
+        problem : SensitivityBenchmarkProblem
+            The problem.
+        sampleSize : int
+            The sample size.
+        estimator : str, optional
+            The estimator, see SensitivityConvergence.
+            The default is "Saltelli".
+        samplingMethod : str, optional
+            The sampling method, "MonteCarlo", "LHS" or "QMC".
+            The default is "MonteCarlo".
+        metric : str, optional
+            The metric, "absoluteError" or "numberOfCorrectDigits".
+            The default is "absoluteError".
+
+        Returns
+        -------
+        runRepetition : callable
+            The function which takes a seed and returns the metric.
+        """
+        if metric not in ["absoluteError", "numberOfCorrectDigits"]:
+            raise ValueError("Unknown value of metric %s" % (metric))
+        runRepetition = _SensitivityRepetition(
+            problem, sampleSize, estimator, samplingMethod, metric
+        )
+        return runRepetition
+
+    def computeConfidenceInterval(self, values):
+        """
+        Compute the confidence interval of the mean of values.
+
+        Parameters
+        ----------
+        values : sequence of float
+            The values, at least 2.
+
+        Returns
+        -------
+        mean : float
+            The mean.
+        halfWidth : float
+            The half-width of the confidence interval.
+        """
+        values = np.asarray(values, dtype=float)
+        size = values.size
+        mean = np.mean(values)
+        alpha = 1.0 - self.confidenceLevel
+        quantile = ot.Student(size - 1.0).computeQuantile(1.0 - alpha / 2.0)[0]
+        halfWidth = quantile * np.std(values, ddof=1) / math.sqrt(size)
+        return mean, halfWidth
+
+    def _runBatch(self, tasks, executor=None):
+        """
+        Run a batch of repetitions.
+
+        Parameters
+        ----------
+        tasks : list of (str, int)
+            The method name and the seed of each repetition.
+        executor : ProcessPoolExecutor, optional
+            The pool of the worker processes.
+            The default is None, which runs the repetitions in the current
+            process.
+
+        Returns
+        -------
+        values : list of float
+            The metric of each repetition.
+        """
+        if executor is None:
+            values = [self.runRepetitions[name](seed) for name, seed in tasks]
+            return values
+        futures = [
+            executor.submit(_runWorkerRepetition, name, seed) for name, seed in tasks
+        ]
+        values = [future.result() for future in futures]
+        return values
+
+    def run(self):
+        """
+        Run the repetitions.
+
+        Returns
+        -------
+        results : dict
+            For each method name, a dict with the keys:
+
+            * "mean": the mean metric,
+            * "halfWidth": the half-width of its confidence interval,
+            * "numberOfRepetitions": the number of repetitions,
+            * "values": the metric of each repetition,
+            * "stoppingReason": "HalfWidth", "Ranking" or
+              "MaximumNumberOfRepetitions".
+        """
+        results = {
+            name: {"values": [], "stoppingReason": None} for name in self.runRepetitions
+        }
+        # The pool is created once, and the workers get the runs at startup
+        executor = None
+        if self.numberOfWorkers > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+            else:
+                context = None
+            executor = ProcessPoolExecutor(
+                max_workers=self.numberOfWorkers,
+                mp_context=context,
+                initializer=_initializeWorker,
+                initargs=(self.runRepetitions,),
+            )
+        try:
+            self._runRepetitions(results, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return results
+
+    def _runRepetitions(self, results, executor):
+        """
+        Run the batches of repetitions until all the methods stop.
+
+        Parameters
+        ----------
+        results : dict
+            The results, updated after each batch.
+        executor : ProcessPoolExecutor
+            The pool of the worker processes, or None.
+
+        Returns
+        -------
+        None.
+        """
+        activeNames = list(self.runRepetitions)
+        while len(activeNames) > 0:
+            tasks = []
+            for name in activeNames:
+                numberOfRepetitions = len(results[name]["values"])
+                for k in range(self.batchSize):
+                    tasks.append((name, self.initialSeed + numberOfRepetitions + k))
+            values = self._runBatch(tasks, executor)
+            for (name, seed), value in zip(tasks, values):
+                results[name]["values"].append(value)
+            for name in results:
+                mean, halfWidth = self.computeConfidenceInterval(
+                    results[name]["values"]
+                )
+                results[name]["mean"] = mean
+                results[name]["halfWidth"] = halfWidth
+                results[name]["numberOfRepetitions"] = len(results[name]["values"])
+            for name in list(activeNames):
+                if results[name]["halfWidth"] <= self.targetHalfWidth:
+                    stoppingReason = "HalfWidth"
+                elif len(results) > 1 and self._isRanked(name, results):
+                    stoppingReason = "Ranking"
+                elif (
+                    results[name]["numberOfRepetitions"]
+                    >= self.maximumNumberOfRepetitions
+                ):
+                    stoppingReason = "MaximumNumberOfRepetitions"
+                else:
+                    continue
+                results[name]["stoppingReason"] = stoppingReason
+                activeNames.remove(name)
+        return None
+
+    @staticmethod
+    def _isRanked(name, results):
+        """
+        Check if the confidence interval of a method is disjoint from the
+        confidence intervals of all other methods.
+
+        Parameters
+        ----------
+        name : str
+            The name of the method.
+        results : dict
+            The current results.
+
+        Returns
+        -------
+        isRanked : bool
+            True if the rank of the method is known.
+        """
+        lower = results[name]["mean"] - results[name]["halfWidth"]
+        upper = results[name]["mean"] + results[name]["halfWidth"]
+        for otherName in results:
+            if otherName == name:
+                continue
+            otherLower = results[otherName]["mean"] - results[otherName]["halfWidth"]
+            otherUpper = results[otherName]["mean"] + results[otherName]["halfWidth"]
+            if lower <= otherUpper and otherLower <= upper:
+                return False
+        return True
@@ -4,6 +4,7 @@ with hyperbolic enumerate function and regression.
 """
 
 import openturns as ot
+import numpy as np
 
 
 class SparsePolynomialChaosSensitivityResult:
@@ -35,6 +36,131 @@ class SparsePolynomialChaosSensitivityResult:
         self.total_order_indices = total_order_indices
 
 
+class SparsePolynomialChaosContext:
+    def __init__(self, distribution, total_degree=2, hyperbolic_quasinorm=0.5):
+        """
+        A reusable polynomial chaos basis with a cache of the training outputs.
+
+        The context is defined by the input distribution, the total degree and
+        the quasi-norm of the hyperbolic enumerate function.
+        It stores the marginal polynomial factories, the enumerate function
+        and the multivariate basis, so that they are created only once in a
+        convergence study.
+        It also stores the outputs of the model on the training sample.
+        When the training sample grows while keeping its first points, which
+        is the case of Sobol' low discrepancy sequences, only the new points
+        are evaluated by the model.
+        The chaos is fitted again on the whole training sample at each run:
+        the context does not store the design matrix.
+
+        The polynomial chaos is fitted by ot.FunctionalChaosAlgorithm.
+
+        Parameters
+        ----------
+        distribution : ot.Distribution
+            The input distribution.
+        total_degree : int, optional
+            The total polynomial degree. The default is 2.
+        hyperbolic_quasinorm : float, optional
+            The hyperbolic quasi-norm. The default is 0.5.
+
+        Returns
+        -------
+        None.
+        """
+        self.distribution = distribution
+        self.total_degree = total_degree
+        self.hyperbolic_quasinorm = hyperbolic_quasinorm
+        dimension = distribution.getDimension()
+        self.dimension = dimension
+        self.polyColl = [
+            ot.StandardDistributionPolynomialFactory(distribution.getMarginal(i))
+            for i in range(dimension)
+        ]
+        self.enumerateFunction = ot.HyperbolicAnisotropicEnumerateFunction(
+            dimension, hyperbolic_quasinorm
+        )
+        self.multivariateBasis = ot.OrthogonalProductPolynomialFactory(
+            self.polyColl, self.enumerateFunction
+        )
+        self.basisSize = self.enumerateFunction.getStrataCumulatedCardinal(total_degree)
+        self.model = None
+        self.inputCache = np.zeros((0, dimension))
+        self.outputCache = None
+
+    def evaluate(self, model, inputSample):
+        """
+        Evaluate the model on the training sample, reusing the cached rows.
+
+        If the cached inputs are the first points of the sample, then only the
+        remaining points are evaluated and appended to the cache.
+        Otherwise, or if the model is not the model of the cache, the cache
+        is replaced.
+
+        Parameters
+        ----------
+        model : ot.Function
+            The model.
+        inputSample : ot.Sample(size, dimension)
+            The input sample.
+
+        Returns
+        -------
+        outputSample : ot.Sample(size, outputDimension)
+            The output sample.
+        """
+        x = np.array(inputSample)
+        size = x.shape[0]
+        cached_size = self.inputCache.shape[0]
+        if model is not self.model or not np.array_equal(
+            x[:cached_size], self.inputCache[:size]
+        ):
+            self.model = model
+            self.inputCache = x
+            self.outputCache = np.array(model(inputSample))
+            return ot.Sample(self.outputCache)
+        if size > cached_size:
+            newOutput = np.array(model(ot.Sample(x[cached_size:])))
+            self.outputCache = np.vstack((self.outputCache, newOutput))
+            self.inputCache = x
+        return ot.Sample(self.outputCache[:size])
+
+    def fit(self, inputSample, outputSample):
+        """
+        Fit the sparse polynomial chaos.
+
+        The coefficients are computed by least squares and the model is
+        selected by LARS with the corrected leave-one-out error.
+
+        Parameters
+        ----------
+        inputSample : ot.Sample(size, dimension)
+            The training input sample.
+        outputSample : ot.Sample(size, outputDimension)
+            The training output sample.
+
+        Returns
+        -------
+        chaosResult : ot.FunctionalChaosResult
+            The polynomial chaos.
+        """
+        approximationAlgorithm = ot.LeastSquaresMetaModelSelectionFactory()
+        projectionStrategy = ot.LeastSquaresStrategy(
+            inputSample, outputSample, approximationAlgorithm
+        )
+        adaptiveStrategy = ot.FixedStrategy(self.multivariateBasis, self.basisSize)
+        chaosalgo = ot.FunctionalChaosAlgorithm(
+            inputSample,
+            outputSample,
+            self.distribution,
+            adaptiveStrategy,
+            projectionStrategy,
+        )
+        chaosalgo.run()
+        chaosResult = chaosalgo.getResult()
+        return chaosResult
+
+
 class SparsePolynomialChaosSensitivityAnalysis:
     def __init__(
         self,
@@ -43,6 +169,7 @@ class SparsePolynomialChaosSensitivityAnalysis:
         sample_size_test=100,
         total_degree=2,
         hyperbolic_quasinorm=0.5,
+        context=None,
     ):
         """
         Estimate Sobol' sensitivity indices from sparse polynomial chaos.
@@ -50,6 +177,8 @@ class SparsePolynomialChaosSensitivityAnalysis:
         Uses regression to estimate the coefficients.
         Uses LARS to select the model.
         Uses hyperbolic enumerate rule.
+        Uses a SparsePolynomialChaosContext to reuse the basis and the
+        training outputs of the previous runs.
         Uses Sobol' low discrepancy sequence to train the polynomial.
         Uses Monte-Carlo sample to test the polynomial.
 
@@ -65,17 +194,40 @@ class SparsePolynomialChaosSensitivityAnalysis:
             The total polynomial degree. The default is 2.
         hyperbolic_quasinorm : float, optional
             The hyperbolic quasi-norm. The default is 0.5.
+        context : SparsePolynomialChaosContext, optional
+            The polynomial chaos basis and its cache of training outputs.
+            Its distribution, total degree and hyperbolic quasi-norm must be
+            the ones of the analysis.
+            The default is None, which creates a new context.
 
         Returns
         -------
         None.
 
         """
+        if context is not None:
+            distribution = sensitivityBenchmarkProblem.getInputDistribution()
+            if context.distribution != distribution:
+                raise ValueError(
+                    "The distribution of the context is not the input "
+                    "distribution of the problem"
+                )
+            if context.total_degree != total_degree:
+                raise ValueError(
+                    "The total degree of the context is %d but the total "
+                    "degree is %d" % (context.total_degree, total_degree)
+                )
+            if context.hyperbolic_quasinorm != hyperbolic_quasinorm:
+                raise ValueError(
+                    "The quasi-norm of the context is %s but the quasi-norm "
+                    "is %s" % (context.hyperbolic_quasinorm, hyperbolic_quasinorm)
+                )
         self.problem = sensitivityBenchmarkProblem
         self.sample_size_train = sample_size_train
         self.sample_size_test = sample_size_test
         self.total_degree = total_degree
         self.hyperbolic_quasinorm = hyperbolic_quasinorm
+        self.context = context
 
     def run(self, verbose=False):
         """
@@ -102,39 +254,19 @@ class SparsePolynomialChaosSensitivityAnalysis:
             sequence, distribution, self.sample_size_train
         )
         inputTrain = experiment.generate()
-        outputTrain = model(inputTrain)
 
-        # Create sparse chaos
+        # Get the sparse chaos basis
         if verbose:
-            print("Create sparse chaos")
-        distributionList = [distribution.getMarginal(i) for i in range(dimension)]
-        multivariateBasis = ot.OrthogonalProductPolynomialFactory(distributionList)
-        approximationAlgorithm = ot.LeastSquaresMetaModelSelectionFactory()
-        projectionStrategy = ot.LeastSquaresStrategy(
-            inputTrain, outputTrain, approximationAlgorithm
-        )
-
-        polyColl = [
-            ot.StandardDistributionPolynomialFactory(distributionList[i])
-            for i in range(dimension)
-        ]
-        enumerateFunction = ot.HyperbolicAnisotropicEnumerateFunction(
-            dimension, self.hyperbolic_quasinorm
-        )
-        multivariateBasis = ot.OrthogonalProductPolynomialFactory(
-            polyColl, enumerateFunction
-        )
-
-        enumfunc = multivariateBasis.getEnumerateFunction()
-        P = enumfunc.getStrataCumulatedCardinal(self.total_degree)
-        adaptiveStrategy = ot.FixedStrategy(multivariateBasis, P)
-        chaosalgo = ot.FunctionalChaosAlgorithm(
-            inputTrain, outputTrain, distribution, adaptiveStrategy, projectionStrategy
-        )
+            print("Get sparse chaos basis")
+        context = self.context
+        if context is None:
+            context = SparsePolynomialChaosContext(
+                distribution, self.total_degree, self.hyperbolic_quasinorm
+            )
+        outputTrain = context.evaluate(model, inputTrain)
         if verbose:
             print("Fit")
-        chaosalgo.run()
-        chaosResult = chaosalgo.getResult()
+        chaosResult = context.fit(inputTrain, outputTrain)
 
         # Validation
         if verbose:
@@ -147,7 +279,7 @@ class SparsePolynomialChaosSensitivityAnalysis:
         val = ot.MetaModelValidation(outputTest, predictions)
         predictivity_coefficient = val.computeR2Score()[0]
         if verbose:
-            print("Q2=%.2f%%" % (100 * predictivity_coefficient))
+            print("Q2 = ", predictivity_coefficient)
 
         # S.A.
         if verbose:
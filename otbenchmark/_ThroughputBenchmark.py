@@ -0,0 +1,300 @@
+"""
+Measure the throughput of the functions of the benchmark problems.
+"""
+
+import json
+import time
+import tracemalloc
+import otbenchmark as otb
+
+
+class ThroughputBenchmark:
+    def __init__(
+        self,
+        problems=None,
+        batchSizes=[1, 10, 100, 1000, 10000, 100000, 1000000],
+        minimumTime=0.1,
+        maximumTime=1.0,
+    ):
+        """
+        Measure the throughput of the functions of the benchmark problems.
+
+        For each problem, the benchmark measures:
+
+        * the time to create the problem and the peak of the Python heap
+          during the creation,
+        * the number of evaluations per second of the function, when it is
+          evaluated point by point ("Point" path) or on a sample ("Sample"
+          path), for each batch size.
+
+        Each measure is repeated until its total time exceeds minimumTime,
+        with at least one repetition.
+        A batch size is skipped, as well as the larger ones, when the time
+        of one call predicted from the previous batch size is larger than
+        maximumTime, so that slow functions, such as pointwise
+        ot.PythonFunction, do not stall the benchmark.
+
+        The Python heap is the peak of the Python and NumPy allocations
+        measured by tracemalloc.
+        It does not contain the C++ objects allocated by OpenTURNS, which
+        are most of the memory of a problem: this is why it is stored as
+        "pythonMemory", and not as the memory of the problem.
+
+        Parameters
+        ----------
+        problems : list, optional
+            The reliability or sensitivity problems.
+            Each problem must be created by its class with default arguments.
+            The default is None, which uses the problems of
+            ReliabilityBenchmarkProblemList() and
+            SensitivityBenchmarkProblemList().
+        batchSizes : list of int, optional
+            The batch sizes.
+            The default is [1, 10, ..., 10^6].
+        minimumTime : float, optional
+            The minimum total time of each measure, in seconds.
+            The default is 0.1.
+        maximumTime : float, optional
+            The maximum predicted time of one call, in seconds.
+            The default is 1.
+
+        Returns
+        -------
+        None.
+
+        Examples
+        --------
+        >>> import otbenchmark as otb
+        >>> benchmark = otb.ThroughputBenchmark(batchSizes=[1, 100])
+        >>> records = benchmark.run()
+        >>> benchmark.save("throughput.json")
+        """
+        if problems is None:
+            problems = (
+                otb.ReliabilityBenchmarkProblemList()
+                + otb.SensitivityBenchmarkProblemList()
+            )
+        self.problems = problems
+        self.batchSizes = batchSizes
+        self.minimumTime = minimumTime
+        self.maximumTime = maximumTime
+        self.records = []
+
+    def _getFunctionAndDistribution(self, problem):
+        """
+        Returns the function and the input distribution of a problem.
+
+        Parameters
+        ----------
+        problem : ReliabilityBenchmarkProblem or SensitivityBenchmarkProblem
+            The problem.
+
+        Returns
+        -------
+        function : ot.Function
+            The limit state function or the model.
+        distribution : ot.Distribution
+            The input distribution.
+        """
+        if isinstance(problem, otb.ReliabilityBenchmarkProblem):
+            event = problem.getEvent()
+            function = event.getFunction()
+            distribution = event.getAntecedent().getDistribution()
+        else:
+            function = problem.getFunction()
+            distribution = problem.getInputDistribution()
+        return function, distribution
+
+    def _measureConstruction(self, problem):
+        """
+        Measure the time and the peak of the Python heap to create a problem.
+
+        Parameters
+        ----------
+        problem : ReliabilityBenchmarkProblem or SensitivityBenchmarkProblem
+            The problem.
+
+        Returns
+        -------
+        record : dict
+            The measure.
+        """
+        problemClass = type(problem)
+        tracemalloc.start()
+        startTime = time.perf_counter()
+        _ = problemClass()
+        elapsedTime = time.perf_counter() - startTime
+        _, peakMemory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        record = {
+            "problem": problem.getName(),
+            "path": "Construction",
+            "batchSize": 0,
+            "time": elapsedTime,
+            "pythonMemory": peakMemory,
+        }
+        return record
+
+    def _measureThroughput(self, function, inputSample, path):
+        """
+        Measure the number of evaluations per second.
+
+        Parameters
+        ----------
+        function : ot.Function
+            The function.
+        inputSample : ot.Sample
+            The input sample of one batch.
+        path : str
+            "Point" to evaluate the points one by one, "Sample" to evaluate
+            the sample.
+
+        Returns
+        -------
+        numberOfCalls : int
+            The number of evaluations of the batch.
+        elapsedTime : float
+            The total time, in seconds.
+        """
+        numberOfCalls = 0
+        elapsedTime = 0.0
+        size = inputSample.getSize()
+        # The batch is evaluated at least once
+        while True:
+            startTime = time.perf_counter()
+            if path == "Point":
+                for i in range(size):
+                    _ = function(inputSample[i])
+            else:
+                _ = function(inputSample)
+            duration = time.perf_counter() - startTime
+            elapsedTime += duration
+            numberOfCalls += 1
+            if elapsedTime >= self.minimumTime or duration > self.maximumTime:
+                break
+        return numberOfCalls, elapsedTime
+
+    def run(self):
+        """
+        Run the benchmark.
+
+        Returns
+        -------
+        records : list of dict
+            The measures.
+            Each measure has the keys "problem", "path", "batchSize",
+            "time" and, for the "Point" and "Sample" paths,
+            "evaluationsPerSecond", or, for the "Construction" path,
+            "pythonMemory", in bytes.
+        """
+        self.records = []
+        for problem in self.problems:
+            self.records.append(self._measureConstruction(problem))
+            function, distribution = self._getFunctionAndDistribution(problem)
+            for path in ["Point", "Sample"]:
+                timePerEvaluation = 0.0
+                for batchSize in self.batchSizes:
+                    if batchSize * timePerEvaluation > self.maximumTime:
+                        break
+                    inputSample = distribution.getSample(batchSize)
+                    numberOfCalls, elapsedTime = self._measureThroughput(
+                        function, inputSample, path
+                    )
+                    record = {
+                        "problem": problem.getName(),
+                        "path": path,
+                        "batchSize": batchSize,
+                        "time": elapsedTime / numberOfCalls,
+                        "evaluationsPerSecond": numberOfCalls * batchSize / elapsedTime,
+                    }
+                    self.records.append(record)
+                    timePerEvaluation = 1.0 / record["evaluationsPerSecond"]
+        return self.records
+
+    def save(self, filename):
+        """
+        Save the measures into a JSON file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        None.
+        """
+        with open(filename, "w") as file:
+            json.dump(self.records, file, indent=1)
+        return None
+
+    @staticmethod
+    def Load(filename):
+        """
+        Load the measures from a JSON file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        records : list of dict
+            The measures.
+        """
+        with open(filename, "r") as file:
+            records = json.load(file)
+        return records
+
+    @staticmethod
+    def Compare(records, baselineRecords, threshold=0.5):
+        """
+        Compare measures to a baseline.
+
+        A measure is a regression if its throughput is lower than
+        (1 - threshold) times the baseline throughput or, for the
+        "Construction" path, if its time is larger than (1 + threshold)
+        times the baseline time.
+        The measures which are not in the baseline are ignored.
+
+        Parameters
+        ----------
+        records : list of dict
+            The measures.
+        baselineRecords : list of dict
+            The baseline measures.
+        threshold : float, optional
+            The relative threshold.
+            The default is 0.5.
+
+        Returns
+        -------
+        regressions : list of dict
+            The regressions.
+            Each regression is a measure with the additional keys "baseline"
+            and "ratio", the ratio of the measure to the baseline.
+        """
+        baseline = {}
+        for record in baselineRecords:
+            key = (record["problem"], record["path"], record["batchSize"])
+            baseline[key] = record
+        regressions = []
+        for record in records:
+            key = (record["problem"], record["path"], record["batchSize"])
+            if key not in baseline:
+                continue
+            if record["path"] == "Construction":
+                reference = baseline[key]["time"]
+                ratio = record["time"] / reference
+                isRegression = ratio > 1.0 + threshold
+            else:
+                reference = baseline[key]["evaluationsPerSecond"]
+                ratio = record["evaluationsPerSecond"] / reference
+                isRegression = ratio < 1.0 - threshold
+            if isRegression:
+                regression = dict(record)
+                regression["baseline"] = reference
+                regression["ratio"] = ratio
+                regressions.append(regression)
+        return regressions
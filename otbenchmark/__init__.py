@@ -49,12 +49,14 @@ from ._GaussianProductSensitivity import GaussianProductSensitivity
 from ._GSobolSensitivity import GSobolSensitivity
 from ._CrossCutFunction import CrossCutFunction
 from ._CrossCutDistribution import CrossCutDistribution
+from ._FigureCache import FigureCache
 from ._MorrisSensitivity import MorrisSensitivity
 from ._DirichletSensitivity import DirichletSensitivity
 from ._FloodingSensitivity import FloodingSensitivity
 from ._NLOscillatorSensitivity import NLOscillatorSensitivity
 from ._SparsePolynomialChaosSensitivityAnalysis import (
     SparsePolynomialChaosSensitivityAnalysis,
+    SparsePolynomialChaosContext,
 )
 from ._BoreholeSensitivity import BoreholeSensitivity
 from ._BorgonovoSensitivity import BorgonovoSensitivity
@@ -63,6 +65,21 @@ from ._SensitivityBenchmarkMetaAlgorithm import SensitivityBenchmarkMetaAlgorith
 from ._SensitivityConvergence import SensitivityConvergence
 from ._SensitivityDistribution import SensitivityDistribution
 from ._JanonSensitivityAlgorithm import JanonSensitivityAlgorithm
+from ._ReplicatedLHSSensitivityAlgorithm import ReplicatedLHSSensitivityAlgorithm
+from ._GivenDataSensitivityAlgorithm import GivenDataSensitivityAlgorithm
+from ._BlackBoxEvaluator import BlackBoxEvaluator
+from ._BlackBoxFunction import BlackBoxFunction
+from ._BlackBoxReliabilityProblem import BlackBoxReliabilityProblem
+from ._BlackBoxServer import BlackBoxServer
+from ._EvaluationScheduler import EvaluationScheduler
+from ._ThroughputBenchmark import ThroughputBenchmark
+from ._ReliabilityMethodBenchmark import ReliabilityMethodBenchmark
+from ._CampaignStore import CampaignStore
+from ._ColumnarTable import ColumnarTable
+from ._PerformanceProfile import PerformanceProfile
+from ._EvaluationProfiler import EvaluationProfiler
+from ._EvaluationCache import EvaluationCache
+from ._SequentialRepetition import SequentialRepetition
 
 __all__ = [
     "ReliabilityBenchmarkProblem",
@@ -107,6 +124,7 @@ __all__ = [
     "GSobolSensitivity",
     "CrossCutFunction",
     "CrossCutDistribution",
+    "FigureCache",
     "ProbabilitySimulationAlgorithmFactory",
     "LHS",
     "ReliabilityBenchmarkMetaAlgorithm",
@@ -117,6 +135,7 @@ __all__ = [
     "FloodingSensitivity",
     "NLOscillatorSensitivity",
     "SparsePolynomialChaosSensitivityAnalysis",
+    "SparsePolynomialChaosContext",
     "BoreholeSensitivity",
     "BorgonovoSensitivity",
     "OakleyOHaganSensitivity",
@@ -124,6 +143,21 @@ __all__ = [
     "SensitivityConvergence",
     "SensitivityDistribution",
     "JanonSensitivityAlgorithm",
+    "ReplicatedLHSSensitivityAlgorithm",
+    "GivenDataSensitivityAlgorithm",
+    "BlackBoxEvaluator",
+    "BlackBoxFunction",
+    "BlackBoxReliabilityProblem",
+    "BlackBoxServer",
+    "EvaluationScheduler",
+    "ThroughputBenchmark",
+    "ReliabilityMethodBenchmark",
+    "CampaignStore",
+    "ColumnarTable",
+    "PerformanceProfile",
+    "EvaluationProfiler",
+    "EvaluationCache",
+    "SequentialRepetition",
 ]
 
 __version__ = "0.2.1"
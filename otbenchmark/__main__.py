@@ -0,0 +1,8 @@
+"""
+Run a benchmark campaign with python -m otbenchmark.
+"""
+
+import sys
+from ._CommandLine import main
+
+sys.exit(main())
@@ -37,6 +37,7 @@ setup(
     license="LGPL",
     url="https://github.com/openturns/otbenchmark",
     include_package_data=True,
+    entry_points={"console_scripts": ["otbenchmark = otbenchmark._CommandLine:main"]},
     maintainer="Michaël Baudin",
     maintainer_email="michael.baudin@edf.fr",
     author="Michaël Baudin, Youssef Jebroun, Elias Fekhari and Vincent Chabridon",
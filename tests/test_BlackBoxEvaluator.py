@@ -0,0 +1,168 @@
+# Copyright 2020 EDF.
+"""
+Test for BlackBoxEvaluator class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import os
+import tempfile
+import threading
+import unittest
+
+
+def createServer(**parameters):
+    # Two copies of R - S, whose components are R and -S
+    problems = [otbenchmark.RminusSReliability(), otbenchmark.RminusSReliability()]
+    components = ot.SymbolicFunction(["R", "S"], ["R", "-S"])
+    server = otbenchmark.BlackBoxServer(
+        problems=problems, componentsFunctions=[components, components], **parameters
+    )
+    return server
+
+
+class CheckBlackBoxEvaluator(unittest.TestCase):
+    def test_evaluate(self):
+        with createServer() as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(url=server.getURL(), batchSize=30)
+            x = np.random.uniform(size=(100, 2))
+            g_val_sys, g_val_comp, msg = evaluator.evaluate(-1, 0, x)
+            np.testing.assert_allclose(g_val_sys, x[:, 0] - x[:, 1])
+            np.testing.assert_allclose(g_val_comp, np.column_stack((x[:, 0], -x[:, 1])))
+            assert msg == "OK"
+            # 100 points are sent in 4 requests
+            assert server.numberOfRequests == 4
+            assert evaluator.numberOfEvaluations == 100
+            # The points are not sent twice
+            g_val_sys, _, _ = evaluator.evaluate(-1, 0, x[::-1])
+            np.testing.assert_allclose(g_val_sys, x[::-1, 0] - x[::-1, 1])
+            assert server.numberOfRequests == 4
+            assert evaluator.numberOfCacheHits == 100
+            # Another problem is not in the cache
+            _ = evaluator.evaluate(-1, 1, x[:10])
+            assert server.numberOfRequests == 5
+            evaluator.close()
+
+    def test_duplicates(self):
+        with createServer() as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(url=server.getURL())
+            x = [[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]]
+            g_val_sys, _, _ = evaluator.evaluate(-1, 0, x)
+            np.testing.assert_allclose(g_val_sys, [-1.0, -1.0, -1.0])
+            assert server.numberOfEvaluations == 2
+            # A single point
+            g_val_sys, g_val_comp, _ = evaluator.evaluate(-1, 0, [5.0, 1.0])
+            np.testing.assert_allclose(g_val_sys, [4.0])
+            np.testing.assert_allclose(g_val_comp, [[5.0, -1.0]])
+            evaluator.close()
+
+    def test_retry(self):
+        # With this seed, the first two requests fail
+        with createServer(failureProbability=0.5, seed=2) as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(
+                url=server.getURL(), backoffFactor=0.01
+            )
+            g_val_sys, _, _ = evaluator.evaluate(-1, 0, [[1.0, 3.0]])
+            np.testing.assert_allclose(g_val_sys, [-2.0])
+            assert server.numberOfFailures == 2
+            assert server.numberOfRequests == 3
+            evaluator.close()
+        # Too many failures
+        with createServer(failureProbability=1.0) as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(
+                url=server.getURL(), numberOfRetries=1, backoffFactor=0.01
+            )
+            with self.assertRaises(Exception):
+                _ = evaluator.evaluate(-1, 0, [[1.0, 3.0]])
+            evaluator.close()
+
+    def test_failedBatch(self):
+        # With this seed, only the first request fails
+        with createServer(failureProbability=0.5, seed=29) as server:
+            x = np.random.uniform(size=(30, 2))
+            with tempfile.TemporaryDirectory() as directory:
+                cacheFileName = os.path.join(directory, "cache.sqlite")
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(),
+                    batchSize=10,
+                    maximumConcurrentRequests=1,
+                    numberOfRetries=0,
+                    cacheFileName=cacheFileName,
+                )
+                # The two other batches are stored
+                with self.assertRaises(Exception):
+                    _ = evaluator.evaluate(-1, 0, x)
+                evaluator.close()
+                assert server.numberOfEvaluations == 20
+                server.failureProbability = 0.0
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(), cacheFileName=cacheFileName
+                )
+                g_val_sys, _, _ = evaluator.evaluate(-1, 0, x)
+                evaluator.close()
+                np.testing.assert_allclose(g_val_sys, x[:, 0] - x[:, 1])
+                assert server.numberOfEvaluations == 30
+
+    def test_threads(self):
+        with createServer() as server:
+            x = np.random.uniform(size=(200, 2))
+            with tempfile.TemporaryDirectory() as directory:
+                cacheFileName = os.path.join(directory, "cache.sqlite")
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(), batchSize=10, cacheFileName=cacheFileName
+                )
+                errors = []
+
+                def evaluateBlock(start):
+                    try:
+                        block = x[start : start + 50]
+                        g_val_sys, _, _ = evaluator.evaluate(-1, 0, block)
+                        np.testing.assert_allclose(g_val_sys, block[:, 0] - block[:, 1])
+                    except Exception as error:
+                        errors.append(error)
+
+                threads = [
+                    threading.Thread(target=evaluateBlock, args=(start,))
+                    for start in range(0, 200, 50)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert errors == []
+                assert evaluator.numberOfEvaluations == 200
+                evaluator.close()
+                # All the values are in the persistent cache
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(), cacheFileName=cacheFileName
+                )
+                _ = evaluator.evaluate(-1, 0, x)
+                evaluator.close()
+                assert server.numberOfEvaluations == 200
+
+    def test_persistentCache(self):
+        with createServer() as server:
+            x = np.random.uniform(size=(20, 2))
+            with tempfile.TemporaryDirectory() as directory:
+                cacheFileName = os.path.join(directory, "cache.sqlite")
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(), cacheFileName=cacheFileName
+                )
+                _ = evaluator.evaluate(-1, 0, x)
+                evaluator.close()
+                assert server.numberOfRequests == 1
+                # A new evaluator reads the cache on the disk
+                evaluator = otbenchmark.BlackBoxEvaluator(
+                    url=server.getURL(), cacheFileName=cacheFileName
+                )
+                g_val_sys, g_val_comp, _ = evaluator.evaluate(-1, 0, x)
+                evaluator.close()
+                assert server.numberOfRequests == 1
+                np.testing.assert_allclose(g_val_sys, x[:, 0] - x[:, 1])
+                np.testing.assert_allclose(
+                    g_val_comp, np.column_stack((x[:, 0], -x[:, 1]))
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
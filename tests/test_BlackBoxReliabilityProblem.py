@@ -0,0 +1,89 @@
+# Copyright 2020 EDF.
+"""
+Test for BlackBoxReliabilityProblem class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import unittest
+
+
+class CheckBlackBoxReliabilityProblem(unittest.TestCase):
+    def setUp(self):
+        # A two components system: min(3 - X1, 3 - X2) <= 0
+        distribution = ot.Normal(2)
+        g = ot.SymbolicFunction(["x1", "x2"], ["min(3 - x1, 3 - x2)"])
+        inputVector = ot.RandomVector(distribution)
+        outputVector = ot.CompositeRandomVector(g, inputVector)
+        event = ot.ThresholdEvent(outputVector, ot.LessOrEqual(), 0.0)
+        self.pf = 1.0 - ot.Normal().computeCDF(3.0) ** 2
+        problem = otbenchmark.ReliabilityBenchmarkProblem("System", event, self.pf)
+        components = ot.SymbolicFunction(["x1", "x2"], ["3 - x1", "3 - x2"])
+        self.server = otbenchmark.BlackBoxServer(
+            problems=[problem, problem], componentsFunctions=[components, None]
+        )
+        self.server.start()
+        self.evaluator = otbenchmark.BlackBoxEvaluator(url=self.server.getURL())
+
+    def tearDown(self):
+        self.evaluator.close()
+        self.server.stop()
+
+    def test_BlackBoxFunction(self):
+        blackBox = otbenchmark.BlackBoxFunction(
+            -1, 0, 2, numberOfComponents=2, evaluator=self.evaluator
+        )
+        g = blackBox.getFunction()
+        inputSample = ot.Sample([[1.0, 2.0], [4.0, 0.0], [0.0, 5.0]])
+        outputSample = g(inputSample)
+        np.testing.assert_allclose(np.ravel(outputSample), [1.0, -1.0, -2.0])
+        assert blackBox.getNumberOfRemoteEvaluations() == 3
+        # The components are in the cache
+        components = blackBox.getComponentsFunction()(inputSample)
+        np.testing.assert_allclose(
+            np.array(components), [[2.0, 1.0], [-1.0, 3.0], [3.0, -2.0]]
+        )
+        assert blackBox.getNumberOfRemoteEvaluations() == 3
+
+    def test_BlackBoxReliabilityProblem(self):
+        # The second problem of the server has no component
+        problem = otbenchmark.BlackBoxReliabilityProblem(
+            -1, 1, ot.Normal(2), self.pf, evaluator=self.evaluator
+        )
+        assert problem.getName() == "BB-1-1"
+        np.testing.assert_allclose(problem.getProbability(), self.pf)
+        # The evaluator already sends concurrent requests: no scheduler
+        assert not problem.isExpensive()
+        benchmark = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem)
+        assert benchmark.scheduler is None
+        result = benchmark.runMonteCarlo(
+            maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=1000
+        )
+        assert result.numberOfFunctionEvaluations == 10000
+        blackBox = problem.getBlackBoxFunction()
+        assert blackBox.getNumberOfRemoteEvaluations() == 10000
+        # The components are not available
+        with self.assertRaises(ValueError):
+            _ = blackBox.getComponentsFunction()
+
+    def test_remoteEvaluations(self):
+        problem = otbenchmark.BlackBoxReliabilityProblem(
+            -1, 0, ot.Normal(2), self.pf, evaluator=self.evaluator
+        )
+        benchmark = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem)
+        ot.RandomGenerator.SetSeed(0)
+        result = benchmark.runMonteCarlo(
+            maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=100
+        )
+        assert result.numberOfFunctionEvaluations == 1000
+        # The same points are served by the cache of the evaluator
+        ot.RandomGenerator.SetSeed(0)
+        result = benchmark.runMonteCarlo(
+            maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=100
+        )
+        assert result.numberOfFunctionEvaluations == 0
+        assert self.server.numberOfEvaluations == 1000
+
+
+if __name__ == "__main__":
+    unittest.main()
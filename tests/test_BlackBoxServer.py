@@ -0,0 +1,106 @@
+# Copyright 2020 EDF.
+"""
+Test for BlackBoxServer class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import time
+import unittest
+
+
+class CheckBlackBoxServer(unittest.TestCase):
+    def test_evaluate(self):
+        problems = [otbenchmark.RminusSReliability(), otbenchmark.ReliabilityProblem8()]
+        with otbenchmark.BlackBoxServer(problems=problems) as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(url=server.getURL())
+            # RminusS: g = R - S < 0
+            g_val_sys, g_val_comp, msg = evaluator.evaluate(-1, 0, [[4.0, 1.0]])
+            np.testing.assert_allclose(g_val_sys, [3.0])
+            assert g_val_comp.shape == (1, 0)
+            assert msg == "OK"
+            # Unknown problem
+            with self.assertRaises(Exception):
+                _ = evaluator.evaluate(-1, 2, [[4.0, 1.0]])
+            # Wrong dimension
+            with self.assertRaises(Exception):
+                _ = evaluator.evaluate(-1, 1, [[4.0, 1.0]])
+            evaluator.close()
+
+    def test_buildProblem(self):
+        problems = [otbenchmark.RminusSReliability()]
+        with otbenchmark.BlackBoxServer(problems=problems) as server:
+            problem = server.buildProblem(0)
+            assert problem.getName() == "BB-R-S"
+            assert problem.getProbability() == problems[0].getProbability()
+            g = problem.getEvent().getFunction()
+            gRef = problems[0].getEvent().getFunction()
+            x = ot.Normal(2).getSample(100)
+            np.testing.assert_allclose(np.array(g(x)), np.array(gRef(x)))
+            benchmark = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem)
+            result = benchmark.runMonteCarlo(
+                maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=100
+            )
+            assert result.numberOfFunctionEvaluations == 1000
+            assert server.numberOfEvaluations == 1100
+            problem.getBlackBoxFunction().evaluator.close()
+
+    def test_componentsFunctions(self):
+        problems = [otbenchmark.RminusSReliability()]
+        components = ot.SymbolicFunction(["R", "S"], ["R", "-S"])
+        with otbenchmark.BlackBoxServer(
+            problems=problems, componentsFunctions=[components]
+        ) as server:
+            problem = server.buildProblem(0)
+            blackBox = problem.getBlackBoxFunction()
+            x = ot.Sample([[4.0, 1.0], [2.0, 3.0]])
+            np.testing.assert_allclose(
+                np.array(blackBox.getComponentsFunction()(x)),
+                [[4.0, -1.0], [2.0, -3.0]],
+            )
+            blackBox.evaluator.close()
+        with self.assertRaises(ValueError):
+            otbenchmark.BlackBoxServer(
+                problems=problems, componentsFunctions=[components, None]
+            )
+
+    def test_latency(self):
+        problems = [otbenchmark.RminusSReliability()]
+        with otbenchmark.BlackBoxServer(
+            problems=problems, latency=0.2, maximumConcurrentRequests=2
+        ) as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(
+                url=server.getURL(), batchSize=10, maximumConcurrentRequests=4
+            )
+            x = np.random.uniform(size=(40, 2))
+            startTime = time.time()
+            _ = evaluator.evaluate(-1, 0, x)
+            elapsedTime = time.time() - startTime
+            # 4 requests, with 2 requests at the same time
+            assert server.numberOfRequests == 4
+            assert elapsedTime >= 0.4
+            assert elapsedTime < 0.8
+            evaluator.close()
+
+    def test_failures(self):
+        problems = [otbenchmark.RminusSReliability()]
+        with otbenchmark.BlackBoxServer(
+            problems=problems, failureProbability=0.5, maximumBatchSize=5
+        ) as server:
+            evaluator = otbenchmark.BlackBoxEvaluator(
+                url=server.getURL(), batchSize=5, numberOfRetries=20, backoffFactor=0.0
+            )
+            x = np.random.uniform(size=(50, 2))
+            g_val_sys, _, _ = evaluator.evaluate(-1, 0, x)
+            np.testing.assert_allclose(g_val_sys, x[:, 0] - x[:, 1])
+            assert server.numberOfFailures > 0
+            assert server.numberOfRequests == 10 + server.numberOfFailures
+            # Too many points in a request
+            evaluator.batchSize = 6
+            with self.assertRaises(Exception):
+                _ = evaluator.evaluate(-1, 0, np.random.uniform(size=(6, 2)))
+            evaluator.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# Copyright 2020 EDF.
+"""
+Test for CampaignStore class.
+"""
+import otbenchmark
+import openturns as ot
+import os
+import tempfile
+import unittest
+
+
+class CheckCampaignStore(unittest.TestCase):
+    def test_addGet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "campaign.sqlite")
+            store = otbenchmark.CampaignStore(fileName, batchSize=2)
+            parameters = {"blockSize": 10, "maximumOuterSampling": 100}
+            store.add("RP8", "MonteCarlo", parameters, 1, {"pf": 0.1}, 2.0)
+            # The pending result is taken into account
+            assert store.isCompleted("RP8", "MonteCarlo", parameters, 1)
+            assert not store.isCompleted("RP8", "MonteCarlo", parameters, 2)
+            # The order of the parameters does not matter
+            otherParameters = {"maximumOuterSampling": 100, "blockSize": 10}
+            assert store.isCompleted("RP8", "MonteCarlo", otherParameters, 1)
+            store.add("Ishigami", "Janon", {}, 1, {"S": ot.Point([0.3, 0.4])})
+            assert len(store.buffer) == 0
+            store.add("RP8", "FORM", {}, 1, {"pf": 0.2})
+            store.close()
+            # The results are persistent
+            with otbenchmark.CampaignStore(fileName) as store:
+                assert store.getNumberOfResults() == 3
+                result = store.getResult("RP8", "MonteCarlo", parameters, 1)
+                assert result["metrics"] == {"pf": 0.1}
+                assert result["time"] == 2.0
+                results = store.getResults(problem="Ishigami")
+                assert results[0]["metrics"]["S"] == [0.3, 0.4]
+                results = store.getResults(method="FORM")
+                assert len(results) == 1
+
+    def test_resume(self):
+        problems = [otbenchmark.RminusSReliability()]
+        benchmark = otbenchmark.ReliabilityMethodBenchmark(
+            problems, methods=["FORM", "MonteCarlo"], maximumOuterSampling=10
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "campaign.sqlite")
+            with otbenchmark.CampaignStore(fileName) as store:
+                records = benchmark.run(store)
+                assert store.getNumberOfResults() == 2
+            # The completed cells are read from the store
+            with otbenchmark.CampaignStore(fileName) as store:
+                otherRecords = benchmark.run(store)
+                assert otherRecords == records
+                # A new budget is a new cell
+                benchmark.maximumOuterSampling = 20
+                benchmark.run(store)
+                assert store.getNumberOfResults() == 3
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# Copyright 2020 EDF.
+"""
+Test for ColumnarTable class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class CheckColumnarTable(unittest.TestCase):
+    def test_append(self):
+        with tempfile.TemporaryDirectory() as directory:
+            table = otbenchmark.ColumnarTable(os.path.join(directory, "table"))
+            assert table.getNumberOfRows() == 0
+            first = ot.Normal(3).getSample(10)
+            table.append({"sampleSize": [[20]] * 10, "first": first})
+            table.append({"sampleSize": [[40]] * 5, "first": first[:5]})
+            assert table.getNumberOfRows() == 15
+            # The table is read again from the directory
+            table = otbenchmark.ColumnarTable(os.path.join(directory, "table"))
+            columns = table.load()
+            assert isinstance(columns["first"], np.memmap)
+            assert columns["first"].shape == (15, 3)
+            np.testing.assert_array_equal(columns["first"][:10], np.array(first))
+            np.testing.assert_array_equal(columns["first"][10:], np.array(first[:5]))
+            assert columns["sampleSize"][-1, 0] == 40
+            columns = table.load(["sampleSize"], mmap=False)
+            assert list(columns.keys()) == ["sampleSize"]
+            # Wrong columns or shapes
+            with self.assertRaises(ValueError):
+                table.append({"sampleSize": [[20]]})
+            with self.assertRaises(ValueError):
+                table.append({"sampleSize": [[20]], "first": ot.Normal(2).getSample(1)})
+            with self.assertRaises(ValueError):
+                table.append({"sampleSize": [[20]] * 2, "first": first[:1]})
+            assert table.getNumberOfRows() == 15
+
+    def test_records(self):
+        records = [
+            {"problem": "RP8", "method": "FORM", "pf": 0.1, "calls": 10},
+            {"problem": "RP14", "method": "FORM", "pf": 0.2, "calls": 20},
+        ]
+        otherRecords = [{"problem": "RP8", "method": "SORM", "pf": 0.3, "calls": 30}]
+        with tempfile.TemporaryDirectory() as directory:
+            table = otbenchmark.ColumnarTable(os.path.join(directory, "table"))
+            table.appendRecords(records)
+            table.appendRecords(otherRecords)
+            columns = table.load()
+            assert list(columns["problem"]) == ["RP8", "RP14", "RP8"]
+            assert list(columns["method"]) == ["FORM", "FORM", "SORM"]
+            np.testing.assert_array_equal(columns["calls"], [10, 20, 30])
+            # Export
+            fileName = os.path.join(directory, "table.npz")
+            table.export(fileName)
+            importedColumns = otbenchmark.ColumnarTable.Import(fileName)
+            for name in columns:
+                np.testing.assert_array_equal(importedColumns[name], columns[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
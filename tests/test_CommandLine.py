@@ -0,0 +1,123 @@
+# Copyright 2020 EDF.
+"""
+Test for the otbenchmark command.
+"""
+import otbenchmark
+from otbenchmark._CommandLine import main
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+
+def runMain(argv):
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        status = main(argv)
+    return status, stream.getvalue()
+
+
+class CheckCommandLine(unittest.TestCase):
+    def test_list(self):
+        status, output = runMain(["--list"])
+        assert status == 0
+        assert "RP8" in output
+        assert "SubsetSampling" in output
+        assert "lowDimension" in output
+
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            storeFileName = os.path.join(directory, "campaign.sqlite")
+            outputFileName = os.path.join(directory, "records.csv")
+            argv = [
+                "--problems",
+                "RP8",
+                "RP22",
+                "--methods",
+                "approximation",
+                "MonteCarlo",
+                "--seeds",
+                "0",
+                "1",
+                "--maximum-outer-sampling",
+                "10",
+                "--store",
+                storeFileName,
+                "--output",
+                outputFileName,
+                "--profile",
+            ]
+            status, output = runMain(argv)
+            assert status == 0
+            lines = output.splitlines()
+            assert lines[0].startswith("Problem")
+            for method in ["FORM", "SORM", "MonteCarlo"]:
+                assert method in output
+            assert "SubsetSampling" not in output
+            assert "numberOfEvaluations" in output
+            records = otbenchmark.ReliabilityMethodBenchmark.Load(outputFileName)
+            assert len(records) == 12
+            with otbenchmark.CampaignStore(storeFileName) as store:
+                assert store.getNumberOfResults() == 12
+            # The runs are read from the store
+            status, secondOutput = runMain(argv)
+            assert secondOutput == output
+
+    def test_workers(self):
+        # RP25 cannot be pickled: the workers are forked
+        status, output = runMain(
+            [
+                "-p",
+                "RP25",
+                "-m",
+                "FORM",
+                "MonteCarlo",
+                "--maximum-outer-sampling",
+                "10",
+                "-w",
+                "2",
+            ]
+        )
+        assert status == 0
+        assert "MonteCarlo" in output
+
+    def test_workersStore(self):
+        with tempfile.TemporaryDirectory() as directory:
+            storeFileName = os.path.join(directory, "campaign.sqlite")
+            argv = [
+                "-p",
+                "RP8",
+                "RP25",
+                "--maximum-outer-sampling",
+                "10",
+                "-w",
+                "2",
+                "--store",
+                storeFileName,
+                "-m",
+            ]
+            status, output = runMain(argv + ["FORM", "MonteCarlo"])
+            assert status == 0
+            with otbenchmark.CampaignStore(storeFileName) as store:
+                assert store.getNumberOfResults() == 4
+            # The stored runs are skipped, only SORM is run
+            status, secondOutput = runMain(argv + ["approximation", "MonteCarlo"])
+            assert status == 0
+            with otbenchmark.CampaignStore(storeFileName) as store:
+                assert store.getNumberOfResults() == 6
+            secondLines = secondOutput.splitlines()
+            for line in output.splitlines():
+                assert line in secondLines
+            assert len([line for line in secondLines if " SORM " in line]) == 2
+
+    def test_unknownSelector(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(["--problems", "RP8", "NoSuchProblem"])
+            with self.assertRaises(SystemExit):
+                main(["--methods", "NoSuchMethod"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Test for CrossCutDistribution class.
 import otbenchmark
 import unittest
 import openturns as ot
+import numpy as np
 
 
 class CheckCrossCutDistribution(unittest.TestCase):
@@ -43,6 +44,47 @@ class CheckCrossCutDistribution(unittest.TestCase):
         except Exception as e:
             print(e)
 
+    def test_computeConditionalPDF(self):
+        correlation = ot.CorrelationMatrix(3)
+        correlation[0, 1] = 0.5
+        correlation[1, 2] = -0.3
+        distribution = ot.Normal([1.0, 0.0, 0.5], [2.0, 1.0, 1.5], correlation)
+        referencePoint = ot.Point([1.5, -0.5, 1.0])
+        crossCut = otbenchmark.CrossCutDistribution(distribution)
+        numberOfPoints = 101
+        grids, curvePDF, contourPDF = crossCut.computeConditionalPDF(
+            referencePoint, numberOfPoints=numberOfPoints
+        )
+        assert len(grids) == 3
+        assert len(curvePDF) == 3
+        assert len(contourPDF) == 3
+        # Check the diagonal with the exact conditional distribution
+        conditional = ot.PointConditionalDistribution(
+            distribution, [0, 2], [referencePoint[0], referencePoint[2]]
+        )
+        exact = conditional.computePDF(ot.Sample.BuildFromPoint(grids[1]))
+        np.testing.assert_allclose(curvePDF[1], np.ravel(exact), atol=1.0e-4)
+        # Check the lower triangle: the X axis is X0 and the Y axis is X2
+        conditional = ot.PointConditionalDistribution(
+            distribution, [1], [referencePoint[1]]
+        )
+        x, y = np.meshgrid(grids[0], grids[2])
+        exact = conditional.computePDF(np.column_stack((x.ravel(), y.ravel())))
+        np.testing.assert_allclose(contourPDF[(2, 0)], np.ravel(exact), atol=1.0e-4)
+        # The second call uses the cache
+        result = crossCut.computeConditionalPDF(
+            referencePoint, numberOfPoints=numberOfPoints
+        )
+        assert result[1] is curvePDF
+        # The blocks split across several batches give the same values
+        crossCut = otbenchmark.CrossCutDistribution(distribution)
+        crossCut.maximumBatchSize = 1000
+        _, curvePDF2, contourPDF2 = crossCut.computeConditionalPDF(
+            referencePoint, numberOfPoints=numberOfPoints
+        )
+        np.testing.assert_allclose(curvePDF2[1], curvePDF[1])
+        np.testing.assert_allclose(contourPDF2[(2, 0)], contourPDF[(2, 0)])
+
 
 if __name__ == "__main__":
     import matplotlib
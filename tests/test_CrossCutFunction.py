@@ -3,6 +3,8 @@
 Test for CrossCutDistribution class.
 """
 import otbenchmark
+import openturns as ot
+import numpy as np
 import unittest
 
 
@@ -27,6 +29,37 @@ class CheckCrossCutFunction(unittest.TestCase):
         except Exception as e:
             print(e)
 
+    def test_computeCrossCutValues(self):
+        numberOfCalls = [0]
+
+        def g(X):
+            numberOfCalls[0] += 1
+            X = np.array(X)
+            return np.array([X[:, 0] + X[:, 1] ** 2 - 2.0 * X[:, 2]]).T
+
+        function = ot.PythonFunction(3, 1, func_sample=g)
+        referencePoint = ot.Point([1.0, 2.0, 3.0])
+        crossCut = otbenchmark.CrossCutFunction(function, referencePoint)
+        interval = ot.Interval([-1.0, 0.0, 1.0], [1.0, 2.0, 4.0])
+        nX = 5
+        nY = 4
+        (
+            gridsX,
+            gridsY,
+            curveValues,
+            contourValues,
+        ) = crossCut._computeCrossCutValues(interval, [nX, nY])
+        # All the cross-cuts are evaluated with a single call
+        assert numberOfCalls[0] == 1
+        np.testing.assert_allclose(gridsX[1], np.linspace(0.0, 2.0, nX))
+        np.testing.assert_allclose(gridsY[2], np.linspace(1.0, 4.0, nY))
+        np.testing.assert_allclose(curveValues[1], 1.0 + gridsX[1] ** 2 - 6.0)
+        assert len(contourValues) == 3
+        # The X axis is the input 0 and the Y axis is the input 2
+        x, y = np.meshgrid(gridsX[0], gridsY[2])
+        expected = x.ravel() + 4.0 - 2.0 * y.ravel()
+        np.testing.assert_allclose(contourValues[(2, 0)], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ import openturns as ot
 import otbenchmark
 import unittest
 import numpy as np
+import pylab as pl
 
 
 class CheckDrawEvent(unittest.TestCase):
@@ -214,6 +215,125 @@ class CheckDrawEvent(unittest.TestCase):
         j = 4
         _ = drawEvent.drawSampleCrossCut(sampleSize, i, j)
 
+    def test_fillEventCrossCut(self):
+        R = ot.Normal(4.0, 1.0)
+        R.setDescription("R")
+        S = ot.Normal(2.0, 1.0)
+        S.setDescription("S")
+        g = ot.SymbolicFunction(["R", "S"], ["R - S"])
+        distribution = ot.JointDistribution([R, S])
+        inputRV = ot.RandomVector(distribution)
+        outputRV = ot.CompositeRandomVector(g, inputRV)
+        eventF = ot.ThresholdEvent(outputRV, ot.GreaterOrEqual(), 0)
+        bounds = ot.Interval([0.0, 0.0], [6.0, 6.0])
+        drawEvent = otbenchmark.DrawEvent(eventF)
+        nX = 20
+        nY = 30
+        graph = drawEvent.fillEventCrossCut(bounds, 0, 1, nX, nY)
+        inside = graph.getDrawable(0).getImplementation()
+        outside = graph.getDrawable(1).getImplementation()
+        assert inside.getVerticesNumber() == 4
+        insideCorners = np.array(inside.getCoordinates()).reshape(-1, 4, 2)
+        outsideCorners = np.array(outside.getCoordinates()).reshape(-1, 4, 2)
+        # All the simplices of the mesh are drawn
+        assert insideCorners.shape[0] + outsideCorners.shape[0] == 2 * nX * nY
+        # Check the classification with the mean of the corners
+        insideMean = np.mean(insideCorners[:, :, 0] - insideCorners[:, :, 1], axis=1)
+        outsideMean = np.mean(outsideCorners[:, :, 0] - outsideCorners[:, :, 1], axis=1)
+        assert np.all(insideMean >= 0.0)
+        assert np.all(outsideMean < 0.0)
+
+    def test_computeCrossCutGrids(self):
+        X = ot.Normal(3)
+        X.setDescription(["X1", "X2", "X3"])
+        g = ot.SymbolicFunction(["X1", "X2", "X3"], ["X1 + 2 * X2 - X3"])
+        inputRV = ot.RandomVector(X)
+        outputRV = ot.CompositeRandomVector(g, inputRV)
+        eventF = ot.ThresholdEvent(outputRV, ot.Less(), 0.0)
+        bounds = ot.Interval([-3.0] * 3, [3.0] * 3)
+        drawEvent = otbenchmark.DrawEvent(eventF)
+        nX = 10
+        nY = 12
+        drawEvent.computeCrossCutGrids(bounds, nX, nY)
+        # One grid for each of the 3 pairs of inputs
+        assert len(drawEvent.crossCutGridCache) == 3
+        callsNumber = g.getEvaluationCallsNumber()
+        crossCutBounds = ot.Interval([-3.0] * 2, [3.0] * 2)
+        vertices, outputValues = drawEvent.computeCrossCutGrid(
+            crossCutBounds, 0, 2, nX, nY
+        )
+        # The grid is reused from the cache
+        assert g.getEvaluationCallsNumber() == callsNumber
+        assert vertices.getSize() == (nX + 2) * (nY + 2)
+        # The frozen input is set to the mean
+        expected = np.array(vertices)[:, 0] - np.array(vertices)[:, 1]
+        np.testing.assert_allclose(np.ravel(outputValues), expected, atol=1.0e-12)
+        _ = drawEvent.drawLimitState(bounds, nX, nY)
+        assert g.getEvaluationCallsNumber() == callsNumber
+        drawEvent.clearCrossCutGridCache()
+        assert len(drawEvent.crossCutGridCache) == 0
+
+    def test_drawSharedGrid(self):
+        # The grid does not depend on the flags
+        X = ot.Normal(3)
+        X.setDescription(["X1", "X2", "X3"])
+        g = ot.SymbolicFunction(["X1", "X2", "X3"], ["X1 + 2 * X2 - X3"])
+        inputRV = ot.RandomVector(X)
+        outputRV = ot.CompositeRandomVector(g, inputRV)
+        eventF = ot.ThresholdEvent(outputRV, ot.Less(), 0.0)
+        bounds = ot.Interval([-3.0] * 3, [3.0] * 3)
+        nX = 10
+        nY = 12
+        for drawLimitState in [True, False]:
+            drawEvent = otbenchmark.DrawEvent(eventF)
+            callsNumber = g.getEvaluationCallsNumber()
+            fig = drawEvent.draw(
+                bounds,
+                nX=nX,
+                nY=nY,
+                drawLimitState=drawLimitState,
+                drawSample=False,
+                fillEvent=True,
+            )
+            # 3 grids with nX * nY cells
+            pl.close(fig)
+            calls = g.getEvaluationCallsNumber() - callsNumber
+            assert calls == 3 * (nX + 1) * (nY + 1)
+        # The limit state alone uses the same grid
+        callsNumber = g.getEvaluationCallsNumber()
+        fig = drawEvent.draw(
+            bounds, nX=nX, nY=nY, drawLimitState=True, drawSample=False
+        )
+        pl.close(fig)
+        assert g.getEvaluationCallsNumber() == callsNumber
+
+    def test_drawInputOutputSampleDecimation(self):
+        R = ot.Normal(5.0, 1.0)
+        R.setDescription("R")
+        S = ot.Normal(2.0, 1.0)
+        S.setDescription("S")
+        g = ot.SymbolicFunction(["R", "S"], ["R - S"])
+        distribution = ot.JointDistribution([R, S])
+        inputRV = ot.RandomVector(distribution)
+        outputRV = ot.CompositeRandomVector(g, inputRV)
+        eventF = ot.ThresholdEvent(outputRV, ot.Less(), 0.0)
+        drawEvent = otbenchmark.DrawEvent(eventF, maximumCloudSize=1000)
+        inputSample = distribution.getSample(20000)
+        outputSample = g(inputSample)
+        graph = drawEvent.drawInputOutputSample(inputSample, outputSample)
+        x = np.array(inputSample)
+        isInside = x[:, 0] - x[:, 1] < 0.0
+        numberOfInside = np.sum(isInside)
+        # The rare points inside the event are all drawn
+        assert numberOfInside < 1000
+        inside = graph.getDrawable(0)
+        assert inside.getLegend() == "In"
+        np.testing.assert_array_equal(np.array(inside.getData()), x[isInside])
+        # The points outside the event are decimated
+        outside = graph.getDrawable(1)
+        assert outside.getLegend() == "Out (1/20)"
+        np.testing.assert_array_equal(np.array(outside.getData()), x[~isInside][::20])
+
 
 if __name__ == "__main__":
     unittest.main()
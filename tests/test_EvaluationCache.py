@@ -0,0 +1,130 @@
+# Copyright 2020 EDF.
+"""
+Test for EvaluationCache class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import math
+import os
+import tempfile
+import unittest
+
+
+class CheckEvaluationCache(unittest.TestCase):
+    def test_evaluate(self):
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 - x2", "x1 * x2"])
+        cache = otbenchmark.EvaluationCache(maximumSize=3)
+        cachedFunction = cache.wrapFunction(g)
+        inputSample = ot.Sample([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+        outputSample = cachedFunction(inputSample)
+        # The duplicate point is evaluated once
+        assert g.getEvaluationCallsNumber() == 2
+        np.testing.assert_allclose(np.array(outputSample), np.array(g(inputSample)))
+        # A copy of the function shares the cache
+        cachedFunction = cache.wrapFunction(ot.Function(g))
+        assert cache.numberOfMisses == 2
+        assert cache.numberOfHits == 1
+        callsNumber = g.getEvaluationCallsNumber()
+        cachedFunction([1.0, 2.0])
+        assert g.getEvaluationCallsNumber() == callsNumber
+        assert cache.getHitRate() == 0.5
+        # The least recently used point is removed
+        cachedFunction(ot.Sample([[5.0, 6.0], [7.0, 8.0]]))
+        assert cache.getSize() == 3
+        assert cache.numberOfEvictions == 1
+        cachedFunction([3.0, 4.0])
+        assert g.getEvaluationCallsNumber() == callsNumber + 3
+
+    def test_oneFunction(self):
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 - x2"])
+        cache = otbenchmark.EvaluationCache()
+        _ = cache.wrapFunction(g)
+        # Another function, even with the same formula, is rejected
+        with self.assertRaises(ValueError):
+            cache.wrapFunction(ot.SymbolicFunction(["x1", "x2"], ["x1 - x2"]))
+        # The cleared cache can be bound to another function
+        cache.clear()
+        h = ot.SymbolicFunction(["x1", "x2", "x3"], ["x1 - x2 + x3"])
+        cachedFunction = cache.wrapFunction(h)
+        np.testing.assert_allclose(cachedFunction([1.0, 2.0, 3.0]), [2.0])
+
+    def test_saveLoad(self):
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 - x2"])
+        cache = otbenchmark.EvaluationCache()
+        cachedFunction = cache.wrapFunction(g)
+        inputSample = ot.Normal(2).getSample(10)
+        cachedFunction(inputSample)
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "cache.npz")
+            cache.save(fileName)
+            otherCache = otbenchmark.EvaluationCache()
+            otherCache.load(fileName)
+        assert otherCache.getSize() == 10
+        cachedFunction = otherCache.wrapFunction(g)
+        outputSample = cachedFunction(inputSample)
+        np.testing.assert_allclose(np.array(outputSample), np.array(g(inputSample)))
+        assert otherCache.numberOfMisses == 0
+        # The points of the file must have the dimensions of the function
+        h = ot.SymbolicFunction(["x1", "x2", "x3"], ["x1 - x2 + x3"])
+        otherCache = otbenchmark.EvaluationCache()
+        _ = otherCache.wrapFunction(h)
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "cache.npz")
+            cache.save(fileName)
+            with self.assertRaises(ValueError):
+                otherCache.load(fileName)
+            # A loaded cache cannot be bound to a function of other dimensions
+            otherCache = otbenchmark.EvaluationCache()
+            otherCache.load(fileName)
+        with self.assertRaises(ValueError):
+            otherCache.wrapFunction(h)
+
+    def test_metaAlgorithm(self):
+        problem = otbenchmark.ReliabilityProblem8()
+        cache = otbenchmark.EvaluationCache()
+        metaAlgorithm = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+            problem, cache=cache
+        )
+        nearestPointAlgorithm = ot.AbdoRackwitz()
+        resultFORM = metaAlgorithm.runFORM(nearestPointAlgorithm)
+        reference = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem)
+        referenceFORM = reference.runFORM(nearestPointAlgorithm)
+        assert resultFORM.computedProbability == referenceFORM.computedProbability
+        assert (
+            resultFORM.numberOfFunctionEvaluations + resultFORM.numberOfCacheHits
+            == referenceFORM.numberOfFunctionEvaluations
+        )
+        # The second run of FORM is in the cache
+        metaAlgorithm = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+            problem, cache=cache
+        )
+        resultFORM = metaAlgorithm.runFORM(nearestPointAlgorithm)
+        assert resultFORM.numberOfFunctionEvaluations == 0
+        assert resultFORM.numberOfCacheHits == referenceFORM.numberOfFunctionEvaluations
+        assert math.isnan(resultFORM.numberOfDigitsPerEvaluation)
+
+    def test_metaAlgorithmScheduler(self):
+        problem = otbenchmark.ReliabilityProblem8()
+        problem.setExpensive(True)
+        cache = otbenchmark.EvaluationCache()
+        scheduler = otbenchmark.EvaluationScheduler(maximumInFlight=2)
+        nearestPointAlgorithm = ot.AbdoRackwitz()
+        # Each meta-algorithm has its own scheduled function, but the cache
+        # is bound to the function of the problem
+        for k in range(2):
+            metaAlgorithm = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+                problem, scheduler=scheduler, cache=cache
+            )
+            resultFORM = metaAlgorithm.runFORM(nearestPointAlgorithm)
+        assert resultFORM.numberOfFunctionEvaluations == 0
+        scheduler.close()
+        # The cache cannot be used with another problem
+        with self.assertRaises(ValueError):
+            otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+                otbenchmark.ReliabilityProblem14(), cache=cache
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
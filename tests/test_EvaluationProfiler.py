@@ -0,0 +1,68 @@
+# Copyright 2020 EDF.
+"""
+Test for EvaluationProfiler class.
+"""
+import otbenchmark
+import openturns as ot
+import unittest
+
+
+class CheckEvaluationProfiler(unittest.TestCase):
+    def test_monteCarlo(self):
+        problem = otbenchmark.RminusSReliability()
+        profiler = otbenchmark.EvaluationProfiler()
+        metaAlgorithm = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+            problem, profiler=profiler
+        )
+        result = metaAlgorithm.runMonteCarlo(
+            maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=100
+        )
+        profile = result.evaluationProfile
+        assert profile["numberOfCalls"] == 10
+        assert profile["numberOfEvaluations"] == 1000
+        assert profile["numberOfEvaluations"] == result.numberOfFunctionEvaluations
+        assert profile["batchSizes"] == {100: 10}
+        assert sum(profile["latencyHistogram"][0]) == 10
+        assert profile["phases"]["Sampling"]["numberOfCalls"] == 10
+        assert profile["phases"]["PostProcessing"]["numberOfCalls"] == 0
+        assert profile["time"] >= profile["timeInside"]
+        assert profile["codeProfile"] is None
+        s = otbenchmark.EvaluationProfiler.summary(profile)
+        assert "Sampling" in s
+
+    def test_formImportanceSampling(self):
+        problem = otbenchmark.ReliabilityProblem8()
+        profiler = otbenchmark.EvaluationProfiler("cProfile")
+        metaAlgorithm = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(
+            problem, profiler=profiler
+        )
+        nearestPointAlgorithm = ot.AbdoRackwitz()
+        result = metaAlgorithm.runFORMImportanceSampling(
+            nearestPointAlgorithm,
+            maximumOuterSampling=10,
+            coefficientOfVariation=0.0,
+            blockSize=10,
+        )
+        profile = result.evaluationProfile
+        phases = profile["phases"]
+        assert phases["DesignPointSearch"]["numberOfEvaluations"] > 0
+        assert phases["Sampling"]["numberOfEvaluations"] == 100
+        assert profile["numberOfEvaluations"] == result.numberOfFunctionEvaluations
+        assert "cumulative" in profile["codeProfile"]
+
+    def test_gradient(self):
+        # The finite differences are evaluated by the profiled function
+        g = ot.PythonFunction(2, 1, lambda X: [X[0] * X[1]])
+        profiler = otbenchmark.EvaluationProfiler()
+        profiledFunction = profiler.wrapFunction(g)
+        profiledFunction.gradient([1.0, 2.0])
+        assert profiledFunction.getEvaluationCallsNumber() == 4
+        # The exact gradient is kept
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 * x2"])
+        profiledFunction = profiler.wrapFunction(g)
+        profiledFunction.gradient([1.0, 2.0])
+        assert profiledFunction.getEvaluationCallsNumber() == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Copyright 2020 EDF.
+"""
+Test for EvaluationScheduler class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import asyncio
+import threading
+import time
+import unittest
+
+
+class SlowFunction:
+    """A slow function which records the number of concurrent calls."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.numberOfRunningCalls = 0
+        self.maximumNumberOfRunningCalls = 0
+
+    def __call__(self, X):
+        with self.lock:
+            self.numberOfRunningCalls += 1
+            self.maximumNumberOfRunningCalls = max(
+                self.maximumNumberOfRunningCalls, self.numberOfRunningCalls
+            )
+        time.sleep(0.2)
+        with self.lock:
+            self.numberOfRunningCalls -= 1
+        X = np.array(X)
+        return np.array([X[:, 0] - X[:, 1]]).T
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class CheckEvaluationScheduler(unittest.TestCase):
+    def test_evaluate(self):
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 - 2 * x2"])
+        inputSample = ot.Normal(2).getSample(103)
+        expected = np.array(g(inputSample))
+        for backend in otbenchmark.EvaluationScheduler.GetBackends():
+            scheduler = otbenchmark.EvaluationScheduler(backend, maximumInFlight=3)
+            outputSample = scheduler.evaluate(g, inputSample)
+            np.testing.assert_allclose(np.array(outputSample), expected)
+            scheduler.close()
+        # Chunks with a given size
+        scheduler = otbenchmark.EvaluationScheduler(chunkSize=10)
+        assert len(scheduler._splitChunks(103)) == 11
+        outputSample = scheduler.evaluate(g, inputSample)
+        np.testing.assert_allclose(np.array(outputSample), expected)
+        scheduler.close()
+
+    def test_coroutine(self):
+        numberOfCalls = [0]
+
+        async def g(X):
+            numberOfCalls[0] += 1
+            await asyncio.sleep(0.01)
+            return X[:, [0]] + X[:, [1]]
+
+        scheduler = otbenchmark.EvaluationScheduler("Asyncio", maximumInFlight=4)
+        inputSample = ot.Normal(2).getSample(20)
+        outputSample = scheduler.evaluate(g, inputSample)
+        x = np.array(inputSample)
+        np.testing.assert_allclose(np.ravel(outputSample), x[:, 0] + x[:, 1])
+        assert numberOfCalls[0] == 4
+
+    def test_wrapFunction(self):
+        slowFunction = SlowFunction()
+        g = ot.PythonFunction(2, 1, func_sample=slowFunction)
+        g.setInputDescription(["R", "S"])
+        scheduler = otbenchmark.EvaluationScheduler(maximumInFlight=4)
+        scheduledFunction = scheduler.wrapFunction(g)
+        assert scheduledFunction.getInputDescription() == g.getInputDescription()
+        inputSample = ot.Normal(2).getSample(40)
+        outputSample = scheduledFunction(inputSample)
+        x = np.array(inputSample)
+        np.testing.assert_allclose(np.ravel(outputSample), x[:, 0] - x[:, 1])
+        # The 4 chunks overlap, with at most 4 chunks in flight
+        assert g.getEvaluationCallsNumber() == 40
+        assert scheduledFunction.getEvaluationCallsNumber() == 40
+        assert 1 < slowFunction.maximumNumberOfRunningCalls <= 4
+        scheduler.close()
+
+    def test_wrapFunctionGradient(self):
+        g = ot.SymbolicFunction(["x1", "x2"], ["x1 * x2^2"])
+        scheduler = otbenchmark.EvaluationScheduler(maximumInFlight=2)
+        scheduledFunction = scheduler.wrapFunction(g)
+        # The exact gradient is kept
+        gradient = scheduledFunction.getGradient().getImplementation()
+        assert (
+            gradient.getClassName()
+            == g.getGradient().getImplementation().getClassName()
+        )
+        point = [1.5, 2.0]
+        np.testing.assert_allclose(
+            np.array(scheduledFunction.gradient(point)), np.array(g.gradient(point))
+        )
+        scheduler.close()
+
+    def test_ReliabilityBenchmarkMetaAlgorithm(self):
+        problem = otbenchmark.RminusSReliability()
+        g = problem.getEvent().getFunction()
+        problem.setExpensive(True)
+        assert problem.isExpensive()
+        scheduler = otbenchmark.EvaluationScheduler(maximumInFlight=4)
+        benchmark = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem, scheduler)
+        result = benchmark.runMonteCarlo(
+            maximumOuterSampling=10, coefficientOfVariation=0.0, blockSize=100
+        )
+        assert result.numberOfFunctionEvaluations == 1000
+        # The original function is evaluated by the scheduler
+        assert g.getEvaluationCallsNumber() == 1000
+        assert result.computedProbability > 0.0
+        scheduler.close()
+
+    def test_SensitivityBenchmarkMetaAlgorithm(self):
+        problem = otbenchmark.IshigamiSensitivity()
+        problem.setExpensive(True)
+        benchmark = otbenchmark.SensitivityBenchmarkMetaAlgorithm(problem)
+        assert benchmark.scheduler is not None
+        first_order, total_order = benchmark.runSamplingEstimator(100)
+        assert first_order.getDimension() == 3
+        assert total_order.getDimension() == 3
+        benchmark.scheduler.close()
+
+    def test_explicitScheduler(self):
+        # A given scheduler is used even if the problem is not expensive
+        problem = otbenchmark.RminusSReliability()
+        assert not problem.isExpensive()
+        scheduler = otbenchmark.EvaluationScheduler(maximumInFlight=2)
+        benchmark = otbenchmark.ReliabilityBenchmarkMetaAlgorithm(problem, scheduler)
+        assert benchmark.scheduler is scheduler
+        # The algorithms are run on a copy of the problem
+        assert benchmark.problem is not problem
+        result = benchmark.runMonteCarlo(
+            maximumOuterSampling=2, coefficientOfVariation=0.0, blockSize=100
+        )
+        assert result.numberOfFunctionEvaluations == 200
+        problem = otbenchmark.IshigamiSensitivity()
+        benchmark = otbenchmark.SensitivityBenchmarkMetaAlgorithm(problem, scheduler)
+        assert benchmark.scheduler is scheduler
+        assert benchmark.problem is not problem
+        first_order, _ = benchmark.runSamplingEstimator(100)
+        assert first_order.getDimension() == 3
+        scheduler.close()
+        # Without scheduler, a problem which is not expensive is not scheduled
+        benchmark = otbenchmark.SensitivityBenchmarkMetaAlgorithm(problem)
+        assert benchmark.scheduler is None
+
+
+if __name__ == "__main__":
+    unittest.main()
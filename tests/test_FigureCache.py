@@ -0,0 +1,135 @@
+# Copyright 2020 EDF.
+"""
+Test for FigureCache class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class CheckFigureCache(unittest.TestCase):
+    def test_render(self):
+        problem = otbenchmark.ReliabilityProblem8()
+        event = problem.getEvent()
+        g = event.getFunction()
+        distribution = event.getAntecedent().getDistribution()
+        referencePoint = distribution.getMean()
+        dimension = distribution.getDimension()
+        bounds = ot.Interval([0.0] * dimension, [100.0] * dimension)
+        crossCut = otbenchmark.CrossCutFunction(g, referencePoint)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = otbenchmark.FigureCache(directory)
+            name = problem.getName() + "-CrossCutFunction"
+            filename = cache.render(name, crossCut.draw, bounds, [10, 10])
+            assert os.path.exists(filename)
+            assert filename.endswith(".png")
+            assert cache.numberOfMisses == 1
+            # The same plot is not rendered again
+            numberOfCalls = g.getEvaluationCallsNumber()
+            filename2 = cache.render(name, crossCut.draw, bounds, [10, 10])
+            assert filename2 == filename
+            assert cache.numberOfHits == 1
+            assert g.getEvaluationCallsNumber() == numberOfCalls
+            # A new resolution is a new plot
+            filename3 = cache.render(name, crossCut.draw, bounds, [20, 20])
+            assert filename3 != filename
+            assert cache.numberOfMisses == 2
+            cache.clear()
+            assert len(os.listdir(directory)) == 0
+
+    def test_renderGraph(self):
+        distribution = ot.Normal(2)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = otbenchmark.FigureCache(directory, imageFormat="svg")
+            filename = cache.render("Normal-PDF", distribution.drawPDF)
+            assert os.path.exists(filename)
+            assert filename.endswith(".svg")
+
+    def test_computeKey(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = otbenchmark.FigureCache(directory)
+            drawEvent = otbenchmark.DrawEvent(
+                otbenchmark.ReliabilityProblem8().getEvent()
+            )
+            bounds = ot.Interval([0.0] * 2, [1.0] * 2)
+            key1 = cache.computeKey("RP8-draw", drawEvent.drawSample, bounds, 50)
+            key2 = cache.computeKey("RP8-draw", drawEvent.drawSample, bounds, 50)
+            assert key1 == key2
+            key3 = cache.computeKey(
+                "RP8-draw", drawEvent.drawSample, ot.Interval([0.0] * 2, [2.0] * 2), 50
+            )
+            assert key3 != key1
+            key4 = cache.computeKey("RP8-draw", drawEvent.drawSample, bounds, nX=50)
+            assert key4 != key1
+
+    def test_computeKeyLargeSample(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = otbenchmark.FigureCache(directory)
+            drawEvent = otbenchmark.DrawEvent(
+                otbenchmark.ReliabilityProblem8().getEvent()
+            )
+            sample1 = ot.Normal(2).getSample(1000)
+            sample2 = ot.Sample(sample1)
+            sample2[500, 0] += 1.0
+            # The repr() of the samples are equal, since they are truncated
+            key1 = cache.computeKey("RP8-draw", drawEvent.drawSample, sample1)
+            key2 = cache.computeKey("RP8-draw", drawEvent.drawSample, sample2)
+            assert key2 != key1
+            assert (
+                cache.computeKey("RP8-draw", drawEvent.drawSample, ot.Sample(sample1))
+                == key1
+            )
+            key3 = cache.computeKey(
+                "RP8-draw", drawEvent.drawSample, sample=np.array(sample1)
+            )
+            key4 = cache.computeKey(
+                "RP8-draw", drawEvent.drawSample, sample=np.array(sample2)
+            )
+            assert key4 != key3
+            point = ot.Point(np.ravel(sample1))
+            key5 = cache.computeKey("RP8-draw", drawEvent.drawSample, point)
+            point[500] += 1.0
+            assert cache.computeKey("RP8-draw", drawEvent.drawSample, point) != key5
+
+    def test_computeKeyDrawnObject(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = otbenchmark.FigureCache(directory)
+            # Two problems drawn under the same name
+            drawEvent8 = otbenchmark.DrawEvent(
+                otbenchmark.ReliabilityProblem8().getEvent()
+            )
+            drawEvent14 = otbenchmark.DrawEvent(
+                otbenchmark.ReliabilityProblem14().getEvent()
+            )
+            key8 = cache.computeKey("RP-drawSample", drawEvent8.drawSample, 500)
+            key14 = cache.computeKey("RP-drawSample", drawEvent14.drawSample, 500)
+            assert key14 != key8
+            # Another instance of the same problem has the same key
+            drawEvent = otbenchmark.DrawEvent(
+                otbenchmark.ReliabilityProblem8().getEvent()
+            )
+            assert cache.computeKey("RP-drawSample", drawEvent.drawSample, 500) == key8
+            # The drawing method is in the key
+            key = cache.computeKey("RP-drawSample", drawEvent8.drawSampleCrossCut, 500)
+            assert key != key8
+            # Two functions drawn under the same name
+            f1 = ot.SymbolicFunction(["x1", "x2"], ["x1 + x2"])
+            f2 = ot.SymbolicFunction(["x1", "x2"], ["x1 - x2"])
+            crossCut1 = otbenchmark.CrossCutFunction(f1, [0.0, 0.0])
+            crossCut2 = otbenchmark.CrossCutFunction(f2, [0.0, 0.0])
+            bounds = ot.Interval([-1.0] * 2, [1.0] * 2)
+            key1 = cache.computeKey("f-CrossCut", crossCut1.draw, bounds)
+            key2 = cache.computeKey("f-CrossCut", crossCut2.draw, bounds)
+            assert key2 != key1
+
+    def test_imageFormat(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                _ = otbenchmark.FigureCache(directory, imageFormat="gif")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright 2020 EDF.
+"""
+Test for GivenDataSensitivityAlgorithm class.
+"""
+import openturns as ot
+import otbenchmark as otb
+import unittest
+import numpy as np
+
+
+class CheckGivenDataSensitivityAlgorithm(unittest.TestCase):
+    def test_SobolEstimators(self):
+        problem = otb.IshigamiSensitivity()
+        distribution = problem.getInputDistribution()
+        model = problem.getFunction()
+        ot.RandomGenerator.SetSeed(0)
+        size = 10000
+        inputSample = distribution.getSample(size)
+        outputSample = model(inputSample)
+        exact_first_order = problem.getFirstOrderIndices()
+        atol = 5.0 / np.sqrt(size)
+        for estimator in ["Rank", "Binning"]:
+            sobolAlgorithm = otb.GivenDataSensitivityAlgorithm(
+                inputSample, outputSample, estimator
+            )
+            computed_first_order = sobolAlgorithm.getFirstOrderIndices()
+            print(estimator, computed_first_order)
+            np.testing.assert_allclose(
+                computed_first_order, exact_first_order, atol=atol
+            )
+
+    def test_Chatterjee(self):
+        distribution = ot.JointDistribution([ot.Uniform(-1.0, 1.0)] * 2)
+        # The first output is a function of X0 only,
+        # the second output does not depend on X1
+        model = ot.SymbolicFunction(["x0", "x1"], ["sin(3 * x0)", "x0^2"])
+        ot.RandomGenerator.SetSeed(0)
+        size = 10000
+        inputSample = distribution.getSample(size)
+        outputSample = model(inputSample)
+        sobolAlgorithm = otb.GivenDataSensitivityAlgorithm(
+            inputSample, outputSample, "Chatterjee"
+        )
+        atol = 5.0 / np.sqrt(size)
+        for marginalIndex in range(2):
+            computed = sobolAlgorithm.getFirstOrderIndices(marginalIndex)
+            print(computed)
+            np.testing.assert_allclose(computed, [1.0, 0.0], atol=atol)
+
+    def test_MetaAlgorithm(self):
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        distribution = problem.getInputDistribution()
+        model = problem.getFunction()
+        ot.RandomGenerator.SetSeed(0)
+        size = 10000
+        inputSample = distribution.getSample(size)
+        outputSample = model(inputSample)
+        # Reuse the sample: no new function evaluation
+        initial_calls = model.getEvaluationCallsNumber()
+        computed_first_order = metaSAAlgorithm.runGivenDataEstimator(
+            estimator="Binning", inputSample=inputSample, outputSample=outputSample
+        )
+        assert model.getEvaluationCallsNumber() == initial_calls
+        atol = 5.0 / np.sqrt(size)
+        np.testing.assert_allclose(
+            computed_first_order, problem.getFirstOrderIndices(), atol=atol
+        )
+        # Generate a new sample
+        computed_first_order = metaSAAlgorithm.runGivenDataEstimator(size)
+        assert model.getEvaluationCallsNumber() == initial_calls + size
+        np.testing.assert_allclose(
+            computed_first_order, problem.getFirstOrderIndices(), atol=atol
+        )
+        with self.assertRaises(ValueError):
+            metaSAAlgorithm.runGivenDataEstimator(size, estimator="Foo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 """
 Test for JanonSensitivityAlgorithm class.
 """
+
 import openturns as ot
 import otbenchmark as otb
 import unittest
@@ -45,6 +46,93 @@ class CheckJanonSensitivityAlgorithm(unittest.TestCase):
         np.testing.assert_allclose(computed_first_order, exact_first_order, atol=atol)
         np.testing.assert_allclose(computed_total_order, exact_total_order, atol=atol)
 
+    def test_JanonSensitivityAlgorithmMultipleOutputs(self):
+        problem = otb.IshigamiSensitivity()
+        distribution = problem.getInputDistribution()
+        ishigami = problem.getFunction()
+        # The second output only depends on X0
+        identity = ot.SymbolicFunction(["x0", "x1", "x2"], ["x0"])
+        model = ot.AggregatedFunction([ishigami, identity])
+
+        ot.RandomGenerator.SetSeed(0)
+        size = 10000
+        inputDesign = ot.SobolIndicesExperiment(distribution, size, True).generate()
+        outputDesign = model(inputDesign)
+        sobolAlgorithm = otb.JanonSensitivityAlgorithm(inputDesign, outputDesign, size)
+        atol = 10.0 / np.sqrt(size)
+        # First output: Ishigami
+        np.testing.assert_allclose(
+            sobolAlgorithm.getFirstOrderIndices(0),
+            problem.getFirstOrderIndices(),
+            atol=atol,
+        )
+        np.testing.assert_allclose(
+            sobolAlgorithm.getTotalOrderIndices(0),
+            problem.getTotalOrderIndices(),
+            atol=atol,
+        )
+        # Second output: X0
+        np.testing.assert_allclose(
+            sobolAlgorithm.getFirstOrderIndices(1), [1.0, 0.0, 0.0], atol=atol
+        )
+        np.testing.assert_allclose(
+            sobolAlgorithm.getTotalOrderIndices(1), [1.0, 0.0, 0.0], atol=atol
+        )
+        # Aggregated indices are between the indices of each output
+        aggregated_first_order = sobolAlgorithm.getAggregatedFirstOrderIndices()
+        aggregated_total_order = sobolAlgorithm.getAggregatedTotalOrderIndices()
+        first_order_0 = sobolAlgorithm.getFirstOrderIndices(0)
+        first_order_1 = sobolAlgorithm.getFirstOrderIndices(1)
+        total_order_0 = sobolAlgorithm.getTotalOrderIndices(0)
+        total_order_1 = sobolAlgorithm.getTotalOrderIndices(1)
+        for i in range(3):
+            assert min(first_order_0[i], first_order_1[i]) <= aggregated_first_order[i]
+            assert aggregated_first_order[i] <= max(first_order_0[i], first_order_1[i])
+            assert min(total_order_0[i], total_order_1[i]) <= aggregated_total_order[i]
+            assert aggregated_total_order[i] <= max(total_order_0[i], total_order_1[i])
+        with self.assertRaises(ValueError):
+            sobolAlgorithm.getFirstOrderIndices(2)
+
+    def test_JanonSensitivityAlgorithmInterval(self):
+        problem = otb.IshigamiSensitivity()
+        distribution = problem.getInputDistribution()
+        model = problem.getFunction()
+
+        ot.RandomGenerator.SetSeed(0)
+        size = 1000
+        inputDesign = ot.SobolIndicesExperiment(distribution, size, True).generate()
+        outputDesign = model(inputDesign)
+        sobolAlgorithm = otb.JanonSensitivityAlgorithm(inputDesign, outputDesign, size)
+        sobolAlgorithm.setBootstrapSize(200)
+        sobolAlgorithm.setConfidenceLevel(0.95)
+        assert sobolAlgorithm.getBootstrapSize() == 200
+        assert sobolAlgorithm.getConfidenceLevel() == 0.95
+        first_order = sobolAlgorithm.getFirstOrderIndices()
+        total_order = sobolAlgorithm.getTotalOrderIndices()
+        first_order_interval = sobolAlgorithm.getFirstOrderIndicesInterval()
+        total_order_interval = sobolAlgorithm.getTotalOrderIndicesInterval()
+        print("First order interval = ", first_order_interval)
+        print("Total order interval = ", total_order_interval)
+        assert first_order_interval.getDimension() == 3
+        # With one single output, the aggregated interval is the marginal one
+        np.testing.assert_allclose(
+            first_order_interval.getLowerBound(),
+            sobolAlgorithm.getFirstOrderIndicesInterval(0).getLowerBound(),
+        )
+        # The intervals contain the estimates
+        for i in range(3):
+            lower = first_order_interval.getLowerBound()[i]
+            upper = first_order_interval.getUpperBound()[i]
+            assert lower <= first_order[i] <= upper
+            lower = total_order_interval.getLowerBound()[i]
+            upper = total_order_interval.getUpperBound()[i]
+            assert lower <= total_order[i] <= upper
+        # Compare the width with a 1/sqrt(n) rate
+        width = np.array(first_order_interval.getUpperBound()) - np.array(
+            first_order_interval.getLowerBound()
+        )
+        assert np.all(width < 10.0 / np.sqrt(size))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+# Copyright 2020 EDF.
+"""
+Test for PerformanceProfile class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import unittest
+
+
+class CheckPerformanceProfile(unittest.TestCase):
+    def setUp(self):
+        # 3 problems, 2 methods, 1 repetition
+        self.costs = np.array([[[10.0], [20.0]], [[40.0], [20.0]], [[10.0], [5.0]]])
+        self.digits = np.array([[[3.0], [3.0]], [[3.0], [3.0]], [[0.5], [3.0]]])
+
+    def test_performanceProfile(self):
+        profile = otbenchmark.PerformanceProfile(
+            self.costs, self.digits, 1.0, ["A", "B"]
+        )
+        taus = [1.0, 2.0, 4.0]
+        expected = np.array([[1.0, 2.0, 2.0], [2.0, 3.0, 3.0]]) / 3.0
+        np.testing.assert_allclose(profile.computePerformanceProfile(taus), expected)
+
+    def test_dataProfile(self):
+        profile = otbenchmark.PerformanceProfile(self.costs, self.digits)
+        alphas = [5.0, 10.0, 40.0]
+        expected = np.array([[0.0, 1.0, 2.0], [1.0, 1.0, 3.0]]) / 3.0
+        np.testing.assert_allclose(profile.computeDataProfile(alphas), expected)
+        # Normalize by the dimension plus one
+        normalization = [2.0, 4.0, 1.0]
+        expected = np.array([[1.0, 2.0, 2.0], [2.0, 3.0, 3.0]]) / 3.0
+        np.testing.assert_allclose(
+            profile.computeDataProfile(alphas, normalization), expected
+        )
+
+    def test_bootstrapBands(self):
+        ot.RandomGenerator.SetSeed(0)
+        costs = np.array(ot.Uniform(1.0, 10.0).getSample(20 * 3 * 2)).reshape(20, 3, 2)
+        digits = np.array(ot.Uniform(0.0, 2.0).getSample(20 * 3 * 2)).reshape(20, 3, 2)
+        profile = otbenchmark.PerformanceProfile(costs, digits)
+        taus = [1.0, 2.0, 4.0, 8.0]
+        expected = profile.computePerformanceProfile(taus)
+        lowerBand, upperBand = profile.computeBootstrapBands(taus)
+        assert lowerBand.shape == (3, 4)
+        assert np.all(lowerBand <= expected + 1.0e-12)
+        assert np.all(expected <= upperBand + 1.0e-12)
+        alphas = [1.0, 5.0, 10.0]
+        expected = profile.computeDataProfile(alphas)
+        lowerBand, upperBand = profile.computeBootstrapBands(alphas, "Data")
+        assert np.all(lowerBand <= expected + 1.0e-12)
+        assert np.all(expected <= upperBand + 1.0e-12)
+
+    def test_fromRecords(self):
+        records = [
+            {"problem": "P1", "method": "A", "seed": 0, "time": 1.0, "digits": 2.0},
+            {"problem": "P1", "method": "B", "seed": 0, "time": 2.0, "digits": 2.0},
+            {"problem": "P2", "method": "A", "seed": 0, "time": 1.0, "digits": 0.0},
+        ]
+        profile = otbenchmark.PerformanceProfile.FromRecords(
+            records, cost="time", accuracy="digits"
+        )
+        assert profile.methodNames == ["A", "B"]
+        assert profile.problemNames == ["P1", "P2"]
+        expected = np.array([[0.5, 0.5], [0.0, 0.5]])
+        np.testing.assert_allclose(
+            profile.computePerformanceProfile([1.0, 2.0]), expected
+        )
+        graph = profile.drawPerformanceProfile([1.0, 2.0], numberOfBootstraps=10)
+        assert graph.getDrawables().getSize() == 6
+        graph = profile.drawDataProfile([1.0, 2.0])
+        assert graph.getDrawables().getSize() == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
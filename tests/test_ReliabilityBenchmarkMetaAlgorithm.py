@@ -34,6 +34,27 @@ class CheckReliabilityBenchmarkMetaAlgorithm(unittest.TestCase):
         benchmarkResult = metaAlgorithm.runSubsetSampling()
         print(benchmarkResult.summary())
 
+    def test_runTargetAccuracy(self):
+        problem = otb.ReliabilityProblem8()
+        metaAlgorithm = otb.ReliabilityBenchmarkMetaAlgorithm(problem)
+        for method in otb.ReliabilityBenchmarkMetaAlgorithm.GetTargetAccuracyMethods():
+            ot.RandomGenerator.SetSeed(0)
+            benchmarkResult = metaAlgorithm.runTargetAccuracy(
+                method, 1.0, maximumOuterSampling=2000, blockSize=1000
+            )
+            assert benchmarkResult.isTargetReached
+            assert benchmarkResult.numberOfCorrectDigits >= 1.0
+            assert benchmarkResult.elapsedTime > 0.0
+        # The maximum number of outer iterations is reached
+        ot.RandomGenerator.SetSeed(0)
+        benchmarkResult = metaAlgorithm.runTargetAccuracy(
+            "MonteCarlo", 3.0, maximumOuterSampling=5, blockSize=10
+        )
+        assert not benchmarkResult.isTargetReached
+        assert benchmarkResult.numberOfFunctionEvaluations == 50
+        with self.assertRaises(ValueError):
+            metaAlgorithm.runTargetAccuracy("SubsetSampling", 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+# Copyright 2020 EDF.
+"""
+Test for ReliabilityMethodBenchmark class.
+"""
+import otbenchmark
+import os
+import tempfile
+import unittest
+
+
+class CheckReliabilityMethodBenchmark(unittest.TestCase):
+    def test_run(self):
+        problems = [otbenchmark.RminusSReliability()]
+        benchmark = otbenchmark.ReliabilityMethodBenchmark(
+            problems, maximumOuterSampling=10, blockSize=10
+        )
+        records = benchmark.run()
+        assert len(records) == len(otbenchmark.ReliabilityMethodBenchmark.GetMethods())
+        for record in records:
+            assert record["problem"] == "R-S"
+            assert record["time"] > 0.0
+            assert record["numberOfFunctionEvaluations"] > 0
+        # The same seed gives the same probabilities
+        otherRecords = benchmark.run()
+        for record, otherRecord in zip(records, otherRecords):
+            assert record["computedProbability"] == otherRecord["computedProbability"]
+
+    def test_saveLoadCompare(self):
+        problems = [otbenchmark.RminusSReliability()]
+        benchmark = otbenchmark.ReliabilityMethodBenchmark(
+            problems, methods=["FORM", "MonteCarlo"], maximumOuterSampling=10
+        )
+        records = benchmark.run()
+        with tempfile.TemporaryDirectory() as directory:
+            for extension in [".json", ".csv"]:
+                filename = os.path.join(directory, "methods" + extension)
+                benchmark.save(filename)
+                baseline = otbenchmark.ReliabilityMethodBenchmark.Load(filename)
+                assert baseline == records
+        regressions = otbenchmark.ReliabilityMethodBenchmark.Compare(
+            records, baseline, timeThreshold=1.0e9
+        )
+        assert len(regressions) == 0
+        report = otbenchmark.ReliabilityMethodBenchmark.FormatReport(regressions)
+        assert report == "No regression"
+        # A baseline with more digits and less calls
+        for record in baseline:
+            record["numberOfCorrectDigits"] += 1.0
+            record["numberOfFunctionEvaluations"] //= 2
+        regressions = otbenchmark.ReliabilityMethodBenchmark.Compare(
+            records, baseline, timeThreshold=1.0e9
+        )
+        assert len(regressions) == 4
+        report = otbenchmark.ReliabilityMethodBenchmark.FormatReport(regressions)
+        assert report.startswith("4 regression(s)")
+
+    def test_unknownMethod(self):
+        with self.assertRaises(ValueError):
+            otbenchmark.ReliabilityMethodBenchmark(methods=["Unknown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
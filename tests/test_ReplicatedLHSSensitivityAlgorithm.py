@@ -0,0 +1,85 @@
+# Copyright 2020 EDF.
+"""
+Test for ReplicatedLHSSensitivityAlgorithm class.
+"""
+import openturns as ot
+import otbenchmark as otb
+import unittest
+import numpy as np
+
+
+class CheckReplicatedLHSSensitivityAlgorithm(unittest.TestCase):
+    def test_Generate(self):
+        problem = otb.IshigamiSensitivity()
+        distribution = problem.getInputDistribution()
+        ot.RandomGenerator.SetSeed(0)
+        size = 100
+        inputDesign = otb.ReplicatedLHSSensitivityAlgorithm.Generate(distribution, size)
+        assert inputDesign.getSize() == 2 * size
+        assert inputDesign.getDimension() == 3
+        # Each column of B is a permutation of the column of A
+        sampleA = np.array(inputDesign[:size])
+        sampleB = np.array(inputDesign[size:])
+        np.testing.assert_array_equal(
+            np.sort(sampleA, axis=0), np.sort(sampleB, axis=0)
+        )
+        # Each stratum of each column contains one single point
+        uniformA = np.array(
+            [
+                distribution.getMarginal(j).computeCDF(inputDesign[:size, j])
+                for j in range(3)
+            ]
+        )[:, :, 0]
+        strata = np.sort(np.floor(uniformA * size), axis=1)
+        for j in range(3):
+            np.testing.assert_array_equal(strata[j], np.arange(size))
+
+    def test_ReplicatedLHSSensitivityAlgorithm(self):
+        problem = otb.IshigamiSensitivity()
+        print(problem)
+        distribution = problem.getInputDistribution()
+        model = problem.getFunction()
+
+        # Create X/Y data
+        ot.RandomGenerator.SetSeed(0)
+        size = 10000
+        inputDesign = otb.ReplicatedLHSSensitivityAlgorithm.Generate(distribution, size)
+        outputDesign = model(inputDesign)
+
+        # Compute first order indices using replicated LHS
+        sobolAlgorithm = otb.ReplicatedLHSSensitivityAlgorithm(
+            inputDesign, outputDesign, size
+        )
+        computed_first_order = sobolAlgorithm.getFirstOrderIndices()
+        exact_first_order = problem.getFirstOrderIndices()
+        print("Computed first order = ", computed_first_order)
+        print("Exact first order = ", exact_first_order)
+        atol = 10.0 / np.sqrt(size)
+        np.testing.assert_allclose(computed_first_order, exact_first_order, atol=atol)
+        np.testing.assert_allclose(
+            sobolAlgorithm.getAggregatedFirstOrderIndices(), computed_first_order
+        )
+
+    def test_MetaAlgorithm(self):
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        ot.RandomGenerator.SetSeed(0)
+        sample_size = 10000
+        model = problem.getFunction()
+        initial_calls = model.getEvaluationCallsNumber()
+        (
+            computed_first_order,
+            computed_total_order,
+        ) = metaSAAlgorithm.runSamplingEstimator(sample_size, estimator="ReplicatedLHS")
+        # The cost does not depend on the dimension
+        calls = model.getEvaluationCallsNumber() - initial_calls
+        assert calls == 2 * sample_size
+        atol = 10.0 / np.sqrt(sample_size)
+        np.testing.assert_allclose(
+            computed_first_order, problem.getFirstOrderIndices(), atol=atol
+        )
+        assert np.all(np.isnan(computed_total_order))
+
+
+if __name__ == "__main__":
+    unittest.main()
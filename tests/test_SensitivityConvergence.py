@@ -6,6 +6,8 @@ import unittest
 import openturns.viewer as otv
 import openturns as ot
 import numpy as np
+import os
+import tempfile
 
 
 class CheckSensitivityConvergence(unittest.TestCase):
@@ -67,6 +69,33 @@ class CheckSensitivityConvergence(unittest.TestCase):
         ) = benchmark.computeSobolSample()
         print(total_order_table)
 
+    def test_computeSobolSampleTable(self):
+        ot.Log.Show(ot.Log.NONE)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        benchmark = otb.SensitivityConvergence(
+            problem,
+            metaSAAlgorithm,
+            numberOfExperiments=3,
+            numberOfRepetitions=4,
+            maximum_elapsed_time=5.0,
+            sample_size_initial=20,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            table = otb.ColumnarTable(os.path.join(directory, "convergence"))
+            (
+                sample_size_table,
+                first_order_table,
+                total_order_table,
+            ) = benchmark.computeSobolSample(table=table)
+            # The table is read again from the directory
+            table = otb.ColumnarTable(os.path.join(directory, "convergence"))
+            assert table.getNumberOfRows() == 12
+            columns = table.load()
+            np.testing.assert_array_equal(columns["sampleSize"], sample_size_table)
+            np.testing.assert_array_equal(columns["first"], first_order_table)
+            np.testing.assert_array_equal(columns["total"], total_order_table)
+
     def test_plotConvergenceCurveSampling(self):
         ot.Log.Show(ot.Log.NONE)
         problem = otb.IshigamiSensitivity()
@@ -103,6 +132,29 @@ class CheckSensitivityConvergence(unittest.TestCase):
         graph.setLegendPosition("bottomleft")
         otv.View(graph)
 
+    def test_plotConvergenceReplicatedLHS(self):
+        ot.Log.Show(ot.Log.NONE)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        benchmark = otb.SensitivityConvergence(
+            problem,
+            metaSAAlgorithm,
+            numberOfExperiments=4,
+            numberOfRepetitions=2,
+            maximum_elapsed_time=1.0,
+            sample_size_initial=20,
+            estimator="ReplicatedLHS",
+        )
+        sample_size = 40000
+        first_order_AE, total_order_AE = benchmark.computeError(sample_size)
+        atol = 1.0e1 / np.sqrt(sample_size)
+        np.testing.assert_allclose(ot.Point(3), first_order_AE, atol=atol)
+        assert np.all(np.isnan(total_order_AE))
+        grid = benchmark.plotConvergenceGrid()
+        assert grid.getNbRows() == 1
+        graph = benchmark.plotConvergenceCurve()
+        otv.View(graph)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,9 @@ import otbenchmark as otb
 import unittest
 import openturns.viewer as otv
 import openturns as ot
+import numpy as np
+import os
+import tempfile
 
 
 class CheckSensitivityDistribution(unittest.TestCase):
@@ -13,11 +16,133 @@ class CheckSensitivityDistribution(unittest.TestCase):
         problem = otb.IshigamiSensitivity()
         metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
         benchmark = otb.SensitivityDistribution(
-            problem, metaSAAlgorithm, sampleSize=500, numberOfRepetitions=50,
+            problem,
+            metaSAAlgorithm,
+            sampleSize=500,
+            numberOfRepetitions=50,
         )
         grid = benchmark.draw()
         otv.View(grid)
 
+    def test_resampling(self):
+        ot.Log.Show(ot.Log.NONE)
+        ot.RandomGenerator.SetSeed(0)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        sampleSize = 500
+        numberOfRepetitions = 50
+        dimension = problem.getInputDistribution().getDimension()
+        for resampling_method, design_size in [
+            ("Bootstrap", sampleSize),
+            ("Subsample", 2 * sampleSize),
+        ]:
+            benchmark = otb.SensitivityDistribution(
+                problem,
+                metaSAAlgorithm,
+                sampleSize=sampleSize,
+                numberOfRepetitions=numberOfRepetitions,
+                resampling_method=resampling_method,
+            )
+            function = problem.getFunction()
+            initial_calls = function.getEvaluationCallsNumber()
+            (
+                sampleFirst,
+                sampleTotal,
+                distributionFirst,
+                distributionTotal,
+            ) = benchmark.compute_sample_indices()
+            calls = function.getEvaluationCallsNumber() - initial_calls
+            assert calls == (dimension + 2) * design_size
+            assert sampleFirst.getSize() == numberOfRepetitions
+            assert sampleTotal.getDimension() == dimension
+            # Compare the sample and asymptotic standard deviations
+            sample_std = sampleFirst.computeStandardDeviation()
+            for i in range(dimension):
+                computed_std = distributionFirst.getMarginal(i).getStandardDeviation()[
+                    0
+                ]
+                assert sample_std[i] < 3.0 * computed_std
+                assert sample_std[i] > computed_std / 3.0
+        with self.assertRaises(ValueError):
+            otb.SensitivityDistribution(
+                problem, metaSAAlgorithm, sampleSize, resampling_method="Foo"
+            )
+
+    def test_subsampleSpread(self):
+        # The subsample spread is the spread of the estimator of size m
+        ot.Log.Show(ot.Log.NONE)
+        ot.RandomGenerator.SetSeed(0)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        benchmark = otb.SensitivityDistribution(
+            problem,
+            metaSAAlgorithm,
+            sampleSize=500,
+            numberOfRepetitions=200,
+            resampling_method="Subsample",
+        )
+        sampleFirst, _, distributionFirst, _ = benchmark.compute_sample_indices()
+        sample_std = sampleFirst.computeStandardDeviation()
+        for i in range(sampleFirst.getDimension()):
+            computed_std = distributionFirst.getMarginal(i).getStandardDeviation()[0]
+            assert sample_std[i] > 0.6 * computed_std
+            assert sample_std[i] < 1.5 * computed_std
+
+    def test_resampledDistribution(self):
+        # The distribution is computed on the design, which is not resampled
+        ot.Log.Show(ot.Log.NONE)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        sampleSize = 200
+        benchmark = otb.SensitivityDistribution(
+            problem,
+            metaSAAlgorithm,
+            sampleSize=sampleSize,
+            numberOfRepetitions=10,
+            resampling_method="Bootstrap",
+        )
+        ot.RandomGenerator.SetSeed(0)
+        _, _, distributionFirst, distributionTotal = benchmark.compute_sample_indices()
+        ot.RandomGenerator.SetSeed(0)
+        distribution = problem.getInputDistribution()
+        inputDesign = ot.SobolIndicesExperiment(distribution, sampleSize).generate()
+        outputDesign = problem.getFunction()(inputDesign)
+        sobolAlgorithm = ot.SaltelliSensitivityAlgorithm(
+            inputDesign, outputDesign, sampleSize
+        )
+        np.testing.assert_allclose(
+            distributionFirst.getMean(),
+            sobolAlgorithm.getFirstOrderIndicesDistribution().getMean(),
+        )
+        np.testing.assert_allclose(
+            distributionTotal.getMean(),
+            sobolAlgorithm.getTotalOrderIndicesDistribution().getMean(),
+        )
+
+    def test_table(self):
+        ot.Log.Show(ot.Log.NONE)
+        problem = otb.IshigamiSensitivity()
+        metaSAAlgorithm = otb.SensitivityBenchmarkMetaAlgorithm(problem)
+        with tempfile.TemporaryDirectory() as directory:
+            for resampling_method in ["Repeat", "Bootstrap"]:
+                table = otb.ColumnarTable(os.path.join(directory, resampling_method))
+                benchmark = otb.SensitivityDistribution(
+                    problem,
+                    metaSAAlgorithm,
+                    sampleSize=100,
+                    numberOfRepetitions=5,
+                    resampling_method=resampling_method,
+                )
+                sampleFirst, sampleTotal, _, _ = benchmark.compute_sample_indices(
+                    table=table
+                )
+                # The table is read again from the directory
+                columns = otb.ColumnarTable(
+                    os.path.join(directory, resampling_method)
+                ).load()
+                np.testing.assert_array_equal(columns["first"], sampleFirst)
+                np.testing.assert_array_equal(columns["total"], sampleTotal)
+
 
 if __name__ == "__main__":
     unittest.main()
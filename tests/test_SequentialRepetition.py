@@ -0,0 +1,144 @@
+# Copyright 2020 EDF.
+"""
+Test for SequentialRepetition class.
+"""
+import otbenchmark
+import openturns as ot
+import numpy as np
+import unittest
+
+
+class NormalRun:
+    def __init__(self, mean, standardDeviation):
+        self.mean = mean
+        self.standardDeviation = standardDeviation
+        self.seeds = []
+
+    def __call__(self, seed):
+        self.seeds.append(seed)
+        ot.RandomGenerator.SetSeed(seed)
+        return ot.Normal(self.mean, self.standardDeviation).getRealization()[0]
+
+
+class CheckSequentialRepetition(unittest.TestCase):
+    def test_HalfWidth(self):
+        run = NormalRun(0.0, 1.0)
+        driver = otbenchmark.SequentialRepetition(
+            {"Normal": run},
+            targetHalfWidth=0.5,
+            batchSize=4,
+            maximumNumberOfRepetitions=1000,
+            initialSeed=10,
+        )
+        results = driver.run()
+        result = results["Normal"]
+        assert result["stoppingReason"] == "HalfWidth"
+        assert result["halfWidth"] <= 0.5
+        assert result["numberOfRepetitions"] % 4 == 0
+        assert result["numberOfRepetitions"] == len(result["values"])
+        assert run.seeds == list(range(10, 10 + result["numberOfRepetitions"]))
+        np.testing.assert_allclose(result["mean"], np.mean(result["values"]))
+
+    def test_Ranking(self):
+        # The ranking of distant methods is resolved after the first batch
+        runRepetitions = {
+            "Low": NormalRun(0.0, 1.0),
+            "High": NormalRun(100.0, 1.0),
+        }
+        driver = otbenchmark.SequentialRepetition(
+            runRepetitions, targetHalfWidth=1.0e-3, batchSize=4
+        )
+        results = driver.run()
+        for name in runRepetitions:
+            assert results[name]["stoppingReason"] == "Ranking"
+            assert results[name]["numberOfRepetitions"] == 4
+
+    def test_MaximumNumberOfRepetitions(self):
+        driver = otbenchmark.SequentialRepetition(
+            {"Normal": NormalRun(0.0, 1.0)},
+            targetHalfWidth=1.0e-6,
+            batchSize=3,
+            maximumNumberOfRepetitions=9,
+        )
+        results = driver.run()
+        assert results["Normal"]["stoppingReason"] == "MaximumNumberOfRepetitions"
+        assert results["Normal"]["numberOfRepetitions"] == 9
+
+    def test_computeConfidenceInterval(self):
+        driver = otbenchmark.SequentialRepetition({}, confidenceLevel=0.95)
+        mean, halfWidth = driver.computeConfidenceInterval([1.0, 2.0, 3.0])
+        np.testing.assert_allclose(mean, 2.0)
+        # The 0.975 quantile of the Student distribution with 2 d.o.f.
+        np.testing.assert_allclose(halfWidth, 4.302653 / np.sqrt(3.0), rtol=1.0e-6)
+
+    def test_ReliabilityRepetition(self):
+        problem = otbenchmark.ReliabilityProblem8()
+        runRepetitions = {
+            method: otbenchmark.SequentialRepetition.ReliabilityRepetition(
+                problem, method, maximumOuterSampling=10, blockSize=100
+            )
+            for method in ["MonteCarlo", "LHS"]
+        }
+        driver = otbenchmark.SequentialRepetition(
+            runRepetitions,
+            targetHalfWidth=10.0,
+            batchSize=2,
+            numberOfWorkers=2,
+        )
+        results = driver.run()
+        # Same result in parallel and in the current process
+        for name in runRepetitions:
+            assert results[name]["numberOfRepetitions"] == 2
+            for k in range(2):
+                value = runRepetitions[name](k)
+                np.testing.assert_allclose(results[name]["values"][k], value)
+
+    def test_unpicklableProblem(self):
+        # RP25 cannot be pickled: the workers are forked
+        problem = otbenchmark.ReliabilityProblem25()
+        runRepetitions = {
+            "MonteCarlo": otbenchmark.SequentialRepetition.ReliabilityRepetition(
+                problem, "MonteCarlo", maximumOuterSampling=10, blockSize=10
+            )
+        }
+        driver = otbenchmark.SequentialRepetition(
+            runRepetitions,
+            # The metric may be constant: the target is never reached
+            targetHalfWidth=-1.0,
+            batchSize=2,
+            maximumNumberOfRepetitions=4,
+            numberOfWorkers=2,
+        )
+        results = driver.run()
+        # Two batches are run by the same pool
+        assert results["MonteCarlo"]["numberOfRepetitions"] == 4
+        assert results["MonteCarlo"]["stoppingReason"] == "MaximumNumberOfRepetitions"
+        value = runRepetitions["MonteCarlo"](3)
+        np.testing.assert_allclose(results["MonteCarlo"]["values"][3], value)
+
+    def test_SensitivityRepetition(self):
+        problem = otbenchmark.IshigamiSensitivity()
+        runRepetition = otbenchmark.SequentialRepetition.SensitivityRepetition(
+            problem, 500, metric="numberOfCorrectDigits"
+        )
+        driver = otbenchmark.SequentialRepetition(
+            {"Saltelli": runRepetition}, targetHalfWidth=1.0, batchSize=2
+        )
+        results = driver.run()
+        assert results["Saltelli"]["mean"] > 0.5
+        with self.assertRaises(ValueError):
+            otbenchmark.SequentialRepetition.SensitivityRepetition(
+                problem, 500, metric="relativeError"
+            )
+
+    def test_badBatchSize(self):
+        with self.assertRaises(ValueError):
+            otbenchmark.SequentialRepetition({}, batchSize=1)
+        with self.assertRaises(ValueError):
+            otbenchmark.SequentialRepetition(
+                {}, batchSize=4, maximumNumberOfRepetitions=2
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Copyright 2020 EDF.
+"""
+Test for SparsePolynomialChaosSensitivityAnalysis class.
+"""
+import openturns as ot
+import otbenchmark as otb
+import unittest
+import numpy as np
+
+
+class CheckSparsePolynomialChaosSensitivityAnalysis(unittest.TestCase):
+    def test_run(self):
+        ot.RandomGenerator.SetSeed(0)
+        problem = otb.IshigamiSensitivity()
+        sparse_sa = otb.SparsePolynomialChaosSensitivityAnalysis(
+            problem,
+            sample_size_train=400,
+            sample_size_test=100,
+            total_degree=10,
+            hyperbolic_quasinorm=1.0,
+        )
+        result = sparse_sa.run()
+        print(result.first_order_indices, result.total_order_indices)
+        assert result.predictivity_coefficient > 0.99
+        atol = 1.0e-2
+        np.testing.assert_allclose(
+            result.first_order_indices, problem.getFirstOrderIndices(), atol=atol
+        )
+        np.testing.assert_allclose(
+            result.total_order_indices, problem.getTotalOrderIndices(), atol=atol
+        )
+
+    def test_Context(self):
+        problem = otb.IshigamiSensitivity()
+        distribution = problem.getInputDistribution()
+        model = problem.getFunction()
+        context = otb.SparsePolynomialChaosContext(distribution, 4, 0.5)
+        assert (
+            context.basisSize == context.enumerateFunction.getStrataCumulatedCardinal(4)
+        )
+        # Growing the sample only evaluates the new points
+        sequence = ot.SobolSequence(3)
+        inputSample = ot.LowDiscrepancyExperiment(sequence, distribution, 50).generate()
+        initial_calls = model.getEvaluationCallsNumber()
+        outputSample = context.evaluate(model, inputSample)
+        largerSample = ot.LowDiscrepancyExperiment(
+            sequence, distribution, 100
+        ).generate()
+        largerOutput = context.evaluate(model, largerSample)
+        assert model.getEvaluationCallsNumber() - initial_calls == 100
+        np.testing.assert_array_equal(outputSample, largerOutput[:50])
+        np.testing.assert_allclose(largerOutput, model(largerSample))
+        # Another model replaces the cache
+        otherModel = otb.GSobolSensitivity(a=[0.0, 1.0, 2.0]).getFunction()
+        np.testing.assert_allclose(
+            context.evaluate(otherModel, inputSample), otherModel(inputSample)
+        )
+
+    def test_sharedContext(self):
+        # The context does not change the result
+        problem = otb.IshigamiSensitivity()
+        context = otb.SparsePolynomialChaosContext(
+            problem.getInputDistribution(), 6, 0.5
+        )
+        for sample_size_train in [50, 100, 200]:
+            results = []
+            for sharedContext in [None, context]:
+                ot.RandomGenerator.SetSeed(0)
+                sparse_sa = otb.SparsePolynomialChaosSensitivityAnalysis(
+                    problem,
+                    sample_size_train=sample_size_train,
+                    total_degree=6,
+                    context=sharedContext,
+                )
+                results.append(sparse_sa.run())
+            assert (
+                results[0].predictivity_coefficient
+                == results[1].predictivity_coefficient
+            )
+            np.testing.assert_array_equal(
+                results[0].first_order_indices, results[1].first_order_indices
+            )
+            np.testing.assert_array_equal(
+                results[0].total_order_indices, results[1].total_order_indices
+            )
+
+    def test_contextMismatch(self):
+        problem = otb.IshigamiSensitivity()
+        context = otb.SparsePolynomialChaosContext(
+            problem.getInputDistribution(), 5, 0.5
+        )
+        # Another total degree
+        with self.assertRaises(ValueError):
+            _ = otb.SparsePolynomialChaosSensitivityAnalysis(
+                problem, total_degree=8, context=context
+            )
+        # Another quasi-norm
+        with self.assertRaises(ValueError):
+            _ = otb.SparsePolynomialChaosSensitivityAnalysis(
+                problem, total_degree=5, hyperbolic_quasinorm=1.0, context=context
+            )
+        # Another distribution
+        otherProblem = otb.GSobolSensitivity()
+        with self.assertRaises(ValueError):
+            _ = otb.SparsePolynomialChaosSensitivityAnalysis(
+                otherProblem, total_degree=5, context=context
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# Copyright 2020 EDF.
+"""
+Test for ThroughputBenchmark class.
+"""
+import otbenchmark
+import os
+import tempfile
+import unittest
+
+
+class CheckThroughputBenchmark(unittest.TestCase):
+    def test_run(self):
+        problems = [
+            otbenchmark.ReliabilityProblem8(),
+            otbenchmark.IshigamiSensitivity(),
+        ]
+        benchmark = otbenchmark.ThroughputBenchmark(
+            problems, batchSizes=[1, 10], minimumTime=0.01
+        )
+        records = benchmark.run()
+        # One construction and two paths with two batch sizes per problem
+        assert len(records) == 10
+        for record in records:
+            if record["path"] == "Construction":
+                assert record["pythonMemory"] > 0
+            else:
+                assert record["evaluationsPerSecond"] > 0.0
+        names = set([record["problem"] for record in records])
+        assert names == set(["RP8", "Ishigami"])
+
+    def test_maximumTime(self):
+        problems = [otbenchmark.ReliabilityProblem8()]
+        benchmark = otbenchmark.ThroughputBenchmark(
+            problems, batchSizes=[1, 10, 100], minimumTime=0.0, maximumTime=0.0
+        )
+        records = benchmark.run()
+        # The larger batch sizes are skipped after the first one
+        assert len(records) == 3
+
+    def test_compare(self):
+        problems = [otbenchmark.ReliabilityProblem8()]
+        benchmark = otbenchmark.ThroughputBenchmark(
+            problems, batchSizes=[1], minimumTime=0.01
+        )
+        benchmark.run()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "throughput.json")
+            benchmark.save(filename)
+            baseline = otbenchmark.ThroughputBenchmark.Load(filename)
+        assert baseline == benchmark.records
+        regressions = otbenchmark.ThroughputBenchmark.Compare(
+            benchmark.records, baseline, threshold=0.5
+        )
+        assert len(regressions) == 0
+        # A baseline ten times faster
+        for record in baseline:
+            if record["path"] == "Construction":
+                record["time"] /= 10.0
+            else:
+                record["evaluationsPerSecond"] *= 10.0
+        regressions = otbenchmark.ThroughputBenchmark.Compare(
+            benchmark.records, baseline, threshold=0.5
+        )
+        assert len(regressions) == 3
+        for regression in regressions:
+            assert regression["ratio"] < 0.2 or regression["ratio"] > 5.0
+
+
+if __name__ == "__main__":
+    unittest.main()